@@ -38,12 +38,14 @@ def parse_input():
                       help    = 'input file containing test-case definition')
   
   parser.add_argument('CFL',
-                      type = float,
-                      help = 'maximum Courant number in domain')
+                      type  = float,
+                      nargs = '?',
+                      help  = 'maximum Courant number in domain'+\
+                              ' (default: largest safe value for integrator)')
   
   parser.add_argument('-O','--weno_order',
                       type    = int,
-                      choices = [5,7],
+                      choices = [3,5,7,9,11],
                       default =  5,
                       help    = 'order of accuracy for WENO recontruction'+\
                                 ' (default: 5)')
@@ -59,25 +61,27 @@ def parse_input():
 (default: Z)''')
   
   parser.add_argument('-s','--time_integrator',
-                      type    = int,
-                      choices = range(11),
-                      default =  5,
+                      default = 'rk4',
                       dest    = 'stepper',
                       metavar = 'X',
                       help    = 
   '''choose integrator X for time-stepping:
-  0. FE      (forward-Euler)
-  1. RK2     (midpoint rule)
-  2. RK2-SSP (Heun's method)
-  3. RK3
-  4. RK3-SSP
-  5. RK4     (gold standard)
-  6. Fehlberg5 (from the 4-5 pair)
-  7. Taylor2 (Taylor's method, 2nd-order)
-  8. TD-RK3  (Two-derivative Runge-Kutta, 3rd-order)
-  9. TD-RK4  (Two-derivative Runge-Kutta, 4th-order)
- 10. TD-RK5  (Two-derivative Runge-Kutta, 5th-order)
-(default: 5)''')
+  fE              (forward-Euler)
+  rk2_midpoint    (RK2, midpoint rule)
+  rk2_Heun        (RK2-SSP, Heun's method)
+  rk3             (RK3)
+  rk3_ssp         (RK3-SSP)
+  rk4             (RK4, gold standard)
+  Fehlberg5       (from the 4-5 pair)
+  Taylor2         (Taylor's method, 2nd-order)
+  TD_RK3          (Two-derivative Runge-Kutta, 3rd-order)
+  TD_RK4          (Two-derivative Runge-Kutta, 4th-order)
+  TD_RK5          (Two-derivative Runge-Kutta, 5th-order)
+  rk3_ssp_inplace (RK3-SSP, in place, 1 register)
+  rk4_inplace     (RK4, in place, 2 registers)
+  ssp10_4         (SSP(10,4), Ketcheson's low-storage method, in place)
+X can also be given by its index in this list (e.g. 5 for rk4)
+(default: rk4)''')
   
   parser.add_argument('-r','--range',
                       type    = int,
@@ -113,13 +117,14 @@ def main():
   # Add directory to import path
   sys.path.insert( 0, os.path.curdir )
   
-  # Import input file as module, and create test-case object
-  test_case = __import__(file_name.rstrip('.py')).DefineTestCase()
-  
   # Import path to library
   try               :  import hyperpyws
   except ImportError:  import hyperpyws_path
   
+  # Import input file as module, and create test-case object
+  from hyperpyws.parallel import LoadTestCase
+  test_case = LoadTestCase( os.path.join( file_dir, file_name ) )
+  
   # Import modules from library
   from hyperpyws.output_utilities  import TextDB
   from hyperpyws.simulation        import Numerics, RunSimulation
@@ -133,8 +138,7 @@ def main():
   
   # Extract time-integrator function
   import hyperpyws.time_integrators as integrators
-  stepper_name = integrators.__all__[args.stepper]
-  stepper_func = getattr( integrators, stepper_name )
+  stepper_func = integrators.get_stepper( args.stepper )
   
   # Extract WENO reconstruction class
   weno_class = Weno( args.weno_order, args.weno_version )
@@ -41,6 +41,9 @@ def LoadData( *file_names ):
   data = []
   for fn in file_names:
     [mx, L1, L2, Li] = loadtxt( fn, unpack=True )
+    # Sort by number of cells (parallel runs write lines as they complete)
+    idx = mx.argsort()
+    [mx, L1, L2, Li] = [mx[idx], L1[idx], L2[idx], Li[idx]]
     record = OrderedDict()
     record['mx'] = mx.astype(int).tolist()
     record['L1'] = L1.tolist()
@@ -17,48 +17,44 @@
 try               :  import hyperpyws
 except ImportError:  import hyperpyws_path
 
+import numpy as np
+
 #===============================================================================
 # FUNCTION: Test-case setup
 #===============================================================================
 
+# Constant velocity
+v = 1.0
+
+# Initial conditions
+def q_init (x):
+  return [ np.sin( 2.0*np.pi*x ) ]
+
+# Exact solution
+def q_exact (x,t):
+  return q_init( x-v*t )
+
+#-------------------------------------------------------------------------------
+def DefineTestSpec ():
+  """ Declarative (picklable) definition of the test case: 1D constant
+      advection with smooth initial conditions (sine wave) and periodic BCs.
+  """
+  from hyperpyws.case_spec import TestCaseSpec
+  
+  return TestCaseSpec( model  = 'Advection1D',
+                       params = {'v': v},
+                       xlims  = [0.0, 1.0],
+                       tend   =  1.0,
+                       bcs    = 'periodic',
+                       qinit  = q_init,
+                       qexact = q_exact )
+
+#-------------------------------------------------------------------------------
 def DefineTestCase ():
   """ Test case definition: 1D constant advection with smooth initial conditions
       (sine wave) and periodic BCs.
   """
-  # Import external modules
-  import numpy as np
-  
-  # Import modules from library
-  from hyperpyws.model_equations.advection  import Advection1D
-  from hyperpyws.boundary                   import PeriodicBCs
-  from hyperpyws.simulation                 import TestCase
-  
-  # Constant velocity
-  v = 1.0
-  
-  # Initial conditions
-  def q_init (x):
-    return [ np.sin( 2.0*np.pi*x ) ]
-  
-  # Exact solution
-  def q_exact (x,t):
-    return q_init( x-v*t )
-  
-  # Periodic boundary conditions  <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<  (FIX ME)
-  def CreateBC_func (mx, mbc):
-    SetBCs = lambda q,t : PeriodicBCs(q,mx,mbc)
-    return SetBCs
-  
-  # Test-Case container
-  test          = TestCase()
-  test.ModelEqn = Advection1D(v)
-  test.xlims    = [0.0, 1.0]
-  test.tend     =  1.0
-  test.BCs      = CreateBC_func
-  test.qinit    = q_init
-  test.qexact   = q_exact
-    
-  return test
+  return DefineTestSpec().build()
 
 #===============================================================================
 # SCRIPT: Run as main program
@@ -0,0 +1,165 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Compare the component-wise reconstruction (split fluxes reconstructed in
+    conserved variables) with the default characteristic reconstruction, on
+    the Euler and shallow-water test cases.
+    
+    For each test case and number of cells, both modes are run with the same
+    WENO class, time integrator and CFL number; the wall time and the L1 and
+    L-inf errors are printed.  The errors are computed with respect to the
+    exact solution of the test case if available, or else with respect to a
+    reference solution (characteristic mode, REF_MX cells), as in the
+    work-precision benchmark.  Spurious oscillations of the component-wise
+    mode near shocks show up as a larger L-inf error.
+"""
+from __future__ import print_function
+
+# Default test cases, relative to the 'apps' directory
+CASES = ['euler/test_sine/euler_sine.py',
+         'euler/test_shock_tube/shock_tube.py',
+         'euler/test_shock_entropy/shock_entropy.py',
+         'shallow_water/dam_break.py']
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Cost and accuracy of component-wise vs characteristic'\
+                  ' reconstruction',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('cases',
+                      nargs   = '*',
+                      default = CASES,
+                      metavar = 'TEST',
+                      help    = 'input files containing test-case definition'+\
+                                ' (relative to apps directory, or absolute)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      choices = [3,5,7,9,11],
+                      default = 5,
+                      help    = 'order of WENO reconstruction')
+  
+  parser.add_argument('-w','--weno_version',
+                      choices = ['JS','Z','CFD'],
+                      default = 'Z',
+                      help    = 'WENO version')
+  
+  parser.add_argument('-s','--time_integrator',
+                      default = 'rk3_ssp',
+                      dest    = 'stepper',
+                      help    = 'name of time integrator')
+  
+  parser.add_argument('-C','--CFL',
+                      type    = float,
+                      default = None,
+                      help    = 'CFL number (default: safe CFL of integrator)')
+  
+  parser.add_argument('-m','--mx',
+                      type    = int,
+                      nargs   = '+',
+                      default = [100,200,400],
+                      help    = 'numbers of cells')
+  
+  parser.add_argument('-n','--repeat',
+                      type    = int,
+                      default = 1,
+                      help    = 'repetitions of each run (minimum time is kept)')
+  
+  parser.add_argument('-r','--ref_mx',
+                      type    = int,
+                      default = 3200,
+                      help    = 'cells of reference solution, if no qexact')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  import hyperpyws.time_integrators as integrators
+  from   hyperpyws.weno_versions    import Weno
+  from   work_precision             import load_test_case, timed_run, \
+                                           reference_solution, grid_errors
+  
+  weno    = Weno( args.weno_order, args.weno_version )
+  stepper = integrators.get_stepper( args.stepper )
+  
+  #-----------------------------------------------------------------------------
+  def run( test, mx, componentwise ):
+    """ Run simulation, return grid and minimum wall time. """
+    grid, stats, wt = timed_run( test, weno, stepper, args.CFL, mx,
+                                 args.repeat,
+                                 contiguous    = True,
+                                 componentwise = componentwise )
+    return grid, wt
+  
+  #-----------------------------------------------------------------------------
+  head = '{:>5s} {:>15s} {:>10s} {:>10s} {:>10s}'.format( 'mx', 'mode',
+          'time [s]', 'L1', 'Linf' )
+  
+  for case in args.cases:
+    
+    test  = load_test_case( case )
+    # Reference solution, if exact solution is not available
+    q_ref = reference_solution( case, test, args.ref_mx,
+                                lambda mx: run( test, mx, False )[0] )
+    
+    print('')
+    print( case )
+    print( head )
+    print( '-'*len( head ) )
+    for mx in args.mx:
+      times = []
+      for mode, componentwise in [('characteristic', False),
+                                  ('component-wise', True )]:
+        
+        grid, wt   = run( test, mx, componentwise )
+        L1, L2, Li = grid_errors( grid, q_ref )
+        times.append( wt )
+        
+        print('{:5d} {:>15s} {:10.3e} {:10.3e} {:10.3e}'\
+              .format( mx, mode, wt, L1, Li ))
+      
+      print('{:5d} {:>15s} {:10.2f}'.format( mx, 'speed-up', times[0]/times[1] ))
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
@@ -0,0 +1,174 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Benchmark of the MOL time derivative for 1D Euler's equations (smooth 
+    sine wave, periodic BCs), comparing the three storage modes:
+      
+      * object : array of objects (one array per component)
+      * block  : contiguous (meq,N) array, output copied at each call
+      * reuse  : contiguous (meq,N) array, output returned in reused buffer
+    
+    For each mode, the wall time per RHS evaluation and the number of scratch
+    arrays allocated by the MOL workspace in steady state (i.e. after the
+    first call) are printed.  The workspace count does not include the
+    temporary arrays created by the flux functions and by the WENO
+    reconstruction: hence, if the tracemalloc module is available (Python 3),
+    the peak memory allocated by one call is also measured, and printed in
+    units of the state size.  The summary is based on this peak, and the 
+    script exits with an error if it exceeds the given budget.
+"""
+from __future__ import print_function
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Time MOL.TimeDerivatives in different storage modes',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('mx',
+                      type = int,
+                      help = 'number of subdivisions along x axis')
+  
+  parser.add_argument('-n','--ncalls',
+                      type    = int,
+                      default = 20,
+                      help    = 'number of RHS evaluations per mode')
+  
+  parser.add_argument('-b','--budget',
+                      type    = float,
+                      help    = 'maximum peak memory allocated by one call, '
+                                'in units of the state size (requires '
+                                'tracemalloc)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      choices = [3,5,7,9,11],
+                      default =  5,
+                      help    = 'order of accuracy for WENO recontruction')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  import time
+  import numpy as np
+  
+  try               :  import tracemalloc
+  except ImportError:  tracemalloc = None
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  from hyperpyws.grid                  import Grid1D
+  from hyperpyws.mol                   import MOL
+  from hyperpyws.boundary              import PeriodicBCs
+  from hyperpyws.weno_versions         import Weno
+  from hyperpyws.model_equations.euler import Euler1D
+  
+  gamma = 1.4
+  flux  = Euler1D( gamma )
+  weno  = Weno( args.weno_order, 'Z' )
+  
+  # Initial conditions: density sine wave advected with constant velocity
+  def q_init (x):
+    rho = 1.0 + 0.5*np.sin(2.0*np.pi*x)
+    eng = 1.0/(gamma-1.0) + 0.5*rho
+    return [ rho, rho, eng ]
+  
+  modes = [ ('object', False, False),
+            ('block' , True , False),
+            ('reuse' , True , True ) ]
+  
+  head = '{:>8s} {:>14s} {:>14s} {:>14s} {:>12s}'.format( 'mode',
+          'time/call [s]', 'ws allocs', 'peak/call [KB]', 'peak/state' )
+  print( head )
+  print( '-'*len( head ) )
+  peaks = {}
+  for name, contiguous, reuse in modes:
+    
+    grid   = Grid1D( [0.0,1.0], args.mx, weno.mbc, flux.meq, contiguous )
+    SetBCs = lambda q,t : PeriodicBCs( q, args.mx, weno.mbc )
+    solver = MOL( grid, flux, weno, SetBCs, reuse )
+    grid.q = q_init( grid.x )
+    
+    # First call allocates all scratch arrays
+    solver.TimeDerivatives( grid.q, 0.0 )
+    n0 = solver.allocations
+    
+    t0 = time.time()
+    for i in range( args.ncalls ):
+      solver.TimeDerivatives( grid.q, 0.0 )
+    dt = (time.time()-t0) / args.ncalls
+    nalloc = solver.allocations-n0
+    
+    # Peak memory allocated by one call (all numpy temporaries included)
+    if tracemalloc is not None:
+      tracemalloc.start()
+      solver.TimeDerivatives( grid.q, 0.0 )
+      peak = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+      state = flux.meq * grid.x.size * grid.x.itemsize
+      peaks[name] = float( peak )/state
+      print('{:>8s} {:14.4e} {:14d} {:14.1f} {:12.1f}'.format( name, dt,
+            nalloc, peak/1024., float( peak )/state ))
+    else:
+      print('{:>8s} {:14.4e} {:14d} {:>14s} {:>12s}'.format( name, dt,
+            nalloc, 'n/a', 'n/a' ))
+  
+  # Summary from the measured peak: 'ws allocs' = 0 only means that the MOL
+  # workspace is reused, not that a call is free of temporary arrays
+  print('')
+  if tracemalloc is None:
+    print('Temporary arrays not measured (tracemalloc not available)')
+    if args.budget is not None:
+      raise SystemExit('Cannot check the budget without tracemalloc')
+    return
+  
+  worst = max( peaks, key=peaks.get )
+  print('Largest peak/call: {:.1f} states ({} mode)'.format( peaks[worst],
+        worst ))
+  if args.budget is not None:
+    over = [ name for name,_,_ in modes if peaks[name] > args.budget ]
+    if over:
+      raise SystemExit('Peak memory exceeds budget of {:.1f} states in mode'\
+                       '(s): {}'.format( args.budget, ', '.join( over ) ))
+    print('Within budget of {:.1f} states'.format( args.budget ))
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
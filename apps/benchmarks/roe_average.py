@@ -0,0 +1,169 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Cost and accuracy of the characteristic decomposition at Roe-averaged 
+    interface states, compared with the default arithmetic mean of the two 
+    neighboring cells, on the Euler and shallow-water Riemann problems.
+    
+    For each test case, CFL number and number of cells, both averages are run
+    with the same WENO class and time integrator; the wall time and the L1 and
+    L-inf errors are printed.  The errors are computed with respect to the
+    exact solution of the test case if available, or else with respect to a
+    reference solution (arithmetic mean, safe CFL, REF_MX cells), as in the
+    work-precision benchmark.  Runs that break down (e.g. negative pressure
+    at a CFL number beyond the stability limit) are reported as 'failed'.
+"""
+from __future__ import print_function
+
+# Default test cases, relative to the 'apps' directory
+CASES = ['euler/test_shock_tube/shock_tube.py',
+         'shallow_water/dam_break.py']
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Cost and accuracy of Roe vs arithmetic interface averages',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('cases',
+                      nargs   = '*',
+                      default = CASES,
+                      metavar = 'TEST',
+                      help    = 'input files containing test-case definition'+\
+                                ' (relative to apps directory, or absolute)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      choices = [3,5,7,9,11],
+                      default = 5,
+                      help    = 'order of WENO reconstruction')
+  
+  parser.add_argument('-w','--weno_version',
+                      choices = ['JS','Z','CFD'],
+                      default = 'Z',
+                      help    = 'WENO version')
+  
+  parser.add_argument('-s','--time_integrator',
+                      default = 'rk3_ssp',
+                      dest    = 'stepper',
+                      help    = 'name of time integrator')
+  
+  parser.add_argument('-C','--CFL',
+                      type    = float,
+                      nargs   = '+',
+                      default = [None],
+                      help    = 'CFL numbers (default: safe CFL of integrator)')
+  
+  parser.add_argument('-m','--mx',
+                      type    = int,
+                      nargs   = '+',
+                      default = [100,200,400],
+                      help    = 'numbers of cells')
+  
+  parser.add_argument('-n','--repeat',
+                      type    = int,
+                      default = 1,
+                      help    = 'repetitions of each run (minimum time kept)')
+  
+  parser.add_argument('-r','--ref_mx',
+                      type    = int,
+                      default = 3200,
+                      help    = 'cells of reference solution, if no qexact')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  import numpy as np
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  import hyperpyws.time_integrators as integrators
+  from   hyperpyws.weno_versions    import Weno
+  from   hyperpyws.mol              import MOL
+  from   work_precision             import load_test_case, timed_run, \
+                                           reference_solution, grid_errors
+  
+  weno    = Weno( args.weno_order, args.weno_version )
+  stepper = integrators.get_stepper( args.stepper )
+  
+  #-----------------------------------------------------------------------------
+  def run( test, mx, CFL, average ):
+    """ Run simulation, return grid and minimum wall time. """
+    grid, stats, wt = timed_run( test, weno, stepper, CFL, mx, args.repeat,
+                                 contiguous = True,
+                                 average    = average )
+    return grid, wt
+  
+  #-----------------------------------------------------------------------------
+  head = '{:>6s} {:>5s} {:>11s} {:>10s} {:>10s} {:>10s}'.format( 'CFL', 'mx',
+          'average', 'time [s]', 'L1', 'Linf' )
+  
+  for case in args.cases:
+    
+    test  = load_test_case( case )
+    # Reference solution, if exact solution is not available
+    q_ref = reference_solution( case, test, args.ref_mx, lambda mx:
+                                run( test, mx, None, 'arithmetic' )[0] )
+    
+    print('')
+    print( case )
+    print( head )
+    print( '-'*len( head ) )
+    for CFL in args.CFL:
+      for mx in args.mx:
+        for average in MOL.averages:
+          
+          with np.errstate( invalid='ignore', divide='ignore' ):
+            grid, wt = run( test, mx, CFL, average )
+          
+          line = '{:>6s} {:5d} {:>11s} {:10.3e}'.format( '{:.3g}'.format( CFL )
+                 if CFL else 'safe', mx, average, wt )
+          
+          if not all( np.all( np.isfinite( qi ) ) for qi in grid.qint ):
+            print( line, '{:>21s}'.format( 'failed' ) )
+            continue
+          
+          L1, L2, Li = grid_errors( grid, q_ref )
+          
+          print( line, '{:10.3e} {:10.3e}'.format( L1, Li ))
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
@@ -0,0 +1,179 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Convergence of the global, per-field and local Lax-Friedrichs flux
+    splittings (see MOL), on the Euler shock-entropy test case.
+    
+    For each splitting and number of cells, the wall time and the L1 and
+    L-inf errors are printed.  The errors are computed with respect to the
+    exact solution of the test case if available, or else with respect to a
+    reference solution (global splitting, REF_MX cells).  A power law
+    err = C*mx^(-p) is fitted to the L1 errors of each splitting; the fit is
+    used to estimate the number of cells that each splitting needs to reach
+    the same error as the global splitting, at each mx.
+"""
+from __future__ import print_function
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Convergence of global, per-field and local Lax-Friedrichs'\
+                  ' flux splittings',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('case',
+                      nargs   = '?',
+                      default = 'euler/test_shock_entropy/shock_entropy.py',
+                      metavar = 'TEST',
+                      help    = 'input file containing test-case definition'+\
+                                ' (relative to apps directory, or absolute)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      choices = [3,5,7,9,11],
+                      default = 5,
+                      help    = 'order of WENO reconstruction')
+  
+  parser.add_argument('-w','--weno_version',
+                      choices = ['JS','Z','CFD'],
+                      default = 'Z',
+                      help    = 'WENO version')
+  
+  parser.add_argument('-s','--time_integrator',
+                      default = 'rk3_ssp',
+                      dest    = 'stepper',
+                      help    = 'name of time integrator')
+  
+  parser.add_argument('-C','--CFL',
+                      type    = float,
+                      default = None,
+                      help    = 'CFL number (default: safe CFL of integrator)')
+  
+  parser.add_argument('-m','--mx',
+                      type    = int,
+                      nargs   = '+',
+                      default = [200,400,800],
+                      help    = 'numbers of cells')
+  
+  parser.add_argument('-r','--ref_mx',
+                      type    = int,
+                      default = 3200,
+                      help    = 'cells of reference solution, if no qexact')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  import numpy as np
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  import hyperpyws.time_integrators as integrators
+  from   hyperpyws.weno_versions    import Weno
+  from   hyperpyws.mol              import MOL
+  from   work_precision             import load_test_case, timed_run, \
+                                           reference_solution, grid_errors
+  
+  weno    = Weno( args.weno_order, args.weno_version )
+  stepper = integrators.get_stepper( args.stepper )
+  
+  #-----------------------------------------------------------------------------
+  def run( test, mx, splitting ):
+    """ Run simulation, return grid and wall time. """
+    grid, stats, wt = timed_run( test, weno, stepper, args.CFL, mx,
+                                 contiguous = True,
+                                 splitting  = splitting )
+    return grid, wt
+  
+  #-----------------------------------------------------------------------------
+  case  = args.case
+  test  = load_test_case( case )
+  # Reference solution, if exact solution is not available
+  q_ref = reference_solution( case, test, args.ref_mx,
+                              lambda mx: run( test, mx, 'global' )[0] )
+  
+  head = '{:>5s} {:>8s} {:>10s} {:>10s} {:>10s}'.format( 'mx', 'split.',
+          'time [s]', 'L1', 'Linf' )
+  print('')
+  print( case )
+  print( head )
+  print( '-'*len( head ) )
+  
+  errors = dict( (s,[]) for s in MOL.splittings )
+  for mx in args.mx:
+    for splitting in MOL.splittings:
+      
+      grid, wt   = run( test, mx, splitting )
+      L1, L2, Li = grid_errors( grid, q_ref )
+      errors[splitting].append( L1 )
+      
+      print('{:5d} {:>8s} {:10.3e} {:10.3e} {:10.3e}'\
+            .format( mx, splitting, wt, L1, Li ))
+  
+  # Power-law fit of L1 errors: log(err) = a - p*log(mx)
+  if len( args.mx ) < 2:
+    return
+  
+  fit = {}
+  for s in MOL.splittings:
+    b, a   = np.polyfit( np.log( args.mx ), np.log( errors[s] ), 1 )
+    fit[s] = (a, b)
+  
+  # Cells needed by each splitting to reach the L1 error of global splitting
+  print('')
+  print('Cells for same L1 error as global splitting (power-law fit)')
+  head = '{:>5s} {:>10s}'.format( 'mx', 'L1' ) + \
+         ''.join( ' {:>14s}'.format( s ) for s in MOL.splittings )
+  print( head )
+  print( '-'*len( head ) )
+  for mx, err in zip( args.mx, errors['global'] ):
+    line = '{:5d} {:10.3e}'.format( mx, err )
+    for s in MOL.splittings:
+      a, b  = fit[s]
+      mx_eq = np.exp( (np.log( err ) - a) / b )
+      line += ' {:7.0f} ({:3.0f}%)'.format( mx_eq, 100.*mx_eq/mx )
+    print( line )
+  
+  print('')
+  print('Observed order of convergence (L1): ' +
+        ', '.join( '{} {:.2f}'.format( s, -fit[s][1] ) for s in MOL.splittings ))
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
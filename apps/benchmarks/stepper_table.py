@@ -0,0 +1,105 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Print the registry of time integrators: order, stages, derivatives, SSP
+    coefficient, maximum stable CFL number for the linear schemes of the given
+    WENO orders (as declared, and recomputed with max_stable_CFL), safety
+    factor, and cost per unit simulated time, i.e. RHS evaluations (stages x
+    steps) per unit of dx/v_max when running at the safe CFL number.
+"""
+from __future__ import print_function
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Print properties of registered time integrators',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('-n','--ntheta',
+                      type    = int,
+                      default = 720,
+                      help    = 'number of Fourier modes for stability limit')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      nargs   = '+',
+                      choices = [3,5,7,9,11],
+                      default = [5,7],
+                      help    = 'orders of WENO reconstruction')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  import hyperpyws.time_integrators as integrators
+  from   hyperpyws.weno_versions    import Weno
+  
+  orders = args.weno_order
+  linear = dict( (p, Weno( p, 'CFD', backend='numpy' )) for p in orders )
+  
+  head = '{:16s} {:>5s} {:>6s} {:>6s} {:>5s} {:>6s}'.format(
+          'name', 'order', 'stages', 'nderiv', 'ssp', 'safety' )
+  for p in orders:
+    head += ' {:>7s} {:>7s} {:>7s}'.format(
+          'CFL{:d}'.format(p), '(num.)', 'cost{:d}'.format(p) )
+  print( head )
+  
+  for name in integrators.__all__:
+    
+    stepper = integrators.get_stepper( name )
+    info    = stepper.info
+    
+    line = '{:16s} {:5d} {:6d} {:6d} {:5.1f} {:6.2f}'.format(
+            name, info.order, info.stages, info.nderiv, info.ssp, info.safety )
+    
+    for p in orders:
+      cfl_num = integrators.max_stable_CFL( stepper, linear[p], args.ntheta )
+      if info.cfl[p] > 0.0:
+        cost = '{:7.2f}'.format( info.cost( p ) )
+      else:
+        cost = '{:>7s}'.format( '--' )
+      line += ' {:7.3f} {:7.3f} {:s}'.format( info.cfl[p], cfl_num, cost )
+    
+    print( line )
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
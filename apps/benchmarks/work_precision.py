@@ -0,0 +1,397 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Work-precision benchmark: run each test case over all combinations of WENO
+    class (order x version), time integrator, CFL number and number of cells,
+    and record wall time, number of RHS evaluations and L1/L2/L-inf errors.
+    
+    The error is computed at the cell centers, for each component of the state
+    vector, with respect to the exact solution 'qexact' of the test case; test
+    cases without an exact solution (e.g. the shock tube) are compared with a
+    reference solution, computed on a finer grid (REF_MX cells, WENO5-Z and
+    RK3-SSP at the safe CFL number) and linearly interpolated.  The norms are
+    absolute, and the maximum over all components is reported.
+    
+    The results are printed as work-precision tables (one per test case, sorted
+    by wall time) and saved to a JSON file.  Optionally, the cheapest runs that
+    meet an accuracy target are shown, and the results are compared with those
+    of a previous JSON file in order to detect performance regressions.
+"""
+from __future__ import print_function
+
+# Default test cases, relative to the 'apps' directory
+CASES = ['advection/test_sine/advection_sine.py',
+         'advection/test_square/advection_square.py',
+         'euler/test_sine/euler_sine.py',
+         'euler/test_shock_tube/shock_tube.py',
+         'buckley_leverett/buckley_leverett.py']
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Work-precision benchmark over WENO classes, time '\
+                  'integrators, CFL numbers and resolutions',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('cases',
+                      nargs   = '*',
+                      default = CASES,
+                      metavar = 'TEST',
+                      help    = 'input files containing test-case definition'+\
+                                ' (relative to apps directory, or absolute)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      nargs   = '+',
+                      choices = [3,5,7,9,11],
+                      default = [5,7],
+                      help    = 'orders of WENO reconstruction')
+  
+  parser.add_argument('-w','--weno_version',
+                      nargs   = '+',
+                      choices = ['JS','Z','CFD'],
+                      default = ['JS','Z'],
+                      help    = 'WENO versions')
+  
+  parser.add_argument('-s','--time_integrator',
+                      nargs   = '+',
+                      default = ['rk3_ssp','rk4','TD_RK4','ssp10_4'],
+                      dest    = 'stepper',
+                      help    = 'names (or indices) of registered integrators')
+  
+  parser.add_argument('-C','--CFL',
+                      nargs   = '+',
+                      default = ['auto'],
+                      help    = "CFL numbers ('auto' = safe CFL of integrator)")
+  
+  parser.add_argument('-m','--mx',
+                      type    = int,
+                      nargs   = '+',
+                      default = [50,100,200,400],
+                      help    = 'numbers of cells')
+  
+  parser.add_argument('-c','--contiguous',
+                      action  = 'store_true',
+                      help    = 'store solution as a single contiguous array')
+  
+  parser.add_argument('-n','--repeat',
+                      type    = int,
+                      default = 1,
+                      help    = 'repetitions of each run (minimum time is kept)')
+  
+  parser.add_argument('-r','--ref_mx',
+                      type    = int,
+                      default = 3200,
+                      help    = 'cells of reference solution, if no qexact')
+  
+  parser.add_argument('-a','--target',
+                      type    = float,
+                      default = None,
+                      help    = 'L2 accuracy target: print cheapest runs')
+  
+  parser.add_argument('-o','--output',
+                      default = 'work_precision.json',
+                      help    = 'output JSON file')
+  
+  parser.add_argument('--compare',
+                      default = None,
+                      metavar = 'JSON',
+                      help    = 'compare wall times with previous JSON file')
+  
+  parser.add_argument('--slowdown',
+                      type    = float,
+                      default = 1.2,
+                      help    = 'time ratio that flags a regression')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTIONS: test cases, runs and error norms (also used by other benchmarks)
+#===============================================================================
+
+def load_test_case( case ):
+  """
+  Import input file by path (relative to apps directory, or absolute), and
+  return test-case object.  Input files with the same name in different
+  directories are distinct modules (see hyperpyws.parallel.LoadTestCase).
+  
+  """
+  import os
+  from hyperpyws.parallel import LoadTestCase
+  
+  apps_dir = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+  path     = case if os.path.isabs( case ) else os.path.join( apps_dir, case )
+  return LoadTestCase( path )
+
+#-------------------------------------------------------------------------------
+def timed_run( test, weno, stepper, CFL, mx, repeat=1, **options ):
+  """
+  Run simulation 'repeat' times, and return grid, statistics and minimum wall
+  time.  Further attributes of the Numerics object (e.g. contiguous=True) are
+  given as keyword arguments.
+  
+  """
+  import timeit
+  from hyperpyws.simulation import Numerics, RunSimulation
+  
+  numr         = Numerics()
+  numr.weno    = weno
+  numr.stepper = stepper
+  numr.CFL     = CFL
+  numr.mx      = mx
+  for key, value in options.items():
+    setattr( numr, key, value )
+  
+  wall = []
+  for i in range( repeat ):
+    stats = {}
+    t0    = timeit.default_timer()
+    grid  = RunSimulation( test, numr, stats=stats )
+    wall.append( timeit.default_timer() - t0 )
+  
+  return grid, stats, min( wall )
+
+#-------------------------------------------------------------------------------
+def reference_solution( case, test, ref_mx, run ):
+  """
+  Return function q_ref(x) giving the solution at final time: the exact
+  solution of the test case if available, or else the linear interpolation
+  of a reference solution on ref_mx cells, whose grid is returned by run(mx).
+  
+  """
+  import numpy as np
+  
+  if test.qexact is not None:
+    return lambda x: test.qexact( x, test.tend )
+  
+  print('{}: computing reference solution with mx = {:d}'\
+        .format( case, ref_mx ))
+  ref   = run( ref_mx )
+  ref_x = ref.xint
+  ref_q = [np.array( qi ) for qi in ref.qint]
+  
+  return lambda x: [np.interp( x, ref_x, ri ) for ri in ref_q]
+
+#-------------------------------------------------------------------------------
+def error_norms( q, q_ref, dx ):
+  """
+  Return absolute L1, L2 and L-inf norms of the error q-q_ref, maximized over
+  all components of the state vector.
+  
+  """
+  import numpy as np
+  
+  L1 = L2 = Li = 0.0
+  for qi, ri in zip( q, q_ref ):
+    err = np.asarray( qi ) - np.asarray( ri )
+    L1  = max( L1, np.sum ( abs(err) ) * dx )
+    L2  = max( L2, np.sqrt( np.sum( err**2 ) * dx ) )
+    Li  = max( Li, np.amax( abs(err) ) )
+  
+  return L1, L2, Li
+
+#-------------------------------------------------------------------------------
+def grid_errors( grid, q_ref ):
+  """ Return L1, L2 and L-inf errors of the solution on grid, with respect to
+      the function q_ref(x) (see reference_solution).
+  """
+  return error_norms( grid.qint, q_ref( grid.xint ), grid.dx )
+
+#===============================================================================
+# FUNCTIONS: output
+#===============================================================================
+
+def print_table( case, runs ):
+  """ Print work-precision table of given test case, sorted by wall time. """
+  
+  head = '{:8s} {:>15s} {:>6s} {:>5s} {:>6s} {:>6s} {:>10s} {:>10s} '\
+         '{:>10s} {:>10s}'.format( 'weno', 'stepper', 'CFL', 'mx', 'steps',
+                                   'nrhs', 'time [s]', 'L1', 'L2', 'Linf' )
+  
+  print('')
+  print( case )
+  print( head )
+  print( '-'*len( head ) )
+  for r in sorted( runs, key = lambda r: r['time'] ):
+    print('{:8s} {:>15s} {:6.3f} {:5d} {:6d} {:6d} {:10.3e} {:10.3e} {:10.3e} '\
+          '{:10.3e}'.format( r['weno'], r['stepper'], r['CFL_used'], r['mx'],
+                             r['steps'], r['nrhs'], r['time'],
+                             r['L1'], r['L2'], r['Linf'] ))
+
+#-------------------------------------------------------------------------------
+def print_cheapest( case, runs, target ):
+  """ Print cheapest run (in wall time and in RHS evaluations) with L2<target.
+  """
+  ok = [r for r in runs if r['L2'] <= target]
+  
+  print('')
+  if len( ok ) == 0:
+    print('{}: no run meets L2 <= {:.3e}'.format( case, target ))
+    return
+  
+  for key in ['time','nrhs']:
+    r = min( ok, key = lambda r: r[key] )
+    print('{}: cheapest in {:4s} with L2 <= {:.3e}: {} {} CFL={:.3f} mx={:d} '\
+          '(time = {:.3e} s, nrhs = {:d}, L2 = {:.3e})'.format( case, key,
+           target, r['weno'], r['stepper'], r['CFL_used'], r['mx'], r['time'],
+           r['nrhs'], r['L2'] ))
+
+#-------------------------------------------------------------------------------
+def compare_runs( old_runs, new_runs, slowdown ):
+  """ Print wall-time ratio new/old for all matching runs, and flag slowdowns.
+  """
+  def key( r ):
+    return (r['case'], r['weno'], r['stepper'], str( r['CFL'] ), r['mx'])
+  
+  old = dict( (key( r ), r) for r in old_runs )
+  
+  print('')
+  print('Comparison with previous results (ratio = new/old)')
+  nreg = 0
+  for r in new_runs:
+    o = old.get( key( r ) )
+    if o is None:
+      continue
+    ratio = r['time'] / o['time']
+    flag  = ''
+    if ratio > slowdown:
+      flag  = '  <-- SLOWER'
+      nreg += 1
+    print('{:40s} {:8s} {:>15s} {:>5s} {:5d}  time {:6.2f}  L2 {:6.2f}{}'\
+          .format( r['case'][-40:], r['weno'], r['stepper'], str( r['CFL'] ),
+                   r['mx'], ratio, r['L2'] / max( o['L2'], 1.0e-300 ), flag ))
+  
+  print('{:d} runs slower by more than a factor {:.2f}'.format( nreg, slowdown ))
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  import json, platform
+  import numpy as np
+  
+  # Import modules from library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  import hyperpyws.time_integrators as integrators
+  from   hyperpyws.weno_versions    import Weno
+  
+  # Check integrator names before running anything
+  steppers = [integrators.get_stepper( name ) for name in args.stepper]
+  
+  # CFL numbers: None means safe CFL of integrator
+  CFLs = [None if c == 'auto' else float( c ) for c in args.CFL]
+  
+  #-----------------------------------------------------------------------------
+  runs = []
+  for case in args.cases:
+    
+    test = load_test_case( case )
+    
+    # Reference solution (WENO5-Z, RK3-SSP, safe CFL), if no exact solution
+    def run_ref( mx ):
+      return timed_run( test, Weno( 5, 'Z' ), integrators.rk3_ssp, None, mx,
+                        contiguous = args.contiguous )[0]
+    
+    q_ref = reference_solution( case, test, args.ref_mx, run_ref )
+    
+    case_runs = []
+    for order in args.weno_order:
+      for version in args.weno_version:
+        weno = Weno( order, version )
+        for stepper in steppers:
+          for CFL in CFLs:
+            for mx in args.mx:
+              
+              grid, stats, wt = timed_run( test, weno, stepper, CFL, mx,
+                                           args.repeat,
+                                           contiguous = args.contiguous )
+              
+              L1, L2, Li = grid_errors( grid, q_ref )
+              
+              r = dict( case     = case,
+                        weno     = '{:d}{:s}'.format( order, version ),
+                        stepper  = stepper.__name__,
+                        CFL      = 'auto' if CFL is None else CFL,
+                        CFL_used = stats['CFL'],
+                        mx       = mx,
+                        steps    = stats['steps'],
+                        nrhs     = stats['nrhs'],
+                        time     = wt,
+                        L1       = float( L1 ),
+                        L2       = float( L2 ),
+                        Linf     = float( Li ),
+                        exact    = test.qexact is not None )
+              case_runs.append( r )
+              
+              print('{} {} {} CFL={:.3f} mx={:d}: time = {:.3e} s, '\
+                    'L2 = {:.3e}'.format( case, r['weno'], r['stepper'],
+                                          r['CFL_used'], mx, wt, L2 ))
+    
+    runs.extend( case_runs )
+  
+  #-----------------------------------------------------------------------------
+  # Work-precision tables
+  for case in args.cases:
+    print_table( case, [r for r in runs if r['case'] == case] )
+  
+  # Cheapest configuration that meets accuracy target
+  if args.target is not None:
+    for case in args.cases:
+      print_cheapest( case, [r for r in runs if r['case'] == case], args.target )
+  
+  # Machine-readable output
+  meta = dict( python     = platform.python_version(),
+               numpy      = np.__version__,
+               machine    = platform.machine(),
+               node       = platform.node(),
+               ref_mx     = args.ref_mx,
+               repeat     = args.repeat,
+               contiguous = args.contiguous )
+  with open( args.output, 'w' ) as f:
+    json.dump( dict( meta = meta, runs = runs ), f, indent = 1 )
+  print('')
+  print('Results saved to {}'.format( args.output ))
+  
+  # Performance regressions
+  if args.compare is not None:
+    with open( args.compare ) as f:
+      old = json.load( f )
+    compare_runs( old['runs'], runs, args.slowdown )
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
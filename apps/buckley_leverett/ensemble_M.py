@@ -0,0 +1,161 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Run the Buckley-Leverett test case (square-wave ICs, outflow BCs) for many
+    values of the free parameter M at once: all members of the ensemble share
+    a single (K,1,N) state array, and are advanced by the same MOL evaluations.
+    Optionally, run the same simulations one by one and compare the results
+    (identical up to round-off, unless the --common_dt option is used).
+"""
+from __future__ import print_function
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Run ensemble of Buckley-Leverett simulations (varying M)',
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter
+      )
+  
+  parser.add_argument('-M','--values',
+                      type    = float,
+                      nargs   = 3,
+                      default = [0.1,2.0,32],
+                      metavar = ('MIN','MAX','K'),
+                      help    = 'range and number of values of M')
+  
+  parser.add_argument('-m','--mx',
+                      type    = int,
+                      default = 200,
+                      help    = 'number of cells')
+  
+  parser.add_argument('-s','--time_integrator',
+                      default = 'rk3_ssp_inplace',
+                      dest    = 'stepper',
+                      help    = 'name of time integrator')
+  
+  parser.add_argument('--CFL',
+                      type    = float,
+                      default = None,
+                      help    = 'CFL number (default: safe value)')
+  
+  parser.add_argument('--common_dt',
+                      action  = 'store_true',
+                      help    = 'use the same (minimum) time-step for all M')
+  
+  parser.add_argument('--compare',
+                      action  = 'store_true',
+                      help    = 'also run each simulation separately')
+  
+  parser.add_argument('--plot',
+                      action  = 'store_true',
+                      help    = 'plot final solutions')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  import time, numpy as np
+  
+  # Import path to library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  # Import modules from library
+  from buckley_leverett  import DefineTestCase
+  from hyperpyws.model_equations.buckley_leverett  import BuckleyLeverett1D
+  from hyperpyws.simulation        import Numerics, RunSimulation
+  from hyperpyws.weno_versions     import Weno
+  from hyperpyws.time_integrators  import get_stepper
+  
+  # Values of free parameter
+  M_list = np.linspace( args.values[0], args.values[1], int(args.values[2]) )
+  K      = len( M_list )
+  
+  # Ensemble: same initial conditions for all members
+  test          = DefineTestCase()
+  q_init        = test.qinit
+  test.ModelEqn = BuckleyLeverett1D( M_list )
+  test.qinit    = lambda x: [q_init( x )] * K
+  test.members  = K
+  
+  # Numerical parameters
+  numr            = Numerics()
+  numr.weno       = Weno( 5, 'Z' )
+  numr.stepper    = get_stepper( args.stepper )
+  numr.CFL        = args.CFL
+  numr.mx         = args.mx
+  numr.contiguous = True
+  numr.common_dt  = args.common_dt
+  print( numr )
+  print('')
+  
+  #-----------------------------------------------------------------------------
+  stats = {}
+  t0    = time.time()
+  grid  = RunSimulation( test, numr, stats=stats )
+  wall  = time.time() - t0
+  print('Ensemble of {:d} members: {:d} time-steps, {:.2f} s'\
+        .format( K, stats['steps'], wall ))
+  
+  # Run each member separately (same numerical parameters)
+  if args.compare:
+    single = DefineTestCase()
+    
+    err = []
+    t0  = time.time()
+    for k,M in enumerate( M_list ):
+      single.ModelEqn = BuckleyLeverett1D( M )
+      qk = RunSimulation( single, numr ).qint
+      err.append( np.amax( abs( qk - grid.qint[k] ) ) )
+    wall = time.time() - t0
+    print('Separate runs: {:.2f} s; max. difference = {:.2e}'\
+          .format( wall, max( err ) ))
+  
+  # Plot final solutions
+  if args.plot:
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots()
+    for M,qk in zip( M_list, grid.qint ):
+      ax.plot( grid.xint, qk[0], label='M = {:.3g}'.format( M ) )
+    ax.set_xlabel('x')
+    ax.set_ylabel('q')
+    if K <= 10:
+      ax.legend()
+    plt.show()
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
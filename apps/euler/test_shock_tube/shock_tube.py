@@ -17,58 +17,52 @@
 try               :  import hyperpyws
 except ImportError:  import hyperpyws_path
 
+import numpy as np
+
 #===============================================================================
 # FUNCTION: Test-case setup
 #===============================================================================
 
-def DefineTestCase ():
-  """ Test case definition: shock-tube (SOD) for 1D Euler's equations with 
-      outflow boundary conditions.
-  """
-  # Import external modules
-  import numpy as np
-  
-  # Import modules from library
-  from hyperpyws.model_equations.euler  import Euler1D
-  from hyperpyws.boundary               import OutflowBC_left, OutflowBC_right
-  from hyperpyws.simulation             import TestCase
+# Ratio of specific heats
+gamma = 1.4
+
+# Initial conditions
+def q_init (x):
   
-  # Ratio of specific heats
-  gamma = 1.4
+  rho =  10.0*np.ones (x.shape)
+  u1  =       np.zeros(x.shape)
+  p   = 100.0*np.ones (x.shape)
   
-  # Initial conditions
-  def q_init (x):
-    
-    rho =  10.0*np.ones (x.shape)
-    u1  =       np.zeros(x.shape)
-    p   = 100.0*np.ones (x.shape)
-    
-    for i,xi in enumerate(x):
-      if xi > 2.0:
-        rho[i] = p[i] = 1.0
-    
-    eng  = p/(gamma-1.0) + 0.5*rho*u1**2
-    q    = np.empty( 3, dtype=object )
-    q[:] = [ rho, rho*u1, eng ]
-    
-    return q
+  for i,xi in enumerate(x):
+    if xi > 2.0:
+      rho[i] = p[i] = 1.0
   
-  # Boundary conditions  <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<  (FIX ME)
-  def CreateBC_func (mx, mbc):
-    def SetBCs(q,t):
-      OutflowBC_left (q,mx,mbc)
-      OutflowBC_right(q,mx,mbc)
-    return SetBCs
+  eng  = p/(gamma-1.0) + 0.5*rho*u1**2
+  q    = np.empty( 3, dtype=object )
+  q[:] = [ rho, rho*u1, eng ]
   
-  # Test-Case container
-  test          = TestCase()
-  test.ModelEqn = Euler1D( gamma )
-  test.xlims    = [0.0, 5.0]
-  test.tend     =  0.4
-  test.BCs      = CreateBC_func
-  test.qinit    = q_init
+  return q
+
+#-------------------------------------------------------------------------------
+def DefineTestSpec ():
+  """ Declarative (picklable) definition of the test case: shock-tube (SOD) for
+      1D Euler's equations with outflow boundary conditions.
+  """
+  from hyperpyws.case_spec import TestCaseSpec
   
-  return test
+  return TestCaseSpec( model  = 'Euler1D',
+                       params = {'gamma': gamma},
+                       xlims  = [0.0, 5.0],
+                       tend   =  0.4,
+                       bcs    = 'outflow',
+                       qinit  = q_init )
+
+#-------------------------------------------------------------------------------
+def DefineTestCase ():
+  """ Test case definition: shock-tube (SOD) for 1D Euler's equations with 
+      outflow boundary conditions.
+  """
+  return DefineTestSpec().build()
 
 #===============================================================================
 # SCRIPT: Run as main program
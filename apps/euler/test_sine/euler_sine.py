@@ -17,57 +17,53 @@
 try               :  import hyperpyws
 except ImportError:  import hyperpyws_path
 
+import numpy as np
+
 #===============================================================================
 # FUNCTION: Test-case setup
 #===============================================================================
 
-def DefineTestCase ():
-  """ Test case definition: 1D Euler's equations with smooth initial conditions 
-      (sine wave) and periodic boundary conditions.
-  """
-  # Import external modules
-  import numpy as np
-  
-  # Import modules from library
-  from hyperpyws.model_equations.euler  import Euler1D
-  from hyperpyws.boundary               import PeriodicBCs
-  from hyperpyws.simulation             import TestCase
-  
-  # Ratio of specific heats
-  gamma = 1.4
+# Ratio of specific heats
+gamma = 1.4
+
+# Initial conditions
+def q_init (x):
   
-  # Initial conditions
-  def q_init (x):
-    
-    rho = 1.0 + 0.5*np.sin(2.0*np.pi*x)
-    u1  = np.ones(x.shape)
-    p   = np.ones(x.shape)
-    
-    eng  = p/(gamma-1.0) + 0.5*rho*u1**2
-    q    = np.empty( 3, dtype=object )
-    q[:] = [ rho, rho*u1, eng ]
-    
-    return q
+  rho = 1.0 + 0.5*np.sin(2.0*np.pi*x)
+  u1  = np.ones(x.shape)
+  p   = np.ones(x.shape)
   
-  # Exact solution
-  def q_exact (x,t):
-    return q_init( x-t )
+  eng  = p/(gamma-1.0) + 0.5*rho*u1**2
+  q    = np.empty( 3, dtype=object )
+  q[:] = [ rho, rho*u1, eng ]
   
-  # Periodic boundary conditions  <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<  (FIX ME)
-  def CreateBC_func (mx, mbc):
-    SetBCs = lambda q,t : PeriodicBCs(q,mx,mbc)
-    return SetBCs
+  return q
 
-  # Test-Case container
-  test          = TestCase()
-  test.ModelEqn = Euler1D( gamma )
-  test.xlims    = [0.0, 1.0]
-  test.tend     =  1.0
-  test.BCs      = CreateBC_func
-  test.qinit    = q_init
-  test.qexact   = q_exact
+# Exact solution
+def q_exact (x,t):
+  return q_init( x-t )
+
+#-------------------------------------------------------------------------------
+def DefineTestSpec ():
+  """ Declarative (picklable) definition of the test case: 1D Euler's equations
+      with smooth initial conditions (sine wave) and periodic BCs.
+  """
+  from hyperpyws.case_spec import TestCaseSpec
   
-  return test
+  return TestCaseSpec( model  = 'Euler1D',
+                       params = {'gamma': gamma},
+                       xlims  = [0.0, 1.0],
+                       tend   =  1.0,
+                       bcs    = 'periodic',
+                       qinit  = q_init,
+                       qexact = q_exact )
+
+#-------------------------------------------------------------------------------
+def DefineTestCase ():
+  """ Test case definition: 1D Euler's equations with smooth initial conditions 
+      (sine wave) and periodic boundary conditions.
+  """
+  return DefineTestSpec().build()
 
 #===============================================================================
 # SCRIPT: Run as main program
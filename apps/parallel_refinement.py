@@ -0,0 +1,203 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+""" Parallel version of the batch_refinement drivers: run a test case with an
+    increasing number of cells, for one or more WENO versions and time
+    integrators, in a pool of worker processes.  The largest simulations are
+    started first, and the memory estimated for the running simulations is kept
+    below a given budget.  The errors are appended to the error files (one per
+    variant and component of the solution) as soon as each run is completed:
+    lines are therefore not ordered by number of cells.
+"""
+from __future__ import print_function
+
+#===============================================================================
+# FUNCTION: Parse input arguments
+#===============================================================================
+
+def parse_input():
+  
+  import argparse, sys
+  
+  parser = argparse.ArgumentParser (
+      prog='python '+sys.argv[0],
+      description='Run 1D simulations with increasing number of cells, '\
+                  'in parallel',
+      formatter_class=argparse.RawTextHelpFormatter
+      )
+  
+  parser.add_argument('input_file',
+                      metavar = 'TEST',
+                      help    = 'input file containing test-case definition')
+  
+  parser.add_argument('CFL',
+                      type  = float,
+                      nargs = '?',
+                      help  = 'maximum Courant number in domain'+\
+                              ' (default: largest safe value for integrator)')
+  
+  parser.add_argument('-O','--weno_order',
+                      type    = int,
+                      nargs   = '+',
+                      choices = [3,5,7,9,11],
+                      default = [5],
+                      help    = 'orders of accuracy for WENO recontruction'+\
+                                ' (default: 5)')
+  
+  parser.add_argument('-w','--weno_version',
+                      nargs   = '+',
+                      choices = ['JS','Z','CFD'],
+                      default = ['Z'],
+                      help    =
+  '''choose WENO versions:
+  JS  = WENO-JS (Jiang-Shu's algorithm)
+  Z   = WENO-Z  (Borges-Carmona-Costa-Don's algorithm)
+  CFD = central finite difference (uses WENO linear weights)
+(default: Z)''')
+  
+  parser.add_argument('-s','--time_integrator',
+                      nargs   = '+',
+                      default = ['rk4'],
+                      dest    = 'stepper',
+                      metavar = 'X',
+                      help    = 'names (or indices) of time integrators'+\
+                                ' (default: rk4)')
+  
+  parser.add_argument('-r','--range',
+                      type    = int,
+                      nargs   = 3,
+                      default = [50,3200,7],
+                      metavar = ('MIN','MAX','NPTS'),
+                      help    = 'number of cells (default: [50,3200,7])')
+  
+  parser.add_argument('-j','--nproc',
+                      type    = int,
+                      default = None,
+                      metavar = 'N',
+                      help    = 'number of worker processes'+\
+                                ' (default: number of CPUs)')
+  
+  parser.add_argument('-M','--memory',
+                      type    = float,
+                      default = None,
+                      metavar = 'MB',
+                      help    = 'memory budget for running simulations [MB]'+\
+                                ' (default: no limit)')
+  
+  parser.add_argument('-c','--contiguous',
+                      action  = 'store_true',
+                      help    = 'store solution as a single contiguous array'+\
+                                ' (default: array of objects)')
+  
+  return parser.parse_args()
+
+#===============================================================================
+# FUNCTION: Main script
+#===============================================================================
+
+def main():
+  
+  # Parse input arguments
+  args = parse_input()
+  print(args)
+  print('')
+  
+  #-----------------------------------------------------------------------------
+  import os, sys, time, numpy as np
+  
+  # Import path to library
+  try               :  import hyperpyws
+  except ImportError:  import hyperpyws_path
+  
+  # Import modules from library
+  from hyperpyws.output_utilities  import TextDB
+  from hyperpyws.parallel          import RefinementJob, LoadTestCase, RunJobs
+  from hyperpyws.time_integrators  import get_stepper
+  
+  # Check time integrators, and convert indices to names
+  args.stepper = [get_stepper( name ).__name__ for name in args.stepper]
+  
+  # Test case: number of equations, and check that exact solution is available
+  path = os.path.abspath( args.input_file )
+  test = LoadTestCase( path )
+  meq  = test.ModelEqn.meq
+  if test.qexact is None:
+    sys.exit('Error: test case has no exact solution')
+  
+  # Construct array with number of subdivisions
+  logN1   = np.log10(args.range[0])
+  logN2   = np.log10(args.range[1])
+  npts    = args.range[2]
+  Nx_list = np.logspace(logN1,logN2,npts).round().astype(int).tolist()
+  
+  # List of jobs: all resolutions for all numerical variants
+  jobs = [RefinementJob( path, order, version, stepper, args.CFL, Nx, meq,
+                         args.contiguous )
+          for order   in args.weno_order
+          for version in args.weno_version
+          for stepper in args.stepper
+          for Nx      in Nx_list]
+  
+  tags = sorted( set( job.tag for job in jobs ) )
+  
+  # Create files with final error in solution, in test-case directory:
+  # one for each numerical variant (if more than one) and each component
+  os.chdir( os.path.dirname( path ) )
+  
+  ostreams = {}
+  for tag in tags:
+    ostreams[tag] = []
+    for i in range( meq ):
+      name = 'error'
+      if len( tags ) > 1:  name += '_' + tag
+      if meq > 1        :  name += '_q{:d}'.format( i )
+      f = TextDB( name + '.dat' )
+      f.SetField('mx',  '5d',   desc='Number of grix points')
+      f.SetField('L1', '2.15e', desc=     'L1 norm of error')
+      f.SetField('L2', '2.15e', desc=     'L2 norm of error')
+      f.SetField('Li', '2.15e', desc=  'L-inf norm of error')
+      f.open()
+      ostreams[tag].append( f )
+  
+  #-----------------------------------------------------------------------------
+  # Write errors as soon as each simulation is completed
+  def write_errors( job, result ):
+    norms, wall = result
+    for f, (L1, L2, Li) in zip( ostreams[job.tag], norms ):
+      f.write( job.mx, L1, L2, Li )
+      f.flush()
+    print(' done: {:s} mx = {:5d}; L2-error = {:2.3e}; time = {:.2f} s'\
+          .format( job.tag, job.mx, norms[0][1], wall ))
+  
+  # Run all simulations in process pool
+  memory = args.memory * 2.0**20 if args.memory is not None else None
+  
+  t0 = time.time()
+  RunJobs( jobs, write_errors, args.nproc, memory )
+  print(' all done: total time = {:.2f} s'.format( time.time()-t0 ))
+  
+  # Close output files
+  for tag in tags:
+    for f in ostreams[tag]:
+      f.close()
+
+#===============================================================================
+if __name__ == '__main__':
+  #Run as main program
+  main()
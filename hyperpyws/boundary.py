@@ -21,8 +21,8 @@ def PeriodicBCs (q, mx, mbc):
   """
   r = mbc+mx   # Index of first ghost cell on the right
   for qi in q:
-    qi[:mbc] = qi[r-mbc:  r]  # Populate ghost cells on the left
-    qi[r:  ] = qi[mbc:2*mbc]  # Populate ghost cells on the right
+    qi[...,:mbc] = qi[...,r-mbc:  r]  # Populate ghost cells on the left
+    qi[...,r:  ] = qi[...,mbc:2*mbc]  # Populate ghost cells on the right
 
 #===============================================================================
 
@@ -30,13 +30,85 @@ def OutflowBC_left  (q, mx, mbc):
   """ Impose outflow boundary condition at the left end.
   """
   for qi in q:
-    qi[:mbc] = qi[mbc]
+    qi[...,:mbc] = qi[...,mbc:mbc+1]
 
 def OutflowBC_right (q, mx, mbc):
   """ Impose outflow boundary condition at the right end.
   """
   r = mbc+mx   # Index of first ghost cell on the right
   for qi in q:
-    qi[r:] = qi[r-1]
+    qi[...,r:] = qi[...,r-1:r]
+
+#===============================================================================
+# CLASS: picklable boundary conditions
+#===============================================================================
+
+class BoundaryConditions (object):
+  """
+  Declarative (and picklable) boundary conditions, to be used as attribute
+  'BCs' of a TestCase: calling the object with (mx,mbc) returns the function
+  SetBCs(q,t) used by the solver.
+  
+  Parameters
+  ----------
+  left : str
+    Boundary condition at the left end: 'periodic', 'outflow' or 'wall'.
+  right : str
+    Boundary condition at the right end (default: same as left).
+  flux : Flux1D
+    Model equations, only needed for 'wall' conditions (which call its static
+    methods SolidWallBC_left and SolidWallBC_right).
+  
+  """
+  kinds = ('periodic', 'outflow', 'wall')
+  
+  def __init__(self, left, right=None, flux=None):
+    
+    if right is None:
+      right = left
+    
+    for kind in (left, right):
+      if kind not in self.kinds:
+        raise ValueError("Unknown boundary condition '{}'".format( kind ))
+    
+    if (left == 'periodic') != (right == 'periodic'):
+      raise ValueError('periodic conditions must be imposed at both ends')
+    
+    if 'wall' in (left, right) and not hasattr( flux, 'SolidWallBC_left' ):
+      raise ValueError("'wall' conditions not available for model equations")
+    
+    self.left  = left
+    self.right = right
+    self.flux  = flux
+  
+  #-----------------------------------------------------------------------------
+  def __call__(self, mx, mbc):
+    return _SetBCs( self, mx, mbc )
+  
+  #-----------------------------------------------------------------------------
+  def __repr__(self):
+    return 'BoundaryConditions({!r}, {!r})'.format( self.left, self.right )
+
+#-------------------------------------------------------------------------------
+class _SetBCs (object):
+  """ Function SetBCs(q,t) for a given grid (see BoundaryConditions). """
+  
+  def __init__(self, bcs, mx, mbc):
+    self.bcs = bcs
+    self.mx  = mx
+    self.mbc = mbc
+  
+  def __call__(self, q, t):
+    bcs, mx, mbc = self.bcs, self.mx, self.mbc
+    
+    if bcs.left == 'periodic':
+      PeriodicBCs(q,mx,mbc)
+      return
+    
+    if   bcs.left  == 'outflow' :  OutflowBC_left (q,mx,mbc)
+    elif bcs.left  == 'wall'    :  bcs.flux.SolidWallBC_left (q,mx,mbc)
+    
+    if   bcs.right == 'outflow' :  OutflowBC_right(q,mx,mbc)
+    elif bcs.right == 'wall'    :  bcs.flux.SolidWallBC_right(q,mx,mbc)
 
 #===============================================================================
@@ -0,0 +1,281 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+"""
+This module contains the class 'TestCaseSpec', a declarative description of a
+test case that only contains plain data: name and parameters of the model
+equations, domain, final time, boundary conditions, and references to the
+module-level functions that give the initial conditions and (optionally) the
+exact solution.  A TestCaseSpec can be pickled and sent to worker processes
+(multiprocessing, concurrent.futures), where the corresponding TestCase is
+created by the method 'build', and it provides a content hash that can be used
+as a key for caching the results of a simulation.
+
+A reference to a function is a string 'module:function', where 'module' is
+either the name of an importable module (e.g. 'hyperpyws.boundary') or the
+path of a Python file (e.g. '/home/user/test_sine/advection_sine.py').  Files
+are imported by path (see ImportFile), hence test-case files with the same
+name in different directories do not collide.
+
+"""
+
+__all__ = ['TestCaseSpec', 'FunctionRef', 'ResolveFunction', 'ImportFile',
+           'MODELS']
+__docformat__ = 'reStructuredText'
+
+import os, sys, json, hashlib, inspect
+import numpy as np
+
+#===============================================================================
+# Model equations available by name: (module, class)
+#===============================================================================
+
+MODELS = { 'Advection1D'      : ('advection'       , 'Advection1D'      ),
+           'Burgers1D'        : ('burgers'         , 'Burgers1D'        ),
+           'BuckleyLeverett1D': ('buckley_leverett', 'BuckleyLeverett1D'),
+           'Euler1D'          : ('euler'           , 'Euler1D'          ),
+           'ShallowWater1D'   : ('shallow_water'   , 'ShallowWater1D'   ) }
+
+#===============================================================================
+# FUNCTIONS: references to module-level functions
+#===============================================================================
+
+def FunctionRef( func ):
+  """
+  Return the reference 'module:function' to a module-level function.  If the
+  module is not importable by name (e.g. it is the main script, or a test-case
+  file in the 'apps' directory), the absolute path of its file is used.
+  
+  """
+  if isinstance( func, str ):
+    return func
+  
+  name   = func.__name__
+  module = sys.modules[func.__module__]
+  
+  if getattr( module, name, None ) is not func:
+    raise ValueError( "Function '{}' is not defined at module level"\
+                      .format( name ))
+  
+  # Modules within a package are imported by name, others by file path
+  if func.__module__ != '__main__' and '.' in func.__module__:
+    return '{}:{}'.format( func.__module__, name )
+  
+  path = os.path.abspath( module.__file__ )
+  if path.endswith('.pyc'):
+    path = path[:-1]
+  return '{}:{}'.format( path, name )
+
+#-------------------------------------------------------------------------------
+def ResolveFunction( ref ):
+  """ Return the module-level function given by the reference 'module:func'.
+  """
+  mod_name, _, func_name = ref.rpartition(':')
+  
+  if mod_name.endswith('.py'):
+    module = ImportFile( mod_name )
+  else:
+    __import__( mod_name )
+    module = sys.modules[mod_name]
+  
+  return getattr( module, func_name )
+
+#-------------------------------------------------------------------------------
+def ImportFile( path ):
+  """
+  Import a Python file by path, only once per process.  The module is given a
+  unique name, obtained from a hash of the absolute path of the file: files
+  with the same name in different directories (e.g. two 'shock_tube.py') are
+  imported as different modules.  The directory of the file is added to
+  sys.path, so that the file can import its neighbors.
+  
+  """
+  path = os.path.abspath( path )
+  if path.endswith('.pyc'):
+    path = path[:-1]
+  
+  name = 'hyperpyws_file_' + hashlib.sha1( path.encode('utf-8') ).hexdigest()
+  if name in sys.modules:
+    return sys.modules[name]
+  
+  file_dir = os.path.dirname( path )
+  if file_dir not in sys.path:
+    sys.path.insert( 0, file_dir )
+  
+  try:
+    from importlib.util import spec_from_file_location, module_from_spec
+  except ImportError:
+    # Python 2
+    import imp
+    return imp.load_source( name, path )
+  
+  spec   = spec_from_file_location( name, path )
+  module = module_from_spec( spec )
+  sys.modules[name] = module
+  try:
+    spec.loader.exec_module( module )
+  except Exception:
+    del sys.modules[name]
+    raise
+  return module
+
+#-------------------------------------------------------------------------------
+class _Bind (object):
+  """ Picklable function f(*args, **params), with fixed keyword parameters. """
+  
+  def __init__(self, ref, params):
+    self.ref    = ref
+    self.params = params
+    self.func   = ResolveFunction( ref )
+  
+  def __call__(self, *args):
+    return self.func( *args, **self.params )
+  
+  def __getstate__(self):
+    return (self.ref, self.params)
+  
+  def __setstate__(self, state):
+    self.__init__( *state )
+
+#-------------------------------------------------------------------------------
+def _to_json( obj ):
+  """ Convert NumPy arrays and scalars (e.g. parameters of an ensemble) to
+      plain lists and numbers, for json.dumps.
+  """
+  if isinstance( obj, (np.ndarray, np.generic) ):
+    return obj.tolist()
+  raise TypeError( '{!r} is not JSON serializable'.format( obj ) )
+
+#===============================================================================
+# CLASS: test-case specification
+#===============================================================================
+
+class TestCaseSpec (object):
+  """
+  Declarative description of a test case (see module docstring).
+  
+  Parameters
+  ----------
+  model : str
+    Name of model equations (key of MODELS).
+  params : dict
+    Keyword arguments for the constructor of the model equations.
+  xlims : list of float
+    Domain limits [x_min, x_max].
+  tend : float
+    Final time.
+  bcs : tuple of str
+    Boundary conditions (left, right), see boundary.BoundaryConditions.
+  qinit : str or function
+    Reference to module-level function qinit(x, **ic_params).
+  qexact : str or function
+    Reference to module-level function qexact(x, t, **ic_params), or None.
+  ic_params : dict
+    Keyword arguments for qinit and qexact.
+  
+  """
+  __slots__ = ['model','params','xlims','tend','bcs','qinit','qexact',
+               'ic_params']
+  
+  def __init__(self, model, params, xlims, tend, bcs, qinit, qexact=None,
+               ic_params={}):
+    
+    if model not in MODELS:
+      raise ValueError( "Unknown model equations '{}'".format( model ))
+    
+    if isinstance( bcs, str ):
+      bcs = (bcs, bcs)
+    
+    self.model     = model
+    self.params    = dict( params )
+    self.xlims     = [float( x ) for x in xlims]
+    self.tend      = float( tend )
+    self.bcs       = tuple( bcs )
+    self.qinit     = FunctionRef( qinit )
+    self.qexact    = FunctionRef( qexact ) if qexact is not None else None
+    self.ic_params = dict( ic_params )
+  
+  # Pickling of objects with __slots__
+  def __getstate__(self):
+    return self.as_dict()
+  
+  def __setstate__(self, state):
+    for s in self.__slots__:
+      setattr( self, s, state[s] )
+    self.bcs = tuple( self.bcs )
+  
+  #-----------------------------------------------------------------------------
+  def as_dict (self):
+    """ Return dictionary with all attributes (e.g. for JSON output). """
+    return dict( (s, getattr( self, s )) for s in self.__slots__ )
+  
+  @classmethod
+  def from_dict (cls, d):
+    """ Create specification from dictionary (e.g. from JSON input). """
+    return cls( **d )
+  
+  #-----------------------------------------------------------------------------
+  def build (self):
+    """ Create the corresponding TestCase object. """
+    
+    from .simulation import TestCase
+    from .boundary   import BoundaryConditions
+    
+    mod_name, cls_name = MODELS[self.model]
+    module   = __import__( 'hyperpyws.model_equations.' + mod_name,
+                           fromlist = [cls_name] )
+    ModelEqn = getattr( module, cls_name )( **self.params )
+    
+    test          = TestCase()
+    test.ModelEqn = ModelEqn
+    test.xlims    = list( self.xlims )
+    test.tend     = self.tend
+    test.BCs      = BoundaryConditions( self.bcs[0], self.bcs[1], ModelEqn )
+    test.qinit    = _Bind( self.qinit, self.ic_params )
+    if self.qexact is not None:
+      test.qexact = _Bind( self.qexact, self.ic_params )
+    
+    return test
+  
+  #-----------------------------------------------------------------------------
+  def hash (self, *extra):
+    """
+    Content hash (SHA-1, hexadecimal) of the specification, including the
+    source code of the modules that define the referenced functions (so that
+    it changes if they, or the constants they use, are modified) but not their
+    location on disk.  Any further arguments (e.g. the numerical parameters of
+    a run) are converted to strings and included.
+    
+    """
+    d = self.as_dict()
+    for key in ['qinit','qexact']:
+      if d[key] is not None:
+        mod_name, _, func_name = d[key].rpartition(':')
+        func   = ResolveFunction( d[key] )
+        source = inspect.getsource( inspect.getmodule( func ) )
+        d[key] = [os.path.basename( mod_name ), func_name, source]
+    
+    d['extra'] = [str( e ) for e in extra]
+    
+    text = json.dumps( d, sort_keys = True, default = _to_json )
+    return hashlib.sha1( text.encode('utf-8') ).hexdigest()
+  
+  #-----------------------------------------------------------------------------
+  def __repr__(self):
+    return 'TestCaseSpec({})'.format( ', '.join( '{}={!r}'.format( s,
+             getattr( self, s ) ) for s in self.__slots__ ))
+
+#===============================================================================
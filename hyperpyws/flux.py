@@ -17,6 +17,7 @@
 #===============================================================================
 
 from abc import ABCMeta, abstractmethod
+import numpy as np
 
 #===============================================================================
 
@@ -25,6 +26,10 @@ class Flux1D(object):
   Abstract base class for any 1D flux: requires implementation of flux function 
   f, its Jacobian matrix J, and eigendecomposition of the latter.
   
+  If q is a contiguous (meq,N) array of floats, vectors are returned as (meq,N)
+  arrays and matrices (J, R, L) as dense (meq,meq,N) arrays of floats.  If q is
+  an array of objects, results are arrays of objects with the same structure.
+  
   """
   __metaclass__ = ABCMeta
   
@@ -56,5 +61,150 @@ class Flux1D(object):
   def meq (self):
     """ Return number of equations in model. """
     return self._meq
+  
+  def Jv (self, q, v):
+    """
+    Directional derivative of the flux function at state q along vector v, 
+    i.e. the product J(q) v, with the same layout as q.  The default 
+    implementation builds the Jacobian matrix J(q); models override it with 
+    fused expressions, which do not allocate a (meq,meq) matrix of arrays.
+    
+    """
+    J = self.J(q)
+    r = new_vector( q, self.meq )
+    for i in range( self.meq ):
+      r[i] = sum( J[i,j]*v[j] for j in range( self.meq ) )
+    return r
+  
+  def eigensystem (self, q, flux=True):
+    """
+    Fused evaluation at state q of the flux f (None if flux=False), of the 
+    eigendecomposition of J, and of the maximum wave speed: return the list
+    [f, R, L, eig, MaxWaveSpeed].  The default implementation calls the 
+    individual methods; models override it in order to compute the primitive
+    variables (velocity, pressure, sound speed, ...) only once.
+    
+    """
+    f = self.f(q) if flux else None
+    return [ f, self.R(q), self.L(q), self.eig(q), self.MaxWaveSpeed(q) ]
+  
+  def roe_eigensystem (self, qL, qR):
+    """
+    Return the list [None, R, L, eig, MaxWaveSpeed] (see eigensystem) at the 
+    Roe average of the states qL and qR, i.e. the intermediate state whose 
+    Jacobian A satisfies A (qR-qL) = f(qR)-f(qL).  Models that do not define
+    a Roe average return None (default).
     
+    """
+    return None
+  
+  def constant_eigensystem (self):
+    """
+    For a linear flux f(q) = A q, with A constant, return the eigensystem of A
+    as a tuple (R, L, eig) of float arrays, with shapes (meq,meq), (meq,meq)
+    and (meq,); the eigenvalues may have extra trailing axes, which broadcast
+    against the state components (e.g. one value per ensemble member).  The
+    solver then computes projection matrices and maximum wave speed only once.
+    Nonlinear fluxes return None (default).
+    
+    """
+    return None
+  
+  def MaxWaveSpeedBound (self):
+    """
+    Upper bound of the wave speed over all admissible states, if available in
+    closed form (one value per ensemble member, if any); otherwise None.  By
+    default this is only available for linear fluxes with constant eigensystem.
+    
+    """
+    eigsys = self.constant_eigensystem()
+    if eigsys is None:
+      return None
+    vmax = np.amax( abs( np.asarray( eigsys[2], dtype=float ) ), axis=0 )
+    return vmax.reshape( -1 ) if np.ndim( vmax ) else vmax
+  
+  @property
+  def identity_eigenvectors (self):
+    """ True if R and L are identity matrices, hence the projections onto the
+        characteristic variables can be skipped (by default: scalar models).
+    """
+    return self.meq == 1
+    
+#===============================================================================
+# Containers for flux vectors and matrices
+#
+#   A state vector q can be stored either as an array of objects (one array for 
+#   each component), or as a single contiguous array of floats with the 
+#   component index along the first axis.  The model equations use the two 
+#   functions below to return their results with the same layout as q.
+#===============================================================================
+
+def is_contiguous (q):
+  """ True if q is a contiguous float array (rather than an array of objects).
+  """
+  return isinstance( q, np.ndarray ) and q.dtype != object
+
+#-------------------------------------------------------------------------------
+def new_vector (q, n):
+  """
+  Create an empty vector with n components, compatible with the layout of q.
+  
+  Returns an array of objects with shape (n,) if q is an array of objects, or 
+  an array of floats with shape (n,)+q.shape[1:] if q is contiguous.
+  
+  """
+  if is_contiguous( q ):
+    return np.empty( (n,)+q.shape[1:] )
+  else:
+    return np.empty( n, dtype=object )
+
+#-------------------------------------------------------------------------------
+def new_matrix (q, n):
+  """
+  Create an empty (n x n) matrix, compatible with the layout of q.
+  
+  Returns an array of objects with shape (n,n) if q is an array of objects, or 
+  an array of floats with shape (n,n)+q.shape[1:] if q is contiguous.
+  
+  """
+  if is_contiguous( q ):
+    return np.empty( (n,n)+q.shape[1:] )
+  else:
+    return np.empty( (n,n), dtype=object )
+
+#-------------------------------------------------------------------------------
+def as_dense (a):
+  """
+  Convert a vector (or matrix) of arrays with dtype=object into a single array 
+  of floats, with the component index (or indices) along the leading axes.
+  Contiguous arrays of floats are returned unchanged.
+  
+  """
+  if is_contiguous( a ):
+    return a
+  else:
+    return np.array( a.tolist(), dtype=float )
+
+#===============================================================================
+# Ensembles
+#
+#   An ensemble of K simulations of the same model equations is advanced as a
+#   single state, whose components are (K,N) arrays (see MOL).  A parameter of
+#   the model equations can then have one value per member: it is stored as a
+#   (K,1) array, which broadcasts against the components of the state.  The
+#   maximum wave speed is computed along the grid axis only, i.e. one value
+#   for each member.
+#===============================================================================
+
+def member_param (p):
+  """
+  Return parameter of model equations: a scalar is returned unchanged, while a
+  sequence of K values (one per ensemble member) is returned as a (K,1) array.
+  
+  """
+  if np.ndim( p ) == 0:
+    return p
+  else:
+    return np.asarray( p, dtype=float ).reshape( -1, 1 )
+
 #===============================================================================
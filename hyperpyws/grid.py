@@ -36,9 +36,19 @@ class Grid1D(object):
     Number of ghost cells at each boundary
   meq : int
     Number of equations (solving system of meq scalar conservation laws)
+  contiguous : bool
+    If True, store the solution as a single C-contiguous (meq, mx+2*mbc) array 
+    of floats, instead of an array of objects holding meq separate arrays
+  members : int
+    Number K of ensemble members: if given, the solutions of K simulations on
+    the same grid are stored as a single (K, meq, mx+2*mbc) array of floats
+    (requires contiguous=True)
     
   """
-  def __init__(self, xlims, mx, mbc=3, meq=1):
+  def __init__(self, xlims, mx, mbc=3, meq=1, contiguous=False, members=None):
+    
+    if members is not None and not contiguous:
+      raise ValueError('ensemble of solutions requires contiguous storage')
     
     # Copy input data
     self._xlow  = xlims[0]
@@ -46,6 +56,8 @@ class Grid1D(object):
     self._mx    = mx
     self._mbc   = mbc
     self._meq   = meq
+    self._contiguous = contiguous
+    self._members    = members
     
     # Mesh spacing
     self._dx = (xlims[1]-xlims[0])/mx
@@ -58,9 +70,14 @@ class Grid1D(object):
     self._xint = self._x[mbc:(mx+mbc)]
     
     # Solution (1 array for each component of state vector)
-    self._q = np.empty( meq, dtype=object )
-    for i in range(meq):
-      self._q[i] = np.zeros(mx+2*mbc)
+    if members is not None:
+      self._q = np.zeros( (members, meq, mx+2*mbc) )
+    elif contiguous:
+      self._q = np.zeros( (meq, mx+2*mbc) )
+    else:
+      self._q = np.empty( meq, dtype=object )
+      for i in range(meq):
+        self._q[i] = np.zeros(mx+2*mbc)
   
   #-----------------------------------------------------------------------------
   @property
@@ -69,6 +86,13 @@ class Grid1D(object):
   
   @q.setter
   def q(self,qnew):
+    if self._members is not None:
+      # Ensemble: one state vector for each member
+      assert( len(qnew) == self._members )
+      for k in range(self._members):
+        for i in range(self._meq):  self._q[k,i] = qnew[k][i]
+      return
+    
     assert( len(qnew) == self._meq )
     assert( all([len(qi) == self._mx+2*self._mbc for qi in qnew]) )
     
@@ -79,6 +103,8 @@ class Grid1D(object):
   def qint(self):
     a = self._mbc
     b = self._mbc+self._mx
+    if self._contiguous:
+      return self._q[...,a:b]
     return [ qi[a:b] for qi in self._q ]
   
 #  # Or should we return a numpy array?
@@ -118,5 +144,11 @@ class Grid1D(object):
   @property
   def meq (self):  return self._meq
   
+  @property
+  def contiguous (self):  return self._contiguous
+  
+  @property
+  def members (self):  return self._members
+  
 #===============================================================================
   
@@ -39,12 +39,14 @@ def parse_input( help_message ):
                       help = 'number of subdivisions along x axis')
   
   parser.add_argument('CFL',
-                      type = float,
-                      help = 'maximum Courant number in domain')
+                      type  = float,
+                      nargs = '?',
+                      help  = 'maximum Courant number in domain'+\
+                              ' (default: largest safe value for integrator)')
   
   parser.add_argument('-O','--weno_order',
                       type    = int,
-                      choices = [5,7],
+                      choices = [3,5,7,9,11],
                       default =  5,
                       help    = 'order of accuracy for WENO recontruction'+\
                                 ' (default: 5)')
@@ -59,26 +61,74 @@ def parse_input( help_message ):
   CFD = central finite difference (uses WENO linear weights)
 (default: Z)''')
   
+  parser.add_argument('-H','--hybrid',
+                      type    = float,
+                      default = None,
+                      metavar = 'THR',
+                      help    = 'hybrid WENO/linear reconstruction: WENO only'+\
+                                ' where shock sensor > THR (e.g. 0.1)'+\
+                                ' (default: None)')
+  
   parser.add_argument('-s','--time_integrator',
-                      type    = int,
-                      choices = range(11),
-                      default =  5,
+                      default = 'rk4',
                       dest    = 'stepper',
                       metavar = 'X',
                       help    = 
   '''choose integrator X for time-stepping:
-  0. FE      (forward-Euler)
-  1. RK2     (midpoint rule)
-  2. RK2-SSP (Heun's method)
-  3. RK3
-  4. RK3-SSP
-  5. RK4     (gold standard)
-  6. Fehlberg5 (from the 4-5 pair)
-  7. Taylor2 (Taylor's method, 2nd-order)
-  8. TD-RK3  (Two-derivative Runge-Kutta, 3rd-order)
-  9. TD-RK4  (Two-derivative Runge-Kutta, 4th-order)
- 10. TD-RK5  (Two-derivative Runge-Kutta, 5th-order)
-(default: 5)''')
+  fE              (forward-Euler)
+  rk2_midpoint    (RK2, midpoint rule)
+  rk2_Heun        (RK2-SSP, Heun's method)
+  rk3             (RK3)
+  rk3_ssp         (RK3-SSP)
+  rk4             (RK4, gold standard)
+  Fehlberg5       (from the 4-5 pair)
+  Taylor2         (Taylor's method, 2nd-order)
+  TD_RK3          (Two-derivative Runge-Kutta, 3rd-order)
+  TD_RK4          (Two-derivative Runge-Kutta, 4th-order)
+  TD_RK5          (Two-derivative Runge-Kutta, 5th-order)
+  rk3_ssp_inplace (RK3-SSP, in place, 1 register)
+  rk4_inplace     (RK4, in place, 2 registers)
+  ssp10_4         (SSP(10,4), Ketcheson's low-storage method, in place)
+  Fehlberg45      (embedded 4-5 pair, for adaptive time-stepping with -t)
+X can also be given by its index in this list (e.g. 5 for rk4)
+(default: rk4)''')
+  
+  parser.add_argument('-t','--tol',
+                      type    = float,
+                      default = None,
+                      metavar = 'TOL',
+                      help    = 'adaptive time-step with local error tolerance'+\
+                                ' TOL, CFL is upper limit (default: None)')
+  
+  parser.add_argument('-c','--contiguous',
+                      action  = 'store_true',
+                      help    = 'store solution as a single contiguous array'+\
+                                ' (default: array of objects)')
+  
+  parser.add_argument('--componentwise',
+                      action  = 'store_true',
+                      help    = 'reconstruct fluxes in conserved variables,'+\
+                                ' skipping the characteristic projection'+\
+                                ' (default: characteristic)')
+  
+  parser.add_argument('--analytic_speed',
+                      action  = 'store_true',
+                      help    = 'use analytic bound of the maximum wave speed'+\
+                                ' over all admissible states, if available'+\
+                                ' (default: sampled from solution)')
+  
+  parser.add_argument('--splitting',
+                      choices = ['global','field','local'],
+                      default = 'global',
+                      help    = 'speed of Lax-Friedrichs flux splitting: max.'+\
+                                ' over grid, over grid for each field, or'+\
+                                ' over stencil for each field and interface')
+  
+  parser.add_argument('--average',
+                      choices = ['arithmetic','roe'],
+                      default = 'arithmetic',
+                      help    = 'interface states for characteristic'+\
+                                ' decomposition (Roe: Euler and shallow water)')
   
   parser.add_argument('-f','--frames',
                       type    = int,
@@ -86,7 +136,7 @@ def parse_input( help_message ):
                       metavar = 'N',
                       help    = 'produce N frames as real-time visualization'+\
                                 ' (default: None)')
-
+  
   parser.add_argument('-v','--verbosity',
                       type    = bool,
                       default = False,
@@ -129,11 +179,10 @@ def main( help_message, DefineTestCase ):
   from   hyperpyws.simulation       import Numerics, RunSimulation
   
   # Extract time-integrator function
-  stepper_name = integrators.__all__[args.stepper]    # --> dangerous indexing
-  stepper_func = getattr( integrators, stepper_name ) 
+  stepper_func = integrators.get_stepper( args.stepper )
   
   # Extract WENO reconstruction class
-  weno_class = Weno( args.weno_order, args.weno_version )
+  weno_class = Weno( args.weno_order, args.weno_version, hybrid=args.hybrid )
   
   # Collect input numerical parameters
   num_params         = Numerics()     # Container for numerical parameters
@@ -141,6 +190,12 @@ def main( help_message, DefineTestCase ):
   num_params.stepper = stepper_func   # --> should we pass a string?
   num_params.CFL     = args.CFL       # CFL parameter
   num_params.mx      = args.mx        # Number of mesh cells in domain
+  num_params.contiguous = args.contiguous  # Storage layout of solution
+  num_params.tol     = args.tol       # Tolerance for adaptive time-step
+  num_params.componentwise = args.componentwise  # No characteristic projection
+  num_params.analytic_speed = args.analytic_speed  # Closed-form speed bound
+  num_params.splitting = args.splitting  # Lax-Friedrichs splitting speed
+  num_params.average   = args.average    # Interface states for eigensystem
   
   # Real-time visualization: time instants for creating an output
   if args.frames is not None:
@@ -149,7 +204,16 @@ def main( help_message, DefineTestCase ):
     Tout = []
   
   # Run simulation: call default library function
-  grid = RunSimulation( test_case, num_params, Tout, args.verbosity )
+  stats = {}
+  grid  = RunSimulation( test_case, num_params, Tout, args.verbosity, stats )
+  print('Time-steps: {steps:d} accepted, {rejected:d} rejected;'
+        ' RHS evaluations: {nrhs:d} ({cost:.1f} per unit time); CFL = {CFL:.3f}'\
+        .format( **stats ))
+  if 'flagged' in stats:
+    flagged = [f for f in stats['flagged'] if f is not None]
+    print('Hybrid reconstruction: points flagged for WENO per time-step:'
+          ' {:.2%} on average, {:.2%} at most'\
+          .format( np.mean( flagged ), np.amax( flagged ) ))
   
   # Print numerical parameters to file
   if args.output is not None:
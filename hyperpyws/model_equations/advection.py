@@ -16,7 +16,7 @@
 
 import numpy as np
 
-from ..flux import Flux1D
+from ..flux import Flux1D, new_vector, new_matrix, member_param
 
 #===============================================================================
 
@@ -28,12 +28,12 @@ class Advection1D (Flux1D):
   #-----------------------------------------------------------------------------
   def __init__ (self, v):
     
-    self._v = v  # Constant velocity
+    self._v = member_param( v )  # Constant velocity (or one per member)
   
   #-----------------------------------------------------------------------------
   def f (self, q):
     
-    r    = np.empty( q.shape[0], dtype=object )  # vector
+    r    = new_vector( q, self._meq )  # vector
     r[0] = q[0] * self._v
     
     return r
@@ -41,21 +41,28 @@ class Advection1D (Flux1D):
   #-----------------------------------------------------------------------------
   def J (self, q):
     
-    neq  = q.shape[0]
     dims = q[0].shape
     
-    r      = np.empty( (neq,neq), dtype=object )  # matrix
+    r      = new_matrix( q, self._meq )  # matrix
     r[0,0] = np.ones (dims) * self._v
     
     return r
   
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J v = v * velocity. """
+    
+    r    = new_vector( q, self._meq )
+    r[0] = v[0] * self._v
+    
+    return r
+  
   #-----------------------------------------------------------------------------
   def R (self, q):
     
-    neq  = q.shape[0]
     dims = q[0].shape
     
-    r      = np.empty( (neq,neq), dtype=object )  # matrix
+    r      = new_matrix( q, self._meq )  # matrix
     r[0,0] = np.ones (dims)
     
     return r
@@ -63,10 +70,9 @@ class Advection1D (Flux1D):
   #-----------------------------------------------------------------------------
   def L (self, q):
     
-    neq  = q.shape[0]
     dims = q[0].shape
     
-    r    = np.empty( (neq,neq), dtype=object )  # matrix
+    r    = new_matrix( q, self._meq )  # matrix
     r[0,0] = np.ones (dims)
     
     return r
@@ -74,18 +80,26 @@ class Advection1D (Flux1D):
   #-----------------------------------------------------------------------------
   def eig (self, q):
     
-    neq  = q.shape[0]
     dims = q[0].shape
     
-    r    = np.empty( neq, dtype=object )  # vector
+    r    = new_vector( q, self._meq )  # vector
     r[0] = np.ones (dims) * self._v
     
     return r
   
+  #-----------------------------------------------------------------------------
+  def constant_eigensystem (self):
+    """ Constant eigendecomposition (R, L, eig) of the linear flux. """
+    
+    return np.ones( (1,1) ), np.ones( (1,1) ), np.array( [self._v], dtype=float )
+  
   #-----------------------------------------------------------------------------
   def MaxWaveSpeed (self, q):
     """ Maximum wave speed in the range of values for q. """
     
-    return abs(self._v)
+    if np.ndim( self._v ) == 0:
+      return abs(self._v)
+    else:
+      return abs(self._v[:,0])  # one value per ensemble member
     
 #===============================================================================  
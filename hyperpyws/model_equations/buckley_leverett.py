@@ -19,7 +19,7 @@
 
 import numpy as np
 
-from ..flux import Flux1D
+from ..flux import Flux1D, new_vector, new_matrix, member_param
 
 #===============================================================================
 
@@ -31,7 +31,7 @@ class BuckleyLeverett1D (Flux1D):
   #-----------------------------------------------------------------------------
   def __init__ (self, M):
     
-    self._M = M
+    self._M = member_param( M )
   
   #-----------------------------------------------------------------------------
   @property
@@ -47,7 +47,7 @@ class BuckleyLeverett1D (Flux1D):
     u0   = q[0]**2
     u1   = (1.0-q[0])**2
     
-    f    = np.empty( 1, dtype=object )  # vector
+    f    = new_vector( q, 1 )  # vector
     f[0] = u0 / (u0 + self._M*u1)
     
     return f
@@ -59,16 +59,28 @@ class BuckleyLeverett1D (Flux1D):
     u = q[0]
     M = self._M
     
-    J      = np.empty( (1,1), dtype=object )  # matrix
+    J      = new_matrix( q, 1 )  # matrix
     J[0,0] = (2.*M*u*(1.-u)) / (u**2 + M*(1.-u)**2)**2
     
     return J
   
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J(q) v (see Flux1D). """
+    
+    u = q[0]
+    M = self._M
+    
+    r    = new_vector( q, 1 )
+    r[0] = (2.*M*u*(1.-u)) / (u**2 + M*(1.-u)**2)**2 * v[0]
+    
+    return r
+  
   #-----------------------------------------------------------------------------
   def eig (self, q):
     """ Compute eigenvalues of Jacobian matrix J. """
     
-    eig    = np.empty( 1, dtype=object )
+    eig    = new_vector( q, 1 )
     eig[0] = self.J(q)[0,0]
     
     return eig
@@ -77,7 +89,7 @@ class BuckleyLeverett1D (Flux1D):
   def R (self, q):
     """ Matrix having the right eigenvectors of J as columns. """
     
-    R      = np.empty( (1,1), dtype=object )  # matrix
+    R      = new_matrix( q, 1 )  # matrix
     R[0,0] = np.ones ( q[0].shape )
     
     return R
@@ -86,7 +98,7 @@ class BuckleyLeverett1D (Flux1D):
   def L (self, q):
     """ Matrix having the left eigenvectors of J as rows; L = inv(R). """
     
-    L      = np.empty( (1,1), dtype=object )  # matrix
+    L      = new_matrix( q, 1 )  # matrix
     L[0,0] = np.ones ( q[0].shape )
     
     return L
@@ -95,10 +107,26 @@ class BuckleyLeverett1D (Flux1D):
   def MaxWaveSpeed (self, q):
     """ Maximum wave speed in the range of values for q. """
     
-    u = np.linspace( min(q[0]), max(q[0]), 100 )
+    # Sample range of q (for each ensemble member, if any)
+    qmin = np.amin( q[0], axis=-1 )
+    qmax = np.amax( q[0], axis=-1 )
+    u = np.linspace( qmin, qmax, 100, axis=-1 )
     M = self._M
     eig = (2.*M*u*(1.-u)) / (u**2 + M*(1.-u)**2)**2
     
-    return max(abs(eig))
+    return np.amax( abs(eig), axis=-1 )
+  
+  #-----------------------------------------------------------------------------
+  def MaxWaveSpeedBound (self):
+    """ Maximum wave speed over all admissible states 0 <= q <= 1. """
+    
+    # f'(u) has its maximum at the only root in (0,1) of f''(u), i.e. of the
+    # cubic 2u^3 - 3u^2 + M/(1+M) = 0, which is found in trigonometric form
+    M   = self._M
+    u   = 0.5 + np.cos( (np.arccos( (1.-M)/(1.+M) ) - 2.*np.pi)/3. )
+    eig = (2.*M*u*(1.-u)) / (u**2 + M*(1.-u)**2)**2
+    
+    # One value per ensemble member, if any
+    return eig[:,0] if np.ndim( eig ) else eig
   
 #===============================================================================  
@@ -20,7 +20,7 @@
 
 import numpy as np
 
-from ..flux import Flux1D
+from ..flux import Flux1D, new_vector, new_matrix
 
 #===============================================================================
 
@@ -37,7 +37,7 @@ class Burgers1D (Flux1D):
   def f (self, q):
     """ Flux function f(q). """
     
-    f    = np.empty( 1, dtype=object )  # vector
+    f    = new_vector( q, 1 )  # vector
     f[0] = 0.5 * q[0]**2
     
     return f
@@ -46,16 +46,25 @@ class Burgers1D (Flux1D):
   def J (self, q):
     """ Jacobian matrix of flux function: J(q)[i,j] = ∂f[i]/∂q[j]. """
     
-    J      = np.empty( (1,1), dtype=object )  # matrix
+    J      = new_matrix( q, 1 )  # matrix
     J[0,0] = q[0].copy()   # TODO: better way to do this?
     
     return J
   
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J(q) v (see Flux1D). """
+    
+    r    = new_vector( q, 1 )
+    r[0] = q[0] * v[0]
+    
+    return r
+  
   #-----------------------------------------------------------------------------
   def eig (self, q):
     """ Compute eigenvalues of Jacobian matrix J. """
     
-    eig    = np.empty( 1, dtype=object )
+    eig    = new_vector( q, 1 )
     eig[0] = self.J(q)[0,0]
     
     return eig
@@ -64,7 +73,7 @@ class Burgers1D (Flux1D):
   def R (self, q):
     """ Matrix having the right eigenvectors of J as columns. """
     
-    R      = np.empty( (1,1), dtype=object )  # matrix
+    R      = new_matrix( q, 1 )  # matrix
     R[0,0] = np.ones ( q[0].shape )
     
     return R
@@ -73,7 +82,7 @@ class Burgers1D (Flux1D):
   def L (self, q):
     """ Matrix having the left eigenvectors of J as rows; L = inv(R). """
     
-    L      = np.empty( (1,1), dtype=object )  # matrix
+    L      = new_matrix( q, 1 )  # matrix
     L[0,0] = np.ones ( q[0].shape )
     
     return L
@@ -81,6 +90,6 @@ class Burgers1D (Flux1D):
   #-----------------------------------------------------------------------------
   def MaxWaveSpeed (self, q):
     """ Maximum wave speed in the range of values for q. """
-    return max( max(abs(self.eig(q))) )
+    return np.amax( abs(self.eig(q)[0]), axis=-1 )
   
 #===============================================================================  
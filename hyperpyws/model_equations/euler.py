@@ -19,7 +19,7 @@
 
 import numpy as np
 
-from ..flux import Flux1D
+from ..flux import Flux1D, new_vector, new_matrix, member_param
 
 #===============================================================================
 
@@ -31,7 +31,7 @@ class Euler1D (Flux1D):
   #-----------------------------------------------------------------------------
   def __init__ (self, gamma):
     
-    self._gamma = gamma
+    self._gamma = member_param( gamma )
   
   #-----------------------------------------------------------------------------
   @property
@@ -52,7 +52,7 @@ class Euler1D (Flux1D):
     p  = (self._gamma-1.0) * (eng-0.5*rho*u1**2)
     
     # Compute fluxes
-    f = np.empty( 3, dtype=object )
+    f = new_vector( q, 3 )
     
     #f[0] = rho*u1  # should be momentum, but would pass a reference...
     f[0] = mom.copy()  # is this faster? (-DS)
@@ -70,7 +70,7 @@ class Euler1D (Flux1D):
     
     # Mass-averaged velocity [m/s]
     u1  = mom/rho
-        
+    
     # Useful temporary variables
     g   = self._gamma
     gre = g*rho*eng
@@ -80,7 +80,7 @@ class Euler1D (Flux1D):
     # Data structures for matrix J of numpy arrays
     o = np.zeros( q[0].shape )
     e = np.ones ( q[0].shape )
-    J = np.empty( (3,3), dtype=object )
+    J = new_matrix( q, 3 )
     
     # Jacobian matrix
     J[0,:] = [                      o,                           e,         o ]
@@ -89,6 +89,27 @@ class Euler1D (Flux1D):
     
     return J
   
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J(q) v (see Flux1D). """
+    
+    # Rename conserved quantities
+    [rho, mom, eng] = q
+    
+    # Useful temporary variables
+    g  = self._gamma
+    u1 = mom/rho
+    a  = g*eng/rho
+    b  = (g-1.)*u1**2
+    
+    # Rows of Jacobian matrix applied to v
+    r = new_vector( q, 3 )
+    r[0] = v[1].copy()
+    r[1] = 0.5*(g-3.0)*u1**2*v[0] - (g-3.0)*u1*v[1] + (g-1.0)*v[2]
+    r[2] = -u1*(a-b)*v[0] + (a-1.5*b)*v[1] + g*u1*v[2]
+    
+    return r
+  
   #-----------------------------------------------------------------------------
   def eig (self, q):
     """ Compute eigenvalues of Jacobian matrix J. """
@@ -104,7 +125,7 @@ class Euler1D (Flux1D):
     c = np.sqrt( self._gamma * p/rho )           # speed of sound          [m/s]
     
     # Eigenvalues
-    eig = np.empty( 3, dtype=object )
+    eig = new_vector( q, 3 )
     eig[:] = [ u1-c, u1, u1+c ]
     
     return eig
@@ -130,7 +151,7 @@ class Euler1D (Flux1D):
     
     # Data structure for matrix R of numpy arrays
     e = np.ones ( q[0].shape )
-    R = np.empty( (3,3), dtype=object )
+    R = new_matrix( q, 3 )
     
     # Right eigenvectors of J (along columns)
     R[0,:] = [      e,          e,       e ]
@@ -159,7 +180,7 @@ class Euler1D (Flux1D):
     M = u1 / c                             # Mach number
     
     # Data structure for matrix L of numpy arrays
-    L = np.empty( (3,3), dtype=object )
+    L = new_matrix( q, 3 )
     
     # Temporary arrays
     t0 = (g-1.)/2.* M**2
@@ -178,11 +199,99 @@ class Euler1D (Flux1D):
     """ Maximum wave speed in the range of values for q. """
     
     eig  = self.eig(q)
-    vmin = min(eig[0])
-    vmax = max(eig[2])
+    vmin = np.amin(eig[0],axis=-1)
+    vmax = np.amax(eig[2],axis=-1)
+    
+    return np.maximum(abs(vmin),abs(vmax))
+  
+  #-----------------------------------------------------------------------------
+  def eigensystem (self, q, flux=True):
+    """ Fused evaluation of [f, R, L, eig, MaxWaveSpeed] (see Flux1D). """
+    
+    # Rename conserved quantities
+    [rho, mom, eng] = q
+    
+    # Primitive variables, computed only once
+    g  = self._gamma
+    u1 = mom/rho                           # velocity                      [m/s]
+    umag2 = u1**2
+    p  = (g-1.0) * (eng-0.5*rho*umag2)     # pressure          [N/m^2] = [J/m^3]
+    c  = np.sqrt( g * p / rho )            # speed of sound                [m/s]
+    H  = (eng+p) / rho                     # total enthalpy per unit mass [J/kg]
+    
+    # Flux
+    if flux:
+      f = new_vector( q, 3 )
+      f[0] = mom.copy()
+      f[1] = mom*u1 + p
+      f[2] = (eng+p)*u1
+    else:
+      f = None
+    
+    return [ f ] + self._decomposition( q, u1, c, H )
+  
+  #-----------------------------------------------------------------------------
+  def roe_eigensystem (self, qL, qR):
+    """ Eigensystem [None, R, L, eig, MaxWaveSpeed] at the Roe average of qL
+        and qR (see Flux1D), evaluated in a single pass.
+    """
+    
+    # Rename conserved quantities
+    [rhoL, momL, engL] = qL
+    [rhoR, momR, engR] = qR
+    
+    # Pressure on both sides
+    g  = self._gamma
+    pL = (g-1.0) * (engL-0.5*momL**2/rhoL)
+    pR = (g-1.0) * (engR-0.5*momR**2/rhoR)
+    
+    # Roe averages of velocity and total enthalpy, with sqrt(rho) weights
+    sL = np.sqrt( rhoL )
+    sR = np.sqrt( rhoR )
+    w  = 1.0 / (sL+sR)
+    u1 = (momL/sL + momR/sR) * w
+    H  = ((engL+pL)/sL + (engR+pR)/sR) * w
+    c  = np.sqrt( (g-1.0) * (H-0.5*u1**2) )
+    
+    return [ None ] + self._decomposition( qL, u1, c, H )
+  
+  #-----------------------------------------------------------------------------
+  def _decomposition (self, q, u1, c, H):
+    """
+    Return [R, L, eig, MaxWaveSpeed], given velocity u1, speed of sound c and
+    total enthalpy H at the states (arrays with the layout of q).
+    
+    """
+    g     = self._gamma
+    umag2 = u1**2
+    M     = u1 / c                         # Mach number
+    
+    # Eigenvalues
+    eig = new_vector( q, 3 )
+    eig[:] = [ u1-c, u1, u1+c ]
     
-    return max(abs(vmin),abs(vmax)) 
+    # Right eigenvectors of J (along columns)
+    e = np.ones ( q[0].shape )
+    R = new_matrix( q, 3 )
+    R[0,:] = [      e,          e,       e ]
+    R[1,:] = [ eig[0],         u1,  eig[2] ]
+    R[2,:] = [ H-u1*c,  0.5*umag2,  H+u1*c ]
     
+    # Left eigenvectors of J (along rows)
+    t0 = (g-1.)/2.* M**2
+    t1 = (g-1.)*M
+    t2 = (g-1.)/c**2
+    L = new_matrix( q, 3 )
+    L[0,:] = [ 0.5*(t0+M),  -0.5*(t1+1.)/c,  0.5*t2 ]
+    L[1,:] = [ 1.0 -t0   ,        t1    /c,     -t2 ]
+    L[2,:] = [ 0.5*(t0-M),  -0.5*(t1-1.)/c,  0.5*t2 ]
+    
+    # Maximum wave speed
+    vmax = np.maximum( abs( np.amin( eig[0], axis=-1 ) ),
+                       abs( np.amax( eig[2], axis=-1 ) ) )
+    
+    return [ R, L, eig, vmax ]
+  
   #-----------------------------------------------------------------------------
   @staticmethod
   def SolidWallBC_left (q, mx, mbc):
@@ -190,10 +299,10 @@ class Euler1D (Flux1D):
     
     # Impose mirror conditions
     for qi in q:
-      qi[:mbc] = qi[2*mbc-1:mbc-1:-1]
+      qi[...,:mbc] = qi[...,2*mbc-1:mbc-1:-1]
     
     # Fix momentum (flip sign of velocity)
-    q[1][:mbc] *= -1
+    q[1][...,:mbc] *= -1
   
   #-----------------------------------------------------------------------------
   @staticmethod
@@ -203,9 +312,9 @@ class Euler1D (Flux1D):
     # Impose mirror conditions
     r = mbc+mx   # Index of first ghost cell on the right
     for qi in q:
-      qi[r:] = qi[r-1:r-mbc-1:-1]
-
+      qi[...,r:] = qi[...,r-1:r-mbc-1:-1]
+    
     # Fix momentum (flip sign of velocity)
-    q[1][r:] *= -1
+    q[1][...,r:] *= -1
 
 #===============================================================================
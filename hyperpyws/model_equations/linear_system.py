@@ -0,0 +1,109 @@
+# coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+import numpy as np
+
+from ..flux import Flux1D, new_vector, new_matrix
+
+#===============================================================================
+
+class LinearSystem1D (Flux1D):
+  """ 1D linear hyperbolic system q_t + A q_x = 0, with constant matrix A 
+      (e.g. linear acoustics, or advection with several speeds).
+  """
+  #-----------------------------------------------------------------------------
+  def __init__ (self, A):
+    
+    A = np.array( A, dtype=float )
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+      raise ValueError( 'A must be a square matrix' )
+    
+    # Eigendecomposition of A: real eigenvalues and complete set of eigenvectors
+    lam, R = np.linalg.eig( A )
+    if np.any( np.iscomplex( lam ) ):
+      raise ValueError( 'A must have real eigenvalues (hyperbolic system)' )
+    
+    self._meq = A.shape[0]
+    self._A   = A
+    self._eig = lam.real
+    self._R   = R.real
+    self._L   = np.linalg.inv( self._R )
+  
+  #-----------------------------------------------------------------------------
+  @staticmethod
+  def _matrix (q, M):
+    """ Constant matrix M, broadcast to the layout of state q. """
+    
+    n = M.shape[0]
+    r = new_matrix( q, n )
+    for i in range( n ):
+      for j in range( n ):
+        r[i,j] = np.full( q[0].shape, M[i,j] )
+    return r
+  
+  #-----------------------------------------------------------------------------
+  def f (self, q):
+    """ Flux function f(q) = A q. """
+    
+    r = new_vector( q, self._meq )
+    for i,Ai in enumerate( self._A ):
+      r[i] = sum( a*qj for a,qj in zip( Ai, q ) )
+    
+    return r
+  
+  #-----------------------------------------------------------------------------
+  def J (self, q):
+    """ Jacobian matrix of flux function: J = A. """
+    return self._matrix( q, self._A )
+  
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J v = A v = f(v). """
+    return self.f( v )
+  
+  #-----------------------------------------------------------------------------
+  def R (self, q):
+    """ Matrix having the right eigenvectors of A as columns. """
+    return self._matrix( q, self._R )
+  
+  #-----------------------------------------------------------------------------
+  def L (self, q):
+    """ Matrix having the left eigenvectors of A as rows; L = inv(R). """
+    return self._matrix( q, self._L )
+  
+  #-----------------------------------------------------------------------------
+  def eig (self, q):
+    """ Eigenvalues of A. """
+    
+    r = new_vector( q, self._meq )
+    for i,lam in enumerate( self._eig ):
+      r[i] = np.full( q[0].shape, lam )
+    
+    return r
+  
+  #-----------------------------------------------------------------------------
+  def constant_eigensystem (self):
+    """ Constant eigendecomposition (R, L, eig) of A. """
+    return self._R, self._L, self._eig
+  
+  #-----------------------------------------------------------------------------
+  def MaxWaveSpeed (self, q):
+    """ Maximum wave speed in the range of values for q. """
+    return np.amax( abs( self._eig ) )
+  
+#===============================================================================
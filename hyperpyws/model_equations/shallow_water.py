@@ -20,7 +20,7 @@
 import numpy as np
 #from numpy import sqrt
 
-from ..flux import Flux1D
+from ..flux import Flux1D, new_vector, new_matrix, member_param
 
 #===============================================================================
 
@@ -32,7 +32,7 @@ class ShallowWater1D (Flux1D):
   #-----------------------------------------------------------------------------
   def __init__ (self, g):
     
-    self._g = g
+    self._g = member_param( g )
   
   #-----------------------------------------------------------------------------
   @property
@@ -44,17 +44,17 @@ class ShallowWater1D (Flux1D):
   #-----------------------------------------------------------------------------
   def f (self, q):
     """ Flux function f(q). """
-   
+    
     # Conservd quantities
     [h, hu] = q
-
+    
     # Compute primitive variables
     u = hu / h     # --> careful with division by zero!
-   
+    
     g = self._g
-
+    
     # Compute fluxes
-    f = np.empty( 2, dtype=object )
+    f = new_vector( q, 2 )
     
     f[0] = hu.copy()
     f[1] = h*(u**2) + 0.5*g*(h**2)
@@ -70,14 +70,14 @@ class ShallowWater1D (Flux1D):
     
     # Mass-averaged velocity [m/s]
     u = hu/h
-        
+    
     # Useful temporary variables
     g   = self._g
     
     # Data structures for matrix J of numpy arrays
     o = np.zeros( q[0].shape )
     e = np.ones ( q[0].shape )
-    J = np.empty( (2,2), dtype=object )
+    J = new_matrix( q, 2 )
     
     # Jacobian matrix
     J[0,:] = [           o,      e ]
@@ -85,21 +85,38 @@ class ShallowWater1D (Flux1D):
     
     return J
   
+  #-----------------------------------------------------------------------------
+  def Jv (self, q, v):
+    """ Directional derivative of flux function: J(q) v (see Flux1D). """
+    
+    # Rename conserved quantities
+    [h, hu] = q
+    
+    # Mass-averaged velocity [m/s]
+    u = hu/h
+    
+    # Rows of Jacobian matrix applied to v
+    r = new_vector( q, 2 )
+    r[0] = v[1].copy()
+    r[1] = (self._g*h - u**2)*v[0] + 2.0*u*v[1]
+    
+    return r
+  
   #-----------------------------------------------------------------------------
   def eig (self, q):
     """ Compute eigenvalues of Jacobian matrix J. """
-
+    
     # Rename conserved quantities
     [h, hu] = q
     
     # Mass-averaged velocity [m/s]
     u = hu/h
-        
+    
     # Useful temporary variables
     sq_gh  = np.sqrt( self._g*h )
-
+    
     # Eigenvalues
-    eig = np.empty( 2, dtype=object )
+    eig = new_vector( q, 2 )
     eig[:] = [ u - sq_gh, u + sq_gh ]
     
     return eig
@@ -107,20 +124,20 @@ class ShallowWater1D (Flux1D):
   #-----------------------------------------------------------------------------
   def R (self, q):
     """ Matrix having the right eigenvectors of J as columns. """
-
+    
     # Rename conserved quantities
     [h, hu] = q
     
     # Mass-averaged velocity [m/s]
     u = hu/h
-        
+    
     # Useful temporary variables
     sq_gh  = np.sqrt( self._g*h )
-
-   
+    
+    
     # Data structure for matrix R of numpy arrays
     e = np.ones ( q[0].shape )
-    R = np.empty( (2,2), dtype=object )
+    R = new_matrix( q, 2 )
     
     # Right eigenvectors of J (along columns)
     R[0,:] = [         e,          e ]
@@ -131,19 +148,19 @@ class ShallowWater1D (Flux1D):
   #-----------------------------------------------------------------------------
   def L (self, q):
     """ Matrix having the left eigenvectors of J as rows; L = inv(R). """
-
+    
     # Rename conserved quantities
     [h, hu] = q
     
     # Mass-averaged velocity [m/s]
     u = hu/h
-        
+    
     # Useful temporary variables
     g      = self._g
     sq_gh  = np.sqrt( self._g*h )
-
+    
     # Data structure for matrix L of numpy arrays
-    L = np.empty( (2,2), dtype=object )
+    L = new_matrix( q, 2 )
     
     # Left eigenvectors of J (along rows)
     L[0,:] = [ 0.5*(sq_gh+u)/sq_gh,   -0.5/sq_gh    ]
@@ -151,14 +168,82 @@ class ShallowWater1D (Flux1D):
     
     return L
   
+  #-----------------------------------------------------------------------------
+  def eigensystem (self, q, flux=True):
+    """ Fused evaluation of [f, R, L, eig, MaxWaveSpeed] (see Flux1D). """
+    
+    # Rename conserved quantities
+    [h, hu] = q
+    
+    # Primitive variables, computed only once
+    g     = self._g
+    u     = hu/h
+    sq_gh = np.sqrt( g*h )
+    
+    # Flux
+    if flux:
+      f = new_vector( q, 2 )
+      f[0] = hu.copy()
+      f[1] = h*(u**2) + 0.5*g*(h**2)
+    else:
+      f = None
+    
+    return [ f ] + self._decomposition( q, u, sq_gh )
+  
+  #-----------------------------------------------------------------------------
+  def roe_eigensystem (self, qL, qR):
+    """ Eigensystem [None, R, L, eig, MaxWaveSpeed] at the Roe average of qL
+        and qR (see Flux1D), evaluated in a single pass.
+    """
+    
+    # Rename conserved quantities
+    [hL, huL] = qL
+    [hR, huR] = qR
+    
+    # Roe averages: arithmetic mean of h, sqrt(h)-weighted mean of velocity
+    sL    = np.sqrt( hL )
+    sR    = np.sqrt( hR )
+    u     = (huL/sL + huR/sR) / (sL+sR)
+    sq_gh = np.sqrt( 0.5*self._g*(hL+hR) )
+    
+    return [ None ] + self._decomposition( qL, u, sq_gh )
+  
+  #-----------------------------------------------------------------------------
+  def _decomposition (self, q, u, sq_gh):
+    """
+    Return [R, L, eig, MaxWaveSpeed], given velocity u and wave celerity
+    sqrt(g*h) at the states (arrays with the layout of q).
+    
+    """
+    # Eigenvalues
+    eig = new_vector( q, 2 )
+    eig[:] = [ u - sq_gh, u + sq_gh ]
+    
+    # Right eigenvectors of J (along columns)
+    e = np.ones ( q[0].shape )
+    R = new_matrix( q, 2 )
+    R[0,:] = [      e,      e ]
+    R[1,:] = [ eig[0], eig[1] ]
+    
+    # Left eigenvectors of J (along rows)
+    L = new_matrix( q, 2 )
+    L[0,:] = [ 0.5*(sq_gh+u)/sq_gh,   -0.5/sq_gh    ]
+    L[1,:] = [ 0.5*(sq_gh-u)/sq_gh,    0.5/sq_gh    ]
+    
+    # Maximum wave speed
+    vmax = np.maximum( abs( np.amin( eig[0], axis=-1 ) ),
+                       abs( np.amax( eig[1], axis=-1 ) ) )
+    
+    return [ R, L, eig, vmax ]
+  
   #-----------------------------------------------------------------------------
   def MaxWaveSpeed (self, q):
     """ Maximum wave speed in the range of values for q. """
     
     eig  = self.eig(q)
-    vmin = min(eig[0])
-    vmax = max(eig[1])
+    vmin = np.amin(eig[0],axis=-1)
+    vmax = np.amax(eig[1],axis=-1)
     
-    return max(abs(vmin),abs(vmax)) 
+    return np.maximum(abs(vmin),abs(vmax))
     
 #===============================================================================
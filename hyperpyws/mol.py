@@ -18,48 +18,10 @@
 
 import numpy as np
 
-#===============================================================================
-
-class Slice (object):
-  """
-  Temporary object that permits us to apply slicing to each (array) 
-  component of a numpy array of 'object' type.
-  
-  Parameters
-  ----------
-  arr : numpy.ndarray
-    Multidimensional Numpy array of dtype=object
-    
-  """
-  def __init__(self, arr):
-    # Store reference to input array, and create empty array
-    self._arr = arr
-    self._res = np.empty( arr.shape, dtype=object )
-  
-  #-----------------------------------------------------------------------------
-  def __getitem__(self, *c):
-    """
-    Pass slice to each array component of the array of objects.
-    
-    Parameters
-    ----------
-    c : list of 'slice' objects
-      Slices to be applied to each component of the chosen array
-    
-    Returns
-    -------
-    res : numpy.ndarray
-      Multidimensional array that contains the required slices
-    
-    """
-    # Create flat iterators
-    a = self._arr.flat
-    r = self._res.flat
-    # Cycle over each array component
-    for i,a in enumerate(a):
-      r[i] = a.__getitem__(*c)
-    # Return array with slices
-    return self._res
+from .workspace import Workspace
+from .stencil   import StencilView
+from .flux      import as_dense
+from .wave_speed import WaveSpeed
 
 #===============================================================================
 
@@ -68,6 +30,17 @@ class MOL(object):
   Class for 'Method Of Lines' objects, which calculate the time derivative of 
   the solution, and higher time derivatives if possible.
   
+  The algorithm operates on whole (meq,N) blocks of floats.  If the solution is
+  stored as an array of objects (one array per component), it is first copied 
+  into a contiguous scratch array, and the results are returned as arrays of 
+  objects again.
+  
+  If the grid holds an ensemble of K solutions, stored as a (K,meq,N) array,
+  all members are advanced together: the algorithm operates on the (meq,K,N)
+  view of the state, so that each component is a (K,N) array for the model 
+  equations (whose parameters may have one value per member), and the time 
+  derivatives are returned as (K,meq,N) arrays.
+  
   Parameters
   ----------
   grid : Grid1D
@@ -79,125 +52,414 @@ class MOL(object):
   
   weno : WenoReconstruction
     Object performing conservative recontruction of u[i] over stencil
-    
+  
+  reuse : bool
+    If True, return time derivatives in buffers that are overwritten at the 
+    next call (only for contiguous storage); the caller must consume them first
+  
+  componentwise : bool
+    If True, reconstruct the split fluxes directly in conserved variables:
+    the eigenvectors R and L are not computed, and the projections onto the
+    characteristic fields are skipped (cheaper, but less robust at shocks).
+    Projections are always skipped for scalar models, and for models whose 
+    eigenvectors are the identity (see Flux1D.identity_eigenvectors): unless
+    componentwise is given, the splitting speeds are still computed at the 
+    interfaces, and the results are then the same.
+  
+  analytic_speed : bool
+    If True, use the analytic bound of the maximum wave speed provided by the
+    model equations (see Flux1D.MaxWaveSpeedBound), for both the time-step 
+    selection and the global flux splitting.
+  
+  splitting : str
+    Speed alpha of the Lax-Friedrichs flux splitting f = (f + alpha q)/2 + 
+    (f - alpha q)/2, in characteristic variables:
+      'global' : maximum wave speed over the whole grid (default);
+      'field'  : largest |eigenvalue| of each characteristic field, over all
+                 interfaces;
+      'local'  : largest |eigenvalue| of each characteristic field, over the
+                 stencil cells of each interface.
+    The last two options add less dissipation away from the fastest waves.
+    In component-wise mode the largest eigenvalue of all fields is used.
+  
+  average : str
+    Interface state where the characteristic decomposition is computed:
+      'arithmetic' : mean of the two neighboring cells (default);
+      'roe'        : Roe average, for models that provide it (see 
+                     Flux1D.roe_eigensystem), which is evaluated in the same
+                     pass as the eigensystem.
+    Not used in component-wise mode.
+  
+  For linear fluxes with constant eigensystem (see Flux1D.constant_eigensystem)
+  the projection matrices and the maximum wave speed are computed only once,
+  and each projection is a single product with a constant (meq,meq) matrix.
+  
+  The maximum wave speed computed by MaxWaveSpeed(q,t) for the CFL condition
+  is cached, and reused by the global Lax-Friedrichs splitting at the next 
+  evaluation of the time derivatives at (q,t), i.e. at the first stage of the
+  time-step (see WaveSpeed), where the speed is computed over all cells: in 
+  component-wise mode, or with analytic_speed.
+  
   """
-  def __init__(self, grid, flux, weno, SetBCs):
+  splittings = ('global', 'field', 'local')
+  averages   = ('arithmetic', 'roe')
+  
+  def __init__(self, grid, flux, weno, SetBCs, reuse=False,
+               componentwise=False, analytic_speed=False, splitting='global',
+               average='arithmetic'):
     
     # Store references
     self._grid = grid
     self._flux = flux
     self._weno = weno
     self._SetBCs = SetBCs
+    self._reuse  = reuse
+    self._componentwise = componentwise or flux.identity_eigenvectors
+    self._identity = flux.identity_eigenvectors and not componentwise
+    self._speed = WaveSpeed( flux, analytic_speed )
+    
+    if reuse and not grid.contiguous:
+      raise ValueError('reuse=True requires contiguous storage in grid')
+    
+    if splitting not in self.splittings:
+      raise ValueError('splitting must be one of {}'.format( self.splittings ))
+    self._splitting = splitting
+    
+    if average not in self.averages:
+      raise ValueError('average must be one of {}'.format( self.averages ))
+    self._roe = (average == 'roe')
+    
+    # Pre-processing: WENO5 reconstructs f[i-1/2] using extended stencil 
+    # [-3,-2,-1, 0,+1,+2]; geometry of shifted windows is computed only once
+    extended_stencil = [ weno.stencil[0]-1 ] + weno.stencil
+    self._stencil = StencilView( extended_stencil, grid.mx, grid.mbc )
+    
+    # Ensemble: extra axis of K members after the component index
+    K = grid.members
+    self._E = (K,) if K is not None else ()
+    
+    # Linear flux: constant projection matrices and maximum wave speed
+    eigsys = flux.constant_eigensystem()
+    self._linear = eigsys is not None
+    if self._linear:
+      R, L, lam = [ np.asarray( a, dtype=float ) for a in eigsys ]
+      self._R0     = R
+      self._L0     = L
+      if splitting == 'global':
+        self._alpha0 = 1.1 * np.amax( abs( lam ), axis=0 )
+      else:
+        # Constant speed of each field, broadcasting against (meq,[K],N);
+        # component-wise, the largest one of all fields (as in _field_speed)
+        lam = lam.reshape( lam.shape + (1,)*(2+len( self._E )-lam.ndim) )
+        self._alpha0 = 1.1 * abs( lam )
+        if self._componentwise:
+          self._alpha0 = np.amax( self._alpha0, axis=0, keepdims=True )
+    
+    # Pre-processing: scratch arrays
+    self._ws = Workspace()
+    self._allocate_workspace()
+  
+  #-----------------------------------------------------------------------------
+  def _allocate_workspace (self):
+    """
+    Create all scratch arrays used by qt() and qtt(), with sizes given by the
+    grid (mx, mbc, meq) and by the WENO stencil.
+    
+    """
+    mx  = self._grid.mx
+    mbc = self._grid.mbc
+    meq = self._grid.meq
+    
+    N   = mx+1                        # number of interfaces
+    Nt  = mx+2*mbc                    # number of cells (with ghosts)
+    nsh = self._stencil.width         # number of shifts in extended stencil
+    E   = self._E                     # ensemble axis (if any)
+    
+    ws = self._ws
+    if self._identity or not (self._componentwise or self._roe):
+      ws.get( 'qs', (     meq,)+E+(N, ) )  # averages at interfaces
+    if not self._componentwise:
+      ws.get( 'ww', ( nsh,meq)+E+(N, ) )  # characteristic variables, all shifts
+      ws.get( 'gg', ( nsh,meq)+E+(N, ) )  # characteristic fluxes   , all shifts
+    ws.get( 'gg_m', (nsh-1,meq)+E+(N,) )  # split fluxes (right-going)
+    ws.get( 'gg_p', (nsh-1,meq)+E+(N,) )  # split fluxes (left-going)
+    ws.get( 'ghat', (     meq,)+E+(N, ) )  # reconstructed characteristic fluxes
+    if not self._componentwise:
+      ws.get( 'fhat', (   meq,)+E+(N, ) )  # numerical fluxes at interfaces
+    if self._splitting == 'local':
+      ws.get( 'alpha', (  meq,)+E+(N, ) )  # splitting speeds at interfaces
+    ws.get( 'q_t' , (     meq,)+E+(Nt,) )  # 1st time derivative
+    ws.get( 'q_tt', (     meq,)+E+(Nt,) )  # 2nd time derivative
+    
+    # Contiguous copies of input arrays of objects
+    if not self._grid.contiguous:
+      ws.get( 'q_in'  , ( meq, Nt ) )
+      ws.get( 'q_t_in', ( meq, Nt ) )
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def allocations (self):
+    """
+    Number of scratch arrays allocated so far by the MOL workspace.  This does
+    not include the temporary arrays created by the flux functions and by the
+    WENO reconstruction at each call.
+    
+    """
+    return self._ws.allocations
+  
+  #-----------------------------------------------------------------------------
+  def _output (self, name):
+    """ Return scratch array, or a copy of it if buffers are not reused. """
+    out = self._swap( self._ws[name] )
+    if self._reuse:
+      return out
+    else:
+      return self._ws.copy( out )
+  
+  def _swap (self, q):
+    """ Swap component and member axes of an ensemble state (view). """
+    return q.swapaxes(0,1) if self._E else q
+  
+  #-----------------------------------------------------------------------------
+  def _as_block (self, q, name):
+    """ Copy array of objects q into contiguous scratch array 'name'. """
+    qb = self._ws[name]
+    for m,qm in enumerate( q ):
+      qb[m] = qm
+    return qb
+  
+  @staticmethod
+  def _as_objects (qb):
+    """ Return array of objects, whose components are rows of qb. """
+    q = np.empty( qb.shape[0], dtype=object )
+    for m,qm in enumerate( qb ):
+      q[m] = qm
+    return q
+  
+  def _project (self, M, x, out):
+    """
+    Matrix-vector products out[s,i,n] = sum_j M[i,j,n] x[s,j,n], for all 
+    stencil shifts s (if any) and interfaces n.  A constant (meq,meq) matrix 
+    is applied to the whole block by a single matrix product.
+    
+    """
+    if M.ndim == 2 and not self._E:
+      np.matmul( M, x, out=out )
+    else:
+      s   = 's' if x.ndim == len( self._E )+3 else ''
+      idx = 'ij' if M.ndim == 2 else 'ij...'
+      np.einsum( idx+','+s+'j...->'+s+'i...', M, x, out=out )
+    return out
+  
+  #-----------------------------------------------------------------------------
+  def MaxWaveSpeed (self, q, t):
+    """
+    Maximum wave speed of solution vector q at time t (one value per ensemble
+    member, if any), after applying the boundary conditions.  The value is 
+    cached, and reused by the next call to qt(q,t) with the same q and t.
+    
+    """
+    self._SetBCs(self._swap(q),t)
+    vmax = self._speed.evaluate( self._swap(q) )
+    self._speed.share( vmax, q, t )
+    return vmax
+  
+  #-----------------------------------------------------------------------------
+  def qt (self, q, t=None):
+    """ Compute first time-derivative of solution vector (at time t, if given,
+        in order to reuse the maximum wave speed cached by MaxWaveSpeed).
+    """
+    vmax = self._speed.shared( q, t )
+    if self._grid.contiguous:
+      return self._qt_block( self._swap(q), vmax )
+    else:
+      qb = self._as_block(q,'q_in')
+      return self._as_objects( self._qt_block( qb, vmax ) )
+  
+  #-----------------------------------------------------------------------------
+  def qtt (self, q, q_t):
+    """
+    Compute second time-derivative of solution vector, as
+    q_{tt} = -[ f(q)_t ]_x = -[ f'(q) q_t ]_x.
+    
+    Using centered finite differences we get
+    -1/12 *( f_t[i-2] - 8 f_t[i-1] + 8 f_t[i+1] - f_t[i+2] ),
     
-    # Pre-processing
-    # (?)
+    where f_t[i] = f'[i] * q_t[i] is given by Flux1D.Jv, without building the
+    Jacobian matrix.  q_t[i] is computed by the previous function.
+    
+    """
+    if self._grid.contiguous:
+      return self._qtt_block( self._swap(q), self._swap(q_t) )
+    else:
+      qb   = self._as_block( q  , 'q_in'   )
+      q_tb = self._as_block( q_t, 'q_t_in' )
+      return self._as_objects( self._qtt_block( qb, q_tb ) )
   
   #-----------------------------------------------------------------------------
-  def qt (self, q):
-    """ Compute first time-derivative of solution vector.
+  def _qt_block (self, q, vmax=None):
+    """
+    Compute first time-derivative of solution vector, stored as a contiguous 
+    (meq,N) array of floats (or as a (meq,K,N) view for an ensemble).  Each 
+    step operates on all components at once, and every intermediate result is
+    written into the preallocated workspace.  The maximum wave speed vmax is
+    computed here if not given.
+    
     """
     # Rename variables
     dx  = self._grid.dx
     mx  = self._grid.mx
     mbc = self._grid.mbc
-    meq = self._grid.meq    
+    ws  = self._ws
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-    # Step 1: Compute Roe averages
+    # Step 1: Compute averages at interfaces (simple algebraic averages), where
+    #         the characteristic projections are computed; Roe averages are 
+    #         computed together with the eigensystem in Step 2
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    # Index with single ghost cell on left   [--> move to preprocessing?]
     Im1 = slice( mbc-1, (mbc+mx-1)+1 )
-    
-    # Index with single ghost cell on right  [--> move to preprocessing?]
     I   = slice( mbc  , (mbc+mx  )+1 )
-        
-    # Simple algebraic averages for now
-    qs  = np.empty( meq, dtype=object )
-    for m in range(meq):
-      qs[m] = 0.5*( q[m][Im1] + q[m][I] )
+    if not self._linear and \
+       (self._identity or not (self._componentwise or self._roe)):
+      qs  = ws['qs']
+      np.add( q[...,Im1], q[...,I], out=qs )
+      qs *= 0.5
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-    # Step 2: Compute eigen-decomposition of Jacobian (projection matrices)
-    #         and maximum wave speed in domain, using averages
+    # Step 2: Projection matrices (meq,meq,N) and splitting speed
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    R     = self._flux.R (qs)
-    L     = self._flux.L (qs)
-    alpha = 1.1 * self._flux.MaxWaveSpeed( qs )
+    if self._linear:
+      R     = self._R0          # constant (meq,meq) matrices
+      L     = self._L0
+      alpha = self._alpha0
+    else:
+      eig = None
+      if self._identity:
+        # Identity eigenvectors: eigenvalues at the interface averages only,
+        # so that the splitting speeds are those of the characteristic path
+        if self._splitting == 'field':
+          eig = self._flux.eig( qs )
+        elif self._splitting == 'global' and not self._speed.analytic:
+          vmax = self._flux.MaxWaveSpeed( qs )
+      elif not self._componentwise:
+        if self._roe:
+          # Fused evaluation at the Roe averages of neighboring cells
+          es = self._flux.roe_eigensystem( q[...,Im1], q[...,I] )
+          if es is None:
+            raise ValueError('Model equations do not provide Roe averages')
+        else:
+          # Fused evaluation: primitive variables are computed only once
+          es = self._flux.eigensystem( qs, flux=False )
+        fs, R, L, eig, vs = es
+        R     = as_dense( R )
+        L     = as_dense( L )
+        if not self._speed.analytic:
+          vmax = vs
+      # Global Lax-Friedrichs: speed bound over all cells (possibly cached)
+      if vmax is None and self._splitting == 'global':
+        vmax = self._speed.evaluate( q )
+      if self._splitting == 'global':
+        alpha = 1.1 * vmax
+        if self._E:
+          alpha = alpha[:,None]   # one value per ensemble member
+      else:
+        alpha = self._field_speed( q, eig )
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Step 3: Project q[i+s] and f[i+s] over local characteristic variables at 
-    #         location x[i], for each point x[i+s] in stencil
+    #         location x[i-1/2], for each point x[i+s] in stencil
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    # WENO5 reconstructs f[i-1/2] using stencil [-3,-2,-1, 0,+1,+2]
     f  = self._flux.f(q)
     
-    # Stencils  [--> move to preprocessing?]
-    extended_stencil = [ self._weno.stencil[0]-1 ] + self._weno.stencil
-    S  = [ slice( mbc+sh, (mbc+mx+sh)+1 ) for sh in extended_stencil ]
-        
-    # Shift q and f according to stencil
-    qq = [ Slice(q)[Si] for Si in S ]  # for now, slice on 2D array
-    ff = [ Slice(f)[Si] for Si in S ]  # for now, slice on 2D array
+    # Strided (nsh,meq,N) views of q and f: no data is copied here
+    qq = self._stencil( q )
+    ff = self._stencil( f )
     
-    # Project onto characteristic variables: q -> w, f -> g
-    ww = [ np.dot(L,qi) for qi in qq ]
-    gg = [ np.dot(L,fi) for fi in ff ]
+    # Batched small-matrix products over all shifts s and interfaces n (and
+    # ensemble members): w[s,i,n] = sum_j L[i,j,n] q[s,j,n]
+    if self._componentwise:
+      ww = qq                    # component-wise: no projection
+      gg = ff
+    else:
+      ww = self._project( L, qq, ws['ww'] )
+      gg = self._project( L, ff, ws['gg'] )
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-    # Step 4: Flux-splitting and WENO reconstruction
+    # Step 4: Flux-splitting and WENO reconstruction (all fields at once)
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    ghat = np.empty( meq, dtype=object )
-    for m in range(meq):
-      
-      # TODO: can add in an alpha[me] as well if we choose ...
-      
-      # Flux splitting
-      gg_m = [ 0.5*(gi[m]-alpha*wi[m]) for gi,wi in zip(gg[1 :],ww[1 :]) ]
-      gg_p = [ 0.5*(gi[m]+alpha*wi[m]) for gi,wi in zip(gg[:-1],ww[:-1]) ]
-      
-      # Weno reconstruction
-      gm = self._weno.reconstruct_right (*gg_m)
-      gp = self._weno.reconstruct_left  (*gg_p)
-      
-      # Sum right and left fluxes
-      ghat[m] = gp + gm
+    gg_m = ws['gg_m']
+    np.multiply( ww[1:], -alpha, out=gg_m )
+    gg_m += gg[1:]
+    gg_m *= 0.5
+    
+    gg_p = ws['gg_p']
+    np.multiply( ww[:-1], alpha, out=gg_p )
+    gg_p += gg[:-1]
+    gg_p *= 0.5
+    
+    ghat = ws['ghat']
+    np.add( self._weno.reconstruct_left_stacked ( gg_p ),
+            self._weno.reconstruct_right_stacked( gg_m ), out=ghat )
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Step 5: Project flux values back onto conserved variables
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    fhat = np.dot(R,ghat)
+    if self._componentwise:
+      fhat = ghat
+    else:
+      fhat = self._project( R, ghat, ws['fhat'] )
     
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Step 6: Compute d/dt(q[i]) according to conservative finite-differences
+    #         (ghost cells are set to zero)
     #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-        
-    c   = -1.0/dx
-    q_t =  0.0*q
-    for m in range(meq):
-      q_t[m][mbc:mbc+mx] = c * ( fhat[m][1:] - fhat[m][:-1] )
     
-    return q_t
+    q_t = ws['q_t']
+    q_t[...,:mbc]    = 0.0
+    q_t[...,mbc+mx:] = 0.0
+    np.subtract( fhat[...,1:], fhat[...,:-1], out=q_t[...,mbc:mbc+mx] )
+    q_t[...,mbc:mbc+mx] *= -1.0/dx
+    
+    return self._output( 'q_t' )
   
   #-----------------------------------------------------------------------------
-  def qtt (self, q, q_t):
+  def _field_speed (self, q, eig):
     """
-    Compute second time-derivative of solution vector, as
-    q_{tt} = -[ f(q)_t ]_x = -[ f'(q) q_t ]_x.
+    Splitting speed of each characteristic field, for the 'field' and 'local'
+    splittings: largest |eigenvalue| over all interfaces (where eig is given, 
+    or else over all cells), or over the stencil cells of each interface.  
+    The result broadcasts against the (nsh,meq,N) characteristic variables.
     
-    Using centered finite differences we get
-    -1/12 *( f_t[i-2] - 8 f_t[i-1] + 8 f_t[i+1] - f_t[i+2] ),
-    
-    where f_t[i] = f'[i] * q_t[i].  q_t[i] is computed by the previous function.
+    """
+    if self._splitting == 'field' and eig is not None:
+      alpha = np.amax( abs( as_dense( eig ) ), axis=-1, keepdims=True )
+    else:
+      lam = abs( as_dense( self._flux.eig( q ) ) )
+      if self._splitting == 'field':
+        alpha = np.amax( lam, axis=-1, keepdims=True )
+      else:
+        alpha = np.amax( self._stencil( lam ), axis=0, out=self._ws['alpha'] )
+    
+    # Component-wise: split variables are not characteristic, use all fields
+    if self._componentwise:
+      alpha = np.amax( alpha, axis=0, keepdims=True )
+    
+    alpha *= 1.1
+    return alpha
+  
+  #-----------------------------------------------------------------------------
+  def _qtt_block (self, q, q_t):
+    """
+    Compute second time-derivative of solution vector, stored as a contiguous
+    (meq,N) array of floats (see qtt).
     
     """
-
     # TODO:
-    # Q0: q_t as input parameter?
     # Q1: Set boundary on q_t ??
     # Q2: How to get appropriate FD approximation for given order of accuracy?
     
@@ -205,9 +467,8 @@ class MOL(object):
     dx  = self._grid.dx
     mx  = self._grid.mx
     mbc = self._grid.mbc
-    meq = self._grid.meq
     
-    # Stencils  [--> move to preprocessing?]    
+    # Stencils
     a,b = mbc, mbc+mx
     Im2 = slice( a-2, b-2 )
     Im1 = slice( a-1, b-1 )
@@ -215,19 +476,21 @@ class MOL(object):
     Ip1 = slice( a+1, b+1 )
     Ip2 = slice( a+2, b+2 )
     
-    # Compute time derivative of flux function
-    ft = np.dot( self._flux.J(q), q_t )
+    # Compute time derivative of flux function: f_t = J(q) q_t
+    ft = self._flux.Jv( q, q_t )
     
     # Compute 2nd time derivative of state vector by differentiating ft in space
-    c   = -1.0/(12.*dx)
-    q_tt = 0.0*q_t
-    for m in range(meq):
-      q_tt[m][I] = c *( ft[m][Im2] - 8.*(ft[m][Im1] - ft[m][Ip1]) - ft[m][Ip2] )
-    
-    return q_tt
+    q_tt = self._ws['q_tt']
+    np.subtract( ft[...,Im1], ft[...,Ip1], out=q_tt[...,I] )
+    q_tt[...,I] *= 8.
+    np.subtract( ft[...,Im2], q_tt[...,I], out=q_tt[...,I] )
+    q_tt[...,I] -= ft[...,Ip2]
+    q_tt[...,I] *= -1.0/(12.*dx)
+    
+    return self._output( 'q_tt' )
   
   #-----------------------------------------------------------------------------
-  def TimeDerivatives (self, q, t):
+  def TimeDerivatives (self, q, t, nderiv=2):
     """
     Compute 1st and 2nd time-derivatives of solution vector:
       1. Apply boundary conditions to solution (may depend on t);
@@ -236,25 +499,49 @@ class MOL(object):
       4. Compute qtt(q,qt);
       5. Return [ qt, qtt].
     
+    Steps 3 and 4 are skipped if only the 1st derivative is requested.
+    
     Parameters
     ----------
     q : array-like
       Solution vector at time t
     t : float
       Time instant
+    nderiv : int
+      Number of time derivatives to be computed (1 or 2)
     
     Returns
     -------
     r : list
       [qt,qtt] - 1st and 2nd time-derivatives of solution vector q
+      (or [qt] if nderiv=1)
     
     """
-    self._SetBCs(q,t)        # Apply boundary conditions 
-    q_t  = self.qt (q)       # Compute 1st time derivative
-
-    self._SetBCs(q_t,t)      # Apply boundary conditions (on q_t)  (<<< TODO)
+    self._SetBCs(self._swap(q),t)    # Apply boundary conditions 
+    q_t  = self.qt (q,t)             # Compute 1st time derivative
+    
+    if nderiv == 1:
+      return [q_t]
+    
+    self._SetBCs(self._swap(q_t),t)  # Apply BCs (on q_t)  (<<< TODO)
     q_tt = self.qtt(q, q_t)  # Compute 2nd time derivative
-
+    
     return [q_t, q_tt]
   
+  #-----------------------------------------------------------------------------
+  def RHS (self, nderiv):
+    """
+    Return right-hand side function F(q,t) for a time integrator that requires 
+    'nderiv' time derivatives of the solution:
+      nderiv=1 : F(q,t) returns qt;
+      nderiv=2 : F(q,t) returns [qt,qtt].
+    
+    """
+    if nderiv == 1:
+      return lambda q,t : self.TimeDerivatives(q,t,1)[0]
+    elif nderiv == 2:
+      return self.TimeDerivatives
+    else:
+      raise ValueError('Only 1 or 2 time derivatives are available')
+  
 #===============================================================================
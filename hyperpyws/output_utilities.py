@@ -88,6 +88,12 @@ class TextDB (object):
     """
     self._ostream.write(self._template.format(*data))
   
+  #-----------------------------------------------------------------------------
+  def flush (self):
+    """ Flush database file stream, so that all lines written are on disk.
+    """
+    self._ostream.flush()
+  
   #-----------------------------------------------------------------------------
   def close (self):
     """ Close database file stream.
@@ -0,0 +1,302 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+"""
+This module runs independent simulations concurrently in a pool of worker
+processes.  Each job is described by picklable data only (path of test-case
+file or TestCaseSpec, WENO order and version, name of time integrator, CFL
+number, number of cells): the worker imports the test-case file (or builds the
+test case from its specification) by itself, runs the simulation and returns
+the error norms.  Jobs are scheduled largest-first, and the total
+memory estimated for the running jobs is kept below a given budget.
+
+"""
+
+__all__ = ['RefinementJob', 'LoadTestSpec', 'LoadTestCase', 'RunRefinementJob',
+           'RunJobs']
+__docformat__ = 'reStructuredText'
+
+import os, time
+import numpy as np
+
+#===============================================================================
+# CLASS: refinement job
+#===============================================================================
+
+class RefinementJob (object):
+  """
+  Description of a single simulation in a refinement study.
+  
+  Parameters
+  ----------
+  path : str or TestCaseSpec
+    Path of input file containing test-case definition (DefineTestSpec or
+    DefineTestCase), or test-case specification.
+  order : int
+    Order of WENO reconstruction.
+  version : str
+    WENO version ('JS', 'Z', 'CFD').
+  stepper : str
+    Name of registered time integrator.
+  CFL : float
+    CFL number (None for the safe CFL number of the integrator).
+  mx : int
+    Number of cells.
+  meq : int
+    Number of equations (used for the memory estimate only).
+  contiguous : bool
+    Store solution as a single contiguous array.
+  
+  """
+  __slots__ = ['path','order','version','stepper','CFL','mx','meq',
+               'contiguous']
+  
+  def __init__(self, path, order, version, stepper, CFL, mx, meq=1,
+               contiguous=False):
+    if isinstance( path, str ):
+      path = os.path.abspath( path )
+    self.path       = path
+    self.order      = order
+    self.version    = version
+    self.stepper    = stepper
+    self.CFL        = CFL
+    self.mx         = mx
+    self.meq        = meq
+    self.contiguous = contiguous
+  
+  # Pickling of objects with __slots__ (needed by Python 2)
+  def __getstate__(self):
+    return [getattr( self, s ) for s in self.__slots__]
+  
+  def __setstate__(self, state):
+    for s,v in zip( self.__slots__, state ):
+      setattr( self, s, v )
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def tag (self):
+    """ Short name of numerical variant, e.g. '5Z_rk4'. """
+    return '{:d}{:s}_{:s}'.format( self.order, self.version, self.stepper )
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def key (self):
+    """
+    Content hash of the job (test case and numerical parameters), to be used
+    for caching its results.  Only available for test cases with a
+    declarative specification.
+    
+    """
+    spec = LoadTestSpec( self.path )
+    return spec.hash( self.order, self.version, self.stepper, self.CFL,
+                      self.mx, self.contiguous )
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def memory (self):
+    """
+    Estimated memory of the simulation [bytes], in units of state-sized
+    arrays: the MOL workspace holds 4*w+3 of them (w = width of the extended
+    stencil), the flux functions and the WENO reconstruction create about as
+    many temporaries at each evaluation (see apps/benchmarks/mol_workspace.py),
+    the time integrator keeps up to 10 more (stages and registers), and the
+    dense eigenvector matrices R and L add 2*meq.
+    
+    """
+    w    = self.order + 1
+    mbc  = (self.order + 1) // 2
+    nvec = 2*(4*w + 3) + 10 + 2*self.meq
+    return 8 * nvec * self.meq * (self.mx + 2*mbc)
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def cost (self):
+    """
+    Relative computational cost: (number of steps) x (number of cells) x
+    (stencil width) x (RHS evaluations per step).  For two-derivative
+    integrators, the second time derivative (flux Jacobian-vector product and
+    central differences) adds the cost of about half a stencil point to each
+    evaluation (measured: 5-10% for WENO5/7).
+    
+    """
+    from .time_integrators import get_stepper
+    info   = getattr( get_stepper( self.stepper ), 'info', None )
+    stages = info.stages if info is not None else 1
+    nderiv = info.nderiv if info is not None else 1
+    width  = (self.order+1) + 0.5*(nderiv-1)
+    return float( self.mx )**2 * width * stages
+
+#===============================================================================
+# FUNCTIONS: run a single job (in a worker process)
+#===============================================================================
+
+def _ImportTestFile( path ):
+  """ Import input file as module, by path (only once per process). """
+  from .case_spec import ImportFile
+  return ImportFile( path )
+
+#-------------------------------------------------------------------------------
+def LoadTestSpec( path ):
+  """
+  Return test-case specification: path is either a TestCaseSpec object, or
+  the path of an input file that defines the function DefineTestSpec().
+  
+  """
+  from .case_spec import TestCaseSpec
+  
+  if isinstance( path, TestCaseSpec ):
+    return path
+  
+  module = _ImportTestFile( path )
+  if not hasattr( module, 'DefineTestSpec' ):
+    raise ValueError( 'Test case has no declarative specification: {}'\
+                      .format( path ))
+  return module.DefineTestSpec()
+
+#-------------------------------------------------------------------------------
+def LoadTestCase( path ):
+  """
+  Return test-case object: path is either a TestCaseSpec object, or the path
+  of an input file, whose function DefineTestCase() is called.
+  
+  """
+  from .case_spec import TestCaseSpec
+  
+  if isinstance( path, TestCaseSpec ):
+    return path.build()
+  
+  return _ImportTestFile( path ).DefineTestCase()
+
+#-------------------------------------------------------------------------------
+def RunRefinementJob( job ):
+  """
+  Run simulation described by job, and return (relative) L1, L2 and L-inf
+  norms of the error at final time, for each component of the solution.
+  
+  Returns
+  -------
+  norms : list of tuple
+    [(L1,L2,Li)] for each component of the state vector.
+  wall : float
+    Wall-clock time of simulation [s].
+  
+  """
+  from .simulation       import Numerics, RunSimulation
+  from .weno_versions    import Weno
+  from .time_integrators import get_stepper
+  
+  test = LoadTestCase( job.path )
+  if test.qexact is None:
+    raise ValueError( 'Test case has no exact solution: {}'.format( job.path ))
+  
+  numr            = Numerics()
+  numr.weno       = Weno( job.order, job.version )
+  numr.stepper    = get_stepper( job.stepper )
+  numr.CFL        = job.CFL
+  numr.mx         = job.mx
+  numr.contiguous = job.contiguous
+  
+  t0   = time.time()
+  grid = RunSimulation( test, numr )
+  wall = time.time() - t0
+  
+  norms = []
+  for exact, qi in zip( test.qexact( grid.xint, test.tend ), grid.qint ):
+    
+    # Norms of exact solution
+    L1_ex = np.sum (abs ( exact ))   *grid.dx
+    L2_ex = np.sqrt(sum(( exact )**2)*grid.dx)
+    Li_ex = np.amax(abs ( exact ))
+    
+    # Relative norms of error
+    Err = exact - qi
+    L1  = np.sum (abs (Err))   *grid.dx  / L1_ex
+    L2  = np.sqrt(sum((Err)**2)*grid.dx) / L2_ex
+    Li  = np.amax(abs (Err))             / Li_ex
+    
+    norms.append( (float(L1), float(L2), float(Li)) )
+  
+  return norms, wall
+
+#===============================================================================
+# FUNCTION: schedule jobs in process pool
+#===============================================================================
+
+def RunJobs( jobs, callback, nproc=None, memory=None, func=RunRefinementJob,
+             poll=0.02 ):
+  """
+  Run all jobs in a pool of nproc worker processes, largest-first (according
+  to job.cost).  A job is started only if a worker is free and if the total
+  memory estimated for the running jobs (job.memory) stays below the budget;
+  smaller jobs are used to fill the gaps, and a job larger than the budget is
+  run alone.  Whenever a job is completed, callback(job, result) is called in
+  the main process, so that results can be written as soon as available.
+  
+  Parameters
+  ----------
+  jobs : list of RefinementJob
+    Jobs to be run.
+  callback : callable
+    Function called as callback(job, func(job)) at completion of each job.
+  nproc : int
+    Number of worker processes (default: number of CPUs).
+  memory : float
+    Memory budget [bytes] (default: no limit).
+  func : callable
+    Module-level function run by the workers.
+  poll : float
+    Polling interval [s].
+  
+  """
+  import multiprocessing
+  
+  if nproc  is None:  nproc  = multiprocessing.cpu_count()
+  if memory is None:  memory = float('inf')
+  
+  pending = sorted( jobs, key = lambda j: j.cost, reverse = True )
+  running = []
+  used    = 0
+  
+  pool = multiprocessing.Pool( nproc )
+  try:
+    while pending or running:
+    
+      # Start as many jobs as allowed by free workers and memory budget
+      i = 0
+      while i < len( pending ) and len( running ) < nproc:
+        job = pending[i]
+        if len( running ) == 0 or used + job.memory <= memory:
+          running.append( (job, pool.apply_async( func, (job,) )) )
+          used += job.memory
+          pending.pop( i )
+        else:
+          i += 1
+      
+      # Collect completed jobs (re-raise exceptions from workers)
+      done = [(j,r) for (j,r) in running if r.ready()]
+      for (job, res) in done:
+        running.remove( (job, res) )
+        used -= job.memory
+        callback( job, res.get() )
+      
+      if not done:
+        time.sleep( poll )
+  
+  finally:
+    pool.terminate()
+    pool.join()
+
+#===============================================================================
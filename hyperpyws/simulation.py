@@ -21,8 +21,7 @@ from .flux          import Flux1D
 from .weno          import WenoReconstruction
 from .grid          import Grid1D
 from .mol           import MOL
-from .timeline      import TimeManager
-from .visualization import RealTimeViz
+from .timeline      import TimeManager, PIController
 
 #===============================================================================
 # CLASS: test-case
@@ -30,7 +29,7 @@ from .visualization import RealTimeViz
 
 class TestCase( object ):
   
-  __slots__ = ['ModelEqn','xlims','BCs','qinit','qexact','tend']
+  __slots__ = ['ModelEqn','xlims','BCs','qinit','qexact','tend','members']
   
   def __init__( self ):
     
@@ -40,13 +39,14 @@ class TestCase( object ):
     self.qinit    = None
     self.qexact   = None
     self.tend     = None
+    self.members  = None    # ensemble size K: qinit returns K state vectors
   
   #-----------------------------------------------------------------------------
   def verify( self ):
     """ Check that member attributes are of the proper type. """
     
     # Check if all mandatory attributes were set
-    mandatory = set(self.__slots__) - set(['qexact'])
+    mandatory = set(self.__slots__) - set(['qexact','members'])
     for m in mandatory:
       if getattr(self,m) is None:
         raise ValueError( "Mandatory member '{:s}' not specified".format(m) )
@@ -66,10 +66,8 @@ class TestCase( object ):
       raise ValueError('xlims must be ordered')
     
     # Check 'BCs'
-    
-    #
-    # (not sure yet)
-    #
+    if not hasattr( self.BCs, '__call__' ):
+      raise TypeError ('BCs must be a callable (e.g. BoundaryConditions)')
     
     # Check 'qinit'
     if not hasattr( self.qinit, '__call__' ):
@@ -84,27 +82,44 @@ class TestCase( object ):
     if self.tend <= 0.0:
       raise ValueError ('tend must be a positive real number')
     
+    # Check 'members'
+    if self.members is not None:
+      if self.members <= 0:
+        raise ValueError ('members must be a positive integer number')
+    
 #===============================================================================
 # CLASS: numerical options and objects
 #===============================================================================
 
 class Numerics (object):
   
-  __slots__ = ['weno','stepper','CFL','mx']
+  __slots__ = ['weno','stepper','CFL','mx','contiguous','tol','common_dt',
+               'componentwise','analytic_speed','splitting','average']
   
   def __init__( self ):
     
-    self.weno    = None
-    self.stepper = None
-    self.CFL     = None
-    self.mx      = None
+    self.weno       = None
+    self.stepper    = None
+    self.CFL        = None    # if not given, use largest safe value
+    self.mx         = None
+    self.contiguous = False
+    self.tol        = None    # error tolerance: if given, dt is adaptive
+    self.common_dt  = False   # ensemble: same dt (minimum) for all members
+    self.componentwise = False   # reconstruct in conserved variables
+    self.analytic_speed = False  # use analytic bound of max. wave speed
+    self.splitting  = 'global'   # speed of Lax-Friedrichs flux splitting
+    self.average    = 'arithmetic'  # interface states for eigensystem
   
   #-----------------------------------------------------------------------------
   def verify( self ):
     """ Check that member attributes are of the proper type. """
     
-    # Check if all attributes were set
-    for m in self.__slots__:
+    # Check if all mandatory attributes were set
+    mandatory = set(self.__slots__) - set(['CFL','contiguous','tol',
+                                           'common_dt','componentwise',
+                                           'analytic_speed','splitting',
+                                           'average'])
+    for m in mandatory:
       if getattr(self,m) is None:
         raise ValueError( "Mandatory member '{:s}' not specified".format(m) )
     
@@ -117,12 +132,46 @@ class Numerics (object):
       raise TypeError ('stepper must be a callable function')
     
     # Check 'CFL'
-    if self.CFL <= 0.0:
-      raise ValueError ('CFL must be a positive real number')
+    if self.CFL is not None:
+      if self.CFL <= 0.0:
+        raise ValueError ('CFL must be a positive real number')
+    elif not hasattr( self.stepper, 'info' ):
+      raise ValueError ('CFL must be specified for unregistered integrator')
     
     # Check 'mx'
     if self.mx <= 0:
       raise ValueError ('mx must be a positive integer number')
+    
+    # Check 'contiguous'
+    if not isinstance( self.contiguous, bool ):
+      raise TypeError ('contiguous must be a boolean')
+    
+    # Check 'tol'
+    if self.tol is not None:
+      if self.tol <= 0.0:
+        raise ValueError ('tol must be a positive real number')
+      if not hasattr( self.stepper, 'embedded' ):
+        raise TypeError ('adaptive time-stepping requires an embedded pair')
+    
+    # Check 'common_dt'
+    if not isinstance( self.common_dt, bool ):
+      raise TypeError ('common_dt must be a boolean')
+    
+    # Check 'componentwise'
+    if not isinstance( self.componentwise, bool ):
+      raise TypeError ('componentwise must be a boolean')
+    
+    # Check 'analytic_speed'
+    if not isinstance( self.analytic_speed, bool ):
+      raise TypeError ('analytic_speed must be a boolean')
+    
+    # Check 'splitting'
+    if self.splitting not in MOL.splittings:
+      raise ValueError ('splitting must be one of {}'.format( MOL.splittings ))
+    
+    # Check 'average'
+    if self.average not in MOL.averages:
+      raise ValueError ('average must be one of {}'.format( MOL.averages ))
   
   #-----------------------------------------------------------------------------
   def __repr__( self ):
@@ -132,41 +181,106 @@ class Numerics (object):
     line0 = '--------------------'
     line1 = '.weno    : {}'.format( self.weno   .__name__ )
     line2 = '.stepper : {}'.format( self.stepper.__name__ )
-    line3 = '.CFL     : {}'.format( self.CFL              )
+    line3 = '.CFL     : {}'.format( self.CFL or 'auto'    )
     line4 = '.mx      : {}'.format( self.mx               )
+    line5 = '.contig. : {}'.format( self.contiguous       )
+    line6 = '.tol     : {}'.format( self.tol              )
+    line7 = '.com. dt : {}'.format( self.common_dt        )
+    line8 = '.comp.   : {}'.format( self.componentwise    )
+    line9 = '.an. vel.: {}'.format( self.analytic_speed   )
+    line10= '.split.  : {}'.format( self.splitting        )
+    line11= '.average : {}'.format( self.average          )
     
-    return '\n'.join([ title, line0, line1, line2, line3, line4 ])
+    return '\n'.join([ title, line0, line1, line2, line3, line4, line5,
+                       line6, line7, line8, line9, line10, line11 ])
 
 #===============================================================================
 # FUNCTION: run simulation
 #===============================================================================
 from .time_integrators  import *
+from .time_integrators  import safe_CFL
 
 
-def RunSimulation( test, numr, Tout=[], verbosity=False ):
+def RunSimulation( test, numr, Tout=[], verbosity=False, stats=None ):
+  """
+  Run simulation of given test-case with given numerical parameters, and
+  return the grid object that contains the final solution.  If numr.tol is
+  given, the time-step size is chosen by a PI controller from the local error
+  estimate of the embedded pair numr.stepper, and capped at the CFL limit.
+  If numr.CFL is not given, the largest safe CFL number of the registered
+  integrator is used (see time_integrators.safe_CFL).
+  
+  If a dictionary 'stats' is given, it is filled with the number of accepted
+  time-steps ('steps'), of rejected time-steps ('rejected'), of evaluations
+  of the right-hand side ('nrhs'), with the CFL number ('CFL') and with the
+  cost per unit simulated time ('cost' = nrhs / tend).  For a hybrid WENO/
+  linear reconstruction, 'flagged' is the list of the fractions of points
+  flagged by the shock sensor at each time-step.
+  
+  The test case can also be given as a declarative specification (TestCaseSpec
+  object, see module case_spec), from which the TestCase object is created.
+  
+  If test.members = K, the test case is an ensemble of K simulations of the
+  same model equations (whose parameters may have one value per member), and
+  test.qinit returns K state vectors: all members are stored in one (K,meq,N)
+  array and advanced together (contiguous storage only).  Each member uses its
+  own CFL time-step, or the smallest one if numr.common_dt is True.
+  
+  """
+  from .case_spec import TestCaseSpec
+  if isinstance( test, TestCaseSpec ):
+    test = test.build()
   
   # Verify input arguments
   assert(isinstance( test, TestCase ));  test.verify()
   assert(isinstance( numr, Numerics ));  numr.verify()
   
+  # CFL number: if not given, largest safe value for integrator and WENO order
+  if numr.CFL is not None:
+    CFL = numr.CFL
+  else:
+    CFL = safe_CFL( numr.stepper, len( numr.weno.stencil ) )
+  
   if len(Tout) > 0:  PLOTS = True
   else            :  PLOTS = False
   
+  # Ensemble of K members, with one time instant and time-step size each
+  K = test.members
+  if K is not None:
+    if not numr.contiguous:
+      raise ValueError ('ensemble simulations require contiguous storage')
+    if PLOTS or numr.tol is not None:
+      raise ValueError ('real-time plots and adaptive time-stepping are not'\
+                        ' available for ensemble simulations')
+  
   #-----------------------------------------------------------------------------
   # Create objects
   grid   = Grid1D( test.xlims,
                    numr.mx, 
                    numr.weno.mbc, 
-                   test.ModelEqn.meq )
+                   test.ModelEqn.meq,
+                   numr.contiguous,
+                   K )
+  
+  # In-place integrators consume each time derivative before the next call to
+  # the solver, which can hence return its own scratch arrays (contiguous only)
+  inplace = getattr( numr.stepper, 'inplace', False )
   
   solver = MOL   ( grid,
                    test.ModelEqn,
                    numr.weno,
-                   test.BCs (numr.mx, numr.weno.mbc) )
+                   test.BCs (numr.mx, numr.weno.mbc),
+                   reuse = inplace and numr.contiguous,
+                   componentwise  = numr.componentwise,
+                   analytic_speed = numr.analytic_speed,
+                   splitting      = numr.splitting,
+                   average        = numr.average )
   
-  clock  = TimeManager()
+  clock  = TimeManager( 0.0 if K is None else np.zeros( (K,1,1) ) )
   
   if PLOTS:
+    # Matplotlib is only needed for real-time plots
+    from .visualization import RealTimeViz
     viz = RealTimeViz( grid, clock, test.qexact )
   
   #-----------------------------------------------------------------------------
@@ -182,11 +296,28 @@ def RunSimulation( test, numr, Tout=[], verbosity=False ):
     print('Reposition and enlarge figures if needed. Please do not close them.')
     input('Press Enter to start simulation ...')# compatible to Python 2.x and 3.x
   
-  # Time derivatives of state vector  <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<  (FIX ME)
-  if numr.stepper in [TD_RK3, TD_RK4, TD_RK5, Taylor2]:
-    Fc = solver.TimeDerivatives  # multi-deriv. integrator
-  else:
-    Fc = lambda q,t : solver.TimeDerivatives(q,t)[0]
+  # Time derivatives of state vector: compute only those needed by integrator
+  Fc = solver.RHS( getattr( numr.stepper, 'nderiv', 1 ) )
+  
+  # Count evaluations of right-hand side
+  if stats is not None:
+    nrhs = [0]
+    RHS  = Fc
+    def Fc( q, t ):
+      nrhs[0] += 1
+      return RHS( q, t )
+  
+  # Hybrid reconstruction: fraction of points flagged at each time-step
+  hybrid = hasattr( numr.weno, 'flagged_fraction' )
+  if hybrid:
+    numr.weno.flagged_fraction( reset=True )
+    flagged = []
+  
+  # Adaptive time-stepping: step-size controller
+  adaptive = numr.tol is not None
+  if adaptive:
+    ctrl   = PIController( numr.tol, numr.stepper.embedded )
+    dt_try = None
   
   #-----------------------------------------------------------------------------
   # Real-time plots counter
@@ -194,14 +325,31 @@ def RunSimulation( test, numr, Tout=[], verbosity=False ):
   
   # Advance in time
   stop = False
-  while clock.t < test.tend and not stop:
+  if K is not None:
+    done = np.zeros( (K,1,1), dtype=bool )
+  while np.amin( clock.t ) < test.tend and not stop:
+    
+    # Compute time-step based on CFL number (one value per ensemble member):
+    # the wave speed is cached by the solver, for the first stage of the step
+    v_max = solver.MaxWaveSpeed( grid.q, clock.t )
+    dt = grid.dx / v_max * CFL
     
-    # Compute time-step based on CFL number
-    v_max = test.ModelEqn.MaxWaveSpeed( grid.q )
-    dt = grid.dx / v_max * numr.CFL
+    # Use step-size proposed by controller, if below CFL limit
+    if adaptive and dt_try is not None:
+      dt = min( dt, dt_try )
     
     # Reduce last time-step if needed
-    if clock.t + dt >= test.tend:
+    if K is not None:
+      # Members that have reached the final time are not advanced any more
+      dt = np.reshape( dt, (K,1,1) )
+      if numr.common_dt:
+        dt = np.full_like( dt, np.amin( dt ) )
+      last = (clock.t + dt >= test.tend) & ~done
+      dt   = np.where( last, test.tend - clock.t, dt )
+      dt[done] = 0.0
+      done |= last
+      stop = np.all( done )
+    elif clock.t + dt >= test.tend:
       dt   = test.tend - clock.t
       stop = True
     
@@ -209,13 +357,27 @@ def RunSimulation( test, numr, Tout=[], verbosity=False ):
     if(PLOTS and verbosity):
       print ('ts (time step number) = {:3d};  t = {:.3f};  dt = {:.3e}'\
              .format( clock.ts, clock.t, dt ))
-      
+    
     # Advance solution
-    grid.q = numr.stepper (Fc, grid.q, clock.t, dt)
+    if adaptive:
+      q_new, err     = numr.stepper (Fc, grid.q, clock.t, dt)
+      accept, dt_try = ctrl.update( dt, ctrl.error( err, q_new ) )
+      if not accept:
+        stop = False
+        continue
+      grid.q = q_new
+    elif inplace:
+      numr.stepper (Fc, grid.q, clock.t, dt)
+    else:
+      grid.q = numr.stepper (Fc, grid.q, clock.t, dt)
     
     # Update time and time-step number
     clock.advance( dt )
     
+    # Fraction of points flagged by shock sensor (rejected steps included)
+    if hybrid:
+      flagged.append( numr.weno.flagged_fraction( reset=True ) )
+    
     # Real-time plots
     if PLOTS:
       if clock.t >= Tout[pc]:
@@ -223,6 +385,21 @@ def RunSimulation( test, numr, Tout=[], verbosity=False ):
         pc += 1
         #time.sleep(0.2)
   
+  #-----------------------------------------------------------------------------
+  # Time-stepping statistics
+  if adaptive and verbosity:
+    print('Adaptive time-stepping: {:d} accepted steps, {:d} rejected steps'\
+          .format( ctrl.accepted, ctrl.rejected ))
+  
+  if stats is not None:
+    stats['steps']    = clock.ts
+    stats['rejected'] = ctrl.rejected if adaptive else 0
+    stats['nrhs']     = nrhs[0]
+    stats['CFL']      = CFL
+    stats['cost']     = nrhs[0] / test.tend
+    if hybrid:
+      stats['flagged'] = flagged
+  
   #-----------------------------------------------------------------------------
   # Last plot
   if PLOTS:
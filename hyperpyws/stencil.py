@@ -0,0 +1,93 @@
+#coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+#===============================================================================
+
+class StencilView (object):
+  """
+  Zero-copy access to all shifted windows of a ghost-padded array.  The slice
+  geometry is computed once (at construction); calling the object on an array
+  of shape (..., mx+2*mbc) returns a read-only strided view of shape
+  (width, ..., mx+1), whose k-th entry is the window shifted by shifts[k]
+  with respect to the interfaces x[i-1/2], i=mbc..mbc+mx.
+  
+  Parameters
+  ----------
+  shifts : list of int
+    Consecutive stencil shifts (e.g. [-3,-2,-1,0,+1,+2] for WENO5)
+  mx : int
+    Number of grid cells
+  mbc : int
+    Number of ghost cells at each boundary
+  
+  """
+  def __init__(self, shifts, mx, mbc):
+  
+    shifts = list( shifts )
+    if shifts != list( range( shifts[0], shifts[0]+len(shifts) ) ):
+      raise ValueError('stencil shifts must be consecutive integers')
+    if mbc+shifts[0] < 0 or shifts[-1] > mbc-1:
+      raise ValueError('stencil does not fit into {:d} ghost cells'.format(mbc))
+    
+    self._shifts = shifts
+    self._width  = len( shifts )   # number of windows
+    self._npts   = mx+1            # number of points in each window
+    self._start  = mbc+shifts[0]   # first index of first window
+    self._size   = mx+2*mbc        # length of padded array
+  
+  #-----------------------------------------------------------------------------
+  def __call__(self, arr):
+    """
+    Return all shifted windows of arr as a single strided view.
+    
+    Parameters
+    ----------
+    arr : numpy.ndarray
+      Array of floats, with ghost-padded grid index along the last axis
+    
+    Returns
+    -------
+    view : numpy.ndarray
+      Read-only view with shape (width,)+arr.shape[:-1]+(mx+1,)
+    
+    """
+    assert( arr.shape[-1] == self._size )
+    
+    a = arr[..., self._start:]
+    s = a.strides[-1]
+    
+    shape   = (self._width,) + a.shape[:-1] + (self._npts,)
+    strides = (s,)           + a.strides[:-1] + (s,)
+    
+    return as_strided( a, shape, strides, writeable=False )
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def shifts (self):  return self._shifts
+  
+  @property
+  def width  (self):  return self._width
+  
+  @property
+  def npts   (self):  return self._npts
+
+#===============================================================================
@@ -0,0 +1,108 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the declarative test-case specifications.
+"""
+
+import os, shutil, tempfile, pickle
+import unittest
+import numpy as np
+
+from hyperpyws import case_spec, parallel
+
+#===============================================================================
+
+CASE_FILE = '''
+import numpy as np
+amplitude = {:f}
+def q_init (x):
+  return [ amplitude*np.sin( 2.0*np.pi*x ) ]
+'''
+
+class TestCaseSpecFiles (unittest.TestCase):
+  
+  def setUp (self):
+    # Two test-case files with the same name, in different directories
+    self.root  = tempfile.mkdtemp()
+    self.paths = []
+    for i in range(2):
+      os.mkdir( os.path.join( self.root, 'case{:d}'.format( i ) ) )
+      path = os.path.join( self.root, 'case{:d}'.format( i ), 'sine.py' )
+      with open( path, 'w' ) as f:
+        f.write( CASE_FILE.format( i+1.0 ) )
+      self.paths.append( path )
+  
+  def tearDown (self):
+    shutil.rmtree( self.root )
+  
+  #-----------------------------------------------------------------------------
+  def spec (self, i):
+    return case_spec.TestCaseSpec( model  = 'Burgers1D',
+                                   params = {},
+                                   xlims  = [0.0, 1.0],
+                                   tend   =  0.1,
+                                   bcs    = 'periodic',
+                                   qinit  = self.paths[i] + ':q_init' )
+  
+  #-----------------------------------------------------------------------------
+  def test_same_file_names (self):
+    m0, m1 = [case_spec.ImportFile( path ) for path in self.paths]
+    self.assertIsNot( m0, m1 )
+    self.assertIs( case_spec.ImportFile( self.paths[0] ), m0 )
+    
+    x = np.linspace( 0.0, 1.0, 11 )
+    q0, q1 = [self.spec( i ).build().qinit( x )[0] for i in range(2)]
+    self.assertTrue( np.allclose( q1, 2.0*q0 ) )
+    self.assertNotEqual( self.spec( 0 ).hash(), self.spec( 1 ).hash() )
+  
+  #-----------------------------------------------------------------------------
+  def test_parallel_same_file_names (self):
+    # Both shock-tube input files of the Euler applications
+    apps = os.path.join( os.path.dirname( os.path.dirname(
+               os.path.abspath( __file__ ) ) ), 'apps', 'euler' )
+    path0 = os.path.join( apps, 'shock-tube'     , 'shock_tube.py' )
+    path1 = os.path.join( apps, 'test_shock_tube', 'shock_tube.py' )
+    self.assertRaises( ValueError, parallel.LoadTestSpec, path0 )
+    self.assertIsInstance( parallel.LoadTestSpec( path1 ),
+                           case_spec.TestCaseSpec )
+  
+  #-----------------------------------------------------------------------------
+  def test_pickle (self):
+    spec = pickle.loads( pickle.dumps( self.spec( 1 ) ) )
+    test = pickle.loads( pickle.dumps( spec.build().qinit ) )
+    x    = np.linspace( 0.0, 1.0, 11 )
+    self.assertTrue( np.allclose( test( x )[0], 2.0*np.sin( 2.0*np.pi*x ) ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_hash_array_params (self):
+    # Parameters of an ensemble are NumPy arrays
+    spec = lambda M: case_spec.TestCaseSpec( model  = 'BuckleyLeverett1D',
+                                             params = {'M': M},
+                                             xlims  = [0.0, 1.0],
+                                             tend   =  0.1,
+                                             bcs    = 'periodic',
+                                             qinit  = self.paths[0]+':q_init' )
+    
+    h1 = spec( np.array([0.5, 1.0, 2.0]) ).hash( np.float64( 0.5 ) )
+    h2 = spec( np.array([0.5, 1.0, 2.0]) ).hash( np.float64( 0.5 ) )
+    h3 = spec( np.array([0.5, 1.0, 3.0]) ).hash( np.float64( 0.5 ) )
+    self.assertEqual( h1, h2 )
+    self.assertNotEqual( h1, h3 )
+    self.assertEqual( spec( [0.5, 1.0, 2.0] ).hash( 0.5 ), h1 )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,95 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the flux functions of the model equations.
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws.model_equations.advection        import Advection1D
+from hyperpyws.model_equations.burgers          import Burgers1D
+from hyperpyws.model_equations.buckley_leverett import BuckleyLeverett1D
+from hyperpyws.model_equations.euler            import Euler1D
+from hyperpyws.model_equations.shallow_water    import ShallowWater1D
+from hyperpyws.model_equations.linear_system    import LinearSystem1D
+
+#===============================================================================
+
+def random_states (model, n, seed):
+  """ Random physical states (meq,n) of the model equations. """
+  rng = np.random.RandomState( seed )
+  if isinstance( model, Euler1D ):
+    rho = rng.uniform( 0.5, 2.0, n )
+    u   = rng.uniform(-1.0, 1.0, n )
+    p   = rng.uniform( 0.5, 2.0, n )
+    return np.array( [rho, rho*u, p/(model.gamma-1.0) + 0.5*rho*u**2] )
+  if isinstance( model, ShallowWater1D ):
+    h = rng.uniform( 0.5, 2.0, n )
+    u = rng.uniform(-1.0, 1.0, n )
+    return np.array( [h, h*u] )
+  return rng.uniform( 0.1, 0.9, (model.meq, n) )
+
+def models ():
+  return [ Advection1D( 1.5 ),
+           Burgers1D(),
+           BuckleyLeverett1D( 0.5 ),
+           Euler1D( 1.4 ),
+           ShallowWater1D( 9.81 ),
+           LinearSystem1D( [[0.0, 2.0], [0.5, 0.0]] ) ]
+
+def matvec (A, v):
+  """ Product of (meq,meq,n) matrix and (meq,n) vector at each point. """
+  return np.einsum( 'ijn,jn->in', np.array( A, dtype=float ), v )
+
+#===============================================================================
+
+class TestFlux (unittest.TestCase):
+  
+  def test_jacobian_vector_product (self):
+    # J(q) v without the dense Jacobian matrix
+    for model in models():
+      q = random_states( model, 20, 0 )
+      v = np.random.RandomState( 1 ).standard_normal( q.shape )
+      self.assertTrue( np.allclose( model.Jv( q, v ),
+                                    matvec( model.J( q ), v ),
+                                    rtol=1e-12, atol=1e-12 ),
+                       msg=type( model ).__name__ )
+  
+  #-----------------------------------------------------------------------------
+  def test_roe_property (self):
+    # A(qL,qR) (qR-qL) = f(qR) - f(qL), with A = R diag(eig) L at Roe average
+    for model in [Euler1D( 1.4 ), ShallowWater1D( 9.81 )]:
+      qL = random_states( model, 20, 0 )
+      qR = random_states( model, 20, 1 )
+      _, R, L, eig, _ = model.roe_eigensystem( qL, qR )
+      
+      dw = matvec( L, qR-qL ) * np.array( eig, dtype=float )
+      self.assertTrue( np.allclose( matvec( R, dw ),
+                                    model.f( qR ) - model.f( qL ),
+                                    rtol=1e-12, atol=1e-12 ),
+                       msg=type( model ).__name__ )
+      
+      # Consistency: A(q,q) = J(q)
+      _, R, L, eig, _ = model.roe_eigensystem( qL, qL )
+      v = qR-qL
+      self.assertTrue( np.allclose( matvec( R, matvec( L, v ) * eig ),
+                                    model.Jv( qL, v ),
+                                    rtol=1e-12, atol=1e-12 ) )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
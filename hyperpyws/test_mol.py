@@ -0,0 +1,156 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the options of the MOL time derivative.
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws.grid                          import Grid1D
+from hyperpyws.mol                           import MOL
+from hyperpyws.wave_speed                    import WaveSpeed
+from hyperpyws.boundary                      import PeriodicBCs
+from hyperpyws.weno_versions                 import Weno
+from hyperpyws.model_equations.linear_system import LinearSystem1D
+from hyperpyws.model_equations.euler         import Euler1D
+from hyperpyws.model_equations.burgers       import Burgers1D
+
+#===============================================================================
+
+class GenericLinearSystem1D (LinearSystem1D):
+  """ Same flux, without constant eigensystem (generic path of MOL). """
+  def constant_eigensystem (self):
+    return None
+
+class ProjectedBurgers1D (Burgers1D):
+  """ Same flux, with the (1x1) characteristic projections of MOL. """
+  identity_eigenvectors = False
+
+def q_burgers (x):
+  return [ 0.5 + np.sin( 2.0*np.pi*(x+0.1) ) + np.where( x < 0.5, 0.0, 0.5 ) ]
+
+def q_euler (x, gamma=1.4):
+  rho = 1.0 + 0.2*np.sin( 2.0*np.pi*x )
+  return [ rho, 0.5*rho, 1.0/(gamma-1.0) + 0.125*rho ]
+
+def q_waves (x):
+  return [ np.sin( 2.0*np.pi*x ), np.where( abs( x-0.5 ) < 0.25, 1.0, 0.0 ) ]
+
+def solver (flux, mx=40, **options):
+  """ MOL object (WENO5-Z, periodic BCs) and grid with contiguous storage. """
+  weno   = Weno( 5, 'Z', backend='numpy' )
+  grid   = Grid1D( [0.0, 1.0], mx, weno.mbc, flux.meq, True )
+  SetBCs = lambda q,t : PeriodicBCs( q, mx, weno.mbc )
+  return MOL( grid, flux, weno, SetBCs, **options ), grid
+
+def time_derivative (flux, q_init, **options):
+  """ First time derivative of the initial conditions. """
+  mol, grid = solver( flux, **options )
+  grid.q    = q_init( grid.x )
+  return mol.TimeDerivatives( grid.q, 0.0, nderiv=1 )[0]
+
+#===============================================================================
+
+class TestMOL (unittest.TestCase):
+  
+  def assertSame (self, q1, q2):
+    self.assertTrue( np.allclose( q1, q2, rtol=0.0, atol=1e-12 ),
+                     msg='max. difference {:.3e}'.format(
+                       np.amax( abs( np.asarray( q1 )-np.asarray( q2 ) ) ) ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_constant_eigensystem (self):
+    # Constant projections and speeds vs. generic path, with all options
+    A = [[1.0, 2.0], [2.0, 1.0]]
+    for splitting in MOL.splittings:
+      for componentwise in [False, True]:
+        opts = dict( splitting=splitting, componentwise=componentwise )
+        self.assertSame(
+          time_derivative( LinearSystem1D       ( A ), q_waves, **opts ),
+          time_derivative( GenericLinearSystem1D( A ), q_waves, **opts ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_componentwise (self):
+    # Decoupled fields: the characteristic variables are the conserved ones
+    # (global splitting: the other ones use the largest speed of all fields)
+    A = [[1.0, 0.0], [0.0, -2.0]]
+    for flux in [LinearSystem1D( A ), GenericLinearSystem1D( A )]:
+      self.assertSame( time_derivative( flux, q_waves ),
+                       time_derivative( flux, q_waves, componentwise=True ) )
+    
+    # Euler equations, smooth solution: with (nearly) linear weights, the
+    # projections commute with the reconstruction
+    flux = Euler1D( 1.4 )
+    q1   = time_derivative( flux, q_euler, mx=80 )
+    q2   = time_derivative( flux, q_euler, mx=80, componentwise=True )
+    self.assertLess( np.amax( abs( q1-q2 ) ), 1e-10 * np.amax( abs( q1 ) ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_scalar_shortcut (self):
+    # Scalar model: projections are skipped, with exactly the same results
+    self.assertTrue( Burgers1D().identity_eigenvectors )
+    for splitting in MOL.splittings:
+      opts = dict( splitting=splitting )
+      q1   = time_derivative( Burgers1D()         , q_burgers, **opts )
+      q2   = time_derivative( ProjectedBurgers1D(), q_burgers, **opts )
+      self.assertTrue( np.array_equal( q1, q2 ), msg=splitting )
+    
+    # No eigenvectors, no workspace for characteristic variables
+    mol, grid = solver( Burgers1D() )
+    for name in ['ww','gg','fhat']:
+      self.assertNotIn( name, mol._ws )
+  
+  #-----------------------------------------------------------------------------
+  def test_wave_speed_cache (self):
+    # Cached value is returned once, and only for the same buffer and time
+    speed = WaveSpeed( Burgers1D() )
+    q     = np.zeros( (1,10) )
+    speed.share( 1.0, q, 0.5 )
+    self.assertEqual( speed.shared( q, 0.5 ), 1.0 )
+    self.assertIsNone( speed.shared( q, 0.5 ) )
+    for state,t in [ (q.copy(),0.5), (q,0.25), (q,None) ]:
+      speed.share( 1.0, q, 0.5 )
+      self.assertIsNone( speed.shared( state, t ) )
+    
+    # MOL: speed of the CFL condition reused at the first stage only
+    mol, grid = solver( Euler1D( 1.4 ), componentwise=True )
+    grid.q = q_euler( grid.x )
+    q      = grid.q
+    mol.MaxWaveSpeed( q, 0.0 )
+    n   = mol._speed.evaluations
+    q_t = mol.qt( q, 0.0 )
+    self.assertEqual( mol._speed.evaluations, n )
+    
+    # Faster state: a stale speed would give a different (unstable) result
+    def reference (q):
+      mol, grid = solver( Euler1D( 1.4 ), componentwise=True )
+      mol.MaxWaveSpeed( q, 0.0 )
+      return mol.qt( q, 0.0 )
+    
+    q2 = q.copy()
+    q2[1] *= 3.0
+    mol.MaxWaveSpeed( q, 0.0 )
+    self.assertTrue( np.array_equal( mol.qt( q2, 0.0 ), reference( q2 ) ) )
+    
+    mol.MaxWaveSpeed( q, 0.0 )
+    q[1] *= 3.0                  # same buffer, overwritten at a later stage
+    self.assertTrue( np.array_equal( mol.qt( q, 0.5 ), reference( q2 ) ) )
+    self.assertEqual( mol._speed.evaluations, n+4 )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
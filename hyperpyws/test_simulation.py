@@ -0,0 +1,107 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of equivalent ways of running the same simulation.
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws                  import case_spec
+from hyperpyws.simulation       import Numerics, RunSimulation
+from hyperpyws.weno_versions    import Weno
+from hyperpyws.time_integrators import get_stepper
+
+#===============================================================================
+
+def q_shock_tube (x, gamma=1.4):
+  rho = np.where( x < 0.5, 1.0, 0.125 )
+  p   = np.where( x < 0.5, 1.0, 0.1   )
+  return [ rho, 0.0*rho, p/(gamma-1.0) ]
+
+def shock_tube ():
+  return case_spec.TestCaseSpec( model  = 'Euler1D',
+                                 params = {'gamma': 1.4},
+                                 xlims  = [0.0, 1.0],
+                                 tend   =  0.1,
+                                 bcs    = 'outflow',
+                                 qinit  = q_shock_tube )
+
+def q_square (x):
+  return [ np.where( abs( x-0.5 ) < 0.25, 1.0, 0.0 ) ]
+
+def buckley_leverett (M):
+  return case_spec.TestCaseSpec( model  = 'BuckleyLeverett1D',
+                                 params = {'M': M},
+                                 xlims  = [0.0, 1.0],
+                                 tend   =  0.1,
+                                 bcs    = 'outflow',
+                                 qinit  = q_square ).build()
+
+def run (test, stepper='rk3_ssp', contiguous=True, mx=80, **kwargs):
+  """ Run simulation with WENO5-Z, return final solution as array. """
+  numr            = Numerics()
+  numr.weno       = Weno( 5, 'Z' )
+  numr.stepper    = get_stepper( stepper )
+  numr.mx         = mx
+  numr.contiguous = contiguous
+  for key, value in kwargs.items():
+    setattr( numr, key, value )
+  return np.array( RunSimulation( test, numr ).qint, dtype=float )
+
+#===============================================================================
+
+class TestEquivalentRuns (unittest.TestCase):
+  
+  def assertSame (self, q1, q2, rtol=1.0e-12):
+    self.assertEqual( q1.shape, q2.shape )
+    self.assertLess( np.amax( abs( q1-q2 ) ), rtol * np.amax( abs( q1 ) ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_contiguous_storage (self):
+    # Single (meq,N) array vs. list of meq arrays
+    test = shock_tube()
+    self.assertSame( run( test, contiguous=True  ),
+                     run( test, contiguous=False ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_inplace_steppers (self):
+    # In-place integrators (solver reuses its scratch arrays) vs. functional:
+    # same stages, but the operations are not evaluated in the same order
+    test = shock_tube()
+    for name in ['rk3_ssp', 'rk4']:
+      for contiguous in [True, False]:
+        self.assertSame( run( test, name+'_inplace', contiguous ),
+                         run( test, name           , contiguous ), 1.0e-10 )
+  
+  #-----------------------------------------------------------------------------
+  def test_ensemble (self):
+    # Ensemble of K members (one value of M each) vs. K separate runs
+    M_list = np.array( [0.5, 1.0, 2.0] )
+    K      = len( M_list )
+    
+    test         = buckley_leverett( M_list )
+    test.qinit   = lambda x: [q_square( x )] * K
+    test.members = K
+    q = run( test, 'rk3_ssp_inplace' )
+    self.assertEqual( q.shape[0], K )
+    
+    for k,M in enumerate( M_list ):
+      self.assertSame( q[k], run( buckley_leverett( M ), 'rk3_ssp_inplace' ) )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,70 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the registry of time integrators and of their stability limits.
+"""
+
+import unittest
+
+import hyperpyws.time_integrators as integrators
+from hyperpyws.weno_versions import Weno
+
+#===============================================================================
+
+class TestRegistry (unittest.TestCase):
+  
+  def test_get_stepper_by_name_or_index (self):
+    for i,name in enumerate( integrators.__all__ ):
+      stepper = integrators.get_stepper( name )
+      self.assertEqual( stepper.__name__, name )
+      self.assertIs( integrators.get_stepper( i ), stepper )
+      self.assertIs( integrators.get_stepper( str( i ) ), stepper )
+    
+    n = len( integrators.__all__ )
+    for bad in ['rk9', n, str( n )]:
+      self.assertRaises( ValueError, integrators.get_stepper, bad )
+  
+  #-----------------------------------------------------------------------------
+  def test_declared_cfl (self):
+    # Declared limits agree with those computed for the linear schemes
+    for order in [3,5,7,9,11]:
+      weno = Weno( order, 'CFD', backend='numpy' )
+      for name, stepper in sorted( integrators.registry.items() ):
+        declared = stepper.info.cfl[order]
+        computed = integrators.max_stable_CFL( stepper, weno )
+        if declared == 0.0:
+          self.assertLess( computed, 0.1, msg=name )
+        else:
+          self.assertAlmostEqual( computed, declared, delta=2.0e-3, msg=name )
+  
+  #-----------------------------------------------------------------------------
+  def test_safe_cfl (self):
+    rk4 = integrators.rk4
+    self.assertAlmostEqual( integrators.safe_CFL( rk4, 5 ),
+                            rk4.info.safety * rk4.info.cfl[5] )
+    self.assertAlmostEqual( integrators.safe_CFL( rk4, 5, safety=1.0 ),
+                            rk4.info.cfl[5] )
+    
+    # Unstable for any CFL number: must be given explicitly
+    self.assertRaises( ValueError, integrators.safe_CFL, integrators.fE, 5 )
+    
+    # Known limits for all available WENO orders
+    for order in [3,5,7,9,11]:
+      self.assertGreater( integrators.safe_CFL( rk4, order ), 0.0 )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
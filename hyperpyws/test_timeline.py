@@ -0,0 +1,94 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the adaptive time-stepping (PI controller and Fehlberg 4(5)).
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws                  import case_spec
+from hyperpyws.timeline         import PIController
+from hyperpyws.simulation       import Numerics, RunSimulation
+from hyperpyws.weno_versions    import Weno
+from hyperpyws.time_integrators import Fehlberg45, rk4
+
+#===============================================================================
+
+def q_init (x):
+  return [ np.sin( 2.0*np.pi*x ) ]
+
+def advection_sine ():
+  return case_spec.TestCaseSpec( model  = 'Advection1D',
+                                 params = {'v': 1.0},
+                                 xlims  = [0.0, 1.0],
+                                 tend   =  1.0,
+                                 bcs    = 'periodic',
+                                 qinit  = q_init )
+
+def run (stepper, CFL, tol=None, mx=50):
+  """ Run advection of sine wave, return final solution and statistics. """
+  numr         = Numerics()
+  numr.weno    = Weno( 5, 'Z' )
+  numr.stepper = stepper
+  numr.CFL     = CFL
+  numr.mx      = mx
+  numr.tol     = tol
+  stats = {}
+  grid  = RunSimulation( advection_sine(), numr, stats=stats )
+  return np.array( grid.qint ), stats
+
+#===============================================================================
+
+class TestPIController (unittest.TestCase):
+  
+  def test_no_growth_after_rejection (self):
+    ctrl = PIController( 1.0e-6, 4 )
+    
+    # Rejected step: smaller new attempt
+    accept, dt1 = ctrl.update( 1.0, 10.0 )
+    self.assertFalse( accept )
+    self.assertLess( dt1, 1.0 )
+    
+    # Accepted step with small error, right after rejection: no growth
+    accept, dt2 = ctrl.update( dt1, 1.0e-3 )
+    self.assertTrue( accept )
+    self.assertEqual( dt2, dt1 )
+    
+    # Following accepted step: growth allowed again
+    accept, dt3 = ctrl.update( dt2, 1.0e-3 )
+    self.assertTrue( accept )
+    self.assertGreater( dt3, dt2 )
+    self.assertEqual( (ctrl.accepted, ctrl.rejected), (2, 1) )
+  
+  #-----------------------------------------------------------------------------
+  def test_tolerance_limits_time_step (self):
+    # Large CFL cap, so that the step size is chosen by the controller
+    ref, _ = run( rk4, 0.05 )
+    
+    steps = []
+    for tol in [1.0e-5, 1.0e-7, 1.0e-9]:
+      q, stats = run( Fehlberg45, 4.0, tol )
+      err = np.amax( abs( q-ref ) )
+      self.assertLess( err, 10.0*tol )
+      steps.append( stats['steps'] )
+    
+    # Tighter tolerances need more steps
+    self.assertTrue( steps[0] < steps[1] < steps[2] )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
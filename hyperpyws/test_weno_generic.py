@@ -0,0 +1,81 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the generic WENO reconstructions of order 2r-1.
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws.weno_versions              import Weno
+from hyperpyws.weno_versions.weno_generic import WenoClass
+
+#===============================================================================
+
+def cell_averages (mx):
+  """ Stencil values (stacked) and exact values at x[i+1/2], for sin(2 pi x).
+  """
+  x  = np.linspace( 0.0, 1.0, mx+1 )
+  k  = 2.0*np.pi
+  ua = ( np.cos( k*x[:-1] ) - np.cos( k*x[1:] ) ) / ( k*(x[1]-x[0]) )
+  return ua, np.sin( k*x[1:] )
+
+def stencil (u, width):
+  """ Stencil values of cells i-r+1...i+r-1, stacked (periodic data).
+  """
+  r = (width+1) // 2
+  return np.array( [np.roll( u, r-1-j ) for j in range( width )] )
+
+#===============================================================================
+
+class TestGenericWeno (unittest.TestCase):
+  
+  def test_hand_written_classes (self):
+    # Smooth data with a jump
+    x = np.linspace( 0.0, 1.0, 101 )[:-1]
+    u = np.sin( 2.0*np.pi*x ) + np.where( x < 0.5, 0.0, 1.0 )
+    
+    for order in [5,7]:
+      for version in ['JS','Z','CFD']:
+        ref = Weno( order, version, backend='numpy' )
+        gen = WenoClass( order, version )
+        self.assertEqual( gen.stencil, ref.stencil )
+        self.assertEqual( gen.mbc    , ref.mbc     )
+        
+        U = stencil( u, order )
+        for method in ['reconstruct_left_stacked', 'reconstruct_right_stacked']:
+          q_ref = getattr( ref, method )( U )
+          q_gen = getattr( gen, method )( U )
+          self.assertTrue( np.allclose( q_gen, q_ref, rtol=0.0, atol=1e-13 ),
+                           msg='{}, {}'.format( ref.__name__, method ) )
+        self.assertTrue( np.allclose( gen.reconstruct_left( *U ),
+                                      ref.reconstruct_left( *U ),
+                                      rtol=0.0, atol=1e-13 ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_order_of_accuracy (self):
+    for order in [3,5,7,9,11]:
+      weno = WenoClass( order, 'CFD' )
+      err  = []
+      for mx in [20,40]:
+        ua, u_exact = cell_averages( mx )
+        u_recon     = weno.reconstruct_left_stacked( stencil( ua, order ) )
+        err.append( np.amax( abs( u_recon - u_exact ) ) )
+      self.assertGreater( np.log2( err[0]/err[1] ), order-0.2, msg=order )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
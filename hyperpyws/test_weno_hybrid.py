@@ -0,0 +1,114 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the hybrid WENO/linear reconstructions.
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws.weno_versions import Weno
+
+#===============================================================================
+
+def hybrid_classes (threshold=0.1):
+  """ Hybrid classes, with the WENO and linear classes they combine.
+  """
+  for order in [5,7]:
+    for version in ['JS','Z']:
+      yield ( Weno( order, version, backend='numpy', hybrid=threshold ),
+              Weno( order, version, backend='numpy' ),
+              Weno( order, 'CFD'  , backend='numpy' ) )
+
+def stencil (u, width):
+  """ Stencil values of cells i-r+1...i+r-1, stacked (periodic data along the
+      last axis).
+  """
+  r = (width+1) // 2
+  return np.array( [np.roll( u, r-1-j, axis=-1 ) for j in range( width )] )
+
+def smooth (x):
+  return np.array( [ 2.0 + 0.5 *np.sin( 2.0*np.pi*x ),
+                     1.0 + 0.25*np.cos( 2.0*np.pi*x ) ] )
+
+def step (x):
+  return smooth( x ) + np.where( x < 0.5, 0.0, 1.0 )
+
+methods = ['reconstruct_left_stacked', 'reconstruct_right_stacked']
+
+#===============================================================================
+
+class TestHybridWeno (unittest.TestCase):
+  
+  def test_smooth (self):
+    # No flagged points: same results as the linear reconstruction
+    x = np.linspace( 0.0, 1.0, 201 )[:-1]
+    for hyb, weno, linear in hybrid_classes():
+      U = stencil( smooth( x ), len( hyb.stencil ) )
+      self.assertLess( np.amax( hyb.sensor( *U ) ), 0.1 )
+      for method in methods:
+        q_hyb = getattr( hyb   , method )( U )
+        q_lin = getattr( linear, method )( U )
+        self.assertTrue( np.array_equal( q_hyb, q_lin ),
+                         msg='{}, {}'.format( weno.__name__, method ) )
+      self.assertEqual( hyb.flagged_fraction(), 0.0 )
+  
+  #-----------------------------------------------------------------------------
+  def test_step (self):
+    # WENO where the stencil crosses a jump, linear elsewhere
+    x = np.linspace( 0.0, 1.0, 201 )[:-1]
+    for hyb, weno, linear in hybrid_classes():
+      U     = stencil( step( x ), len( hyb.stencil ) )
+      flag  = hyb.sensor( *U ) > 0.1
+      jump  = np.any( abs( np.diff( U, axis=0 ) ) > 0.5, axis=0 )
+      self.assertTrue( np.all( flag[jump] ) )
+      for method in methods:
+        q_hyb  = getattr( hyb   , method )( U )
+        q_weno = getattr( weno  , method )( U )
+        q_lin  = getattr( linear, method )( U )
+        msg    = '{}, {}'.format( weno.__name__, method )
+        self.assertTrue( np.array_equal( q_hyb[jump], q_weno[jump] ), msg=msg )
+        self.assertTrue( np.array_equal( q_hyb,
+                                         np.where( flag, q_weno, q_lin ) ),
+                         msg=msg )
+      self.assertAlmostEqual( hyb.flagged_fraction(), np.mean( flag ) )
+    
+    # Zero threshold: WENO at all points with non-zero sensor
+    for hyb, weno, linear in hybrid_classes( threshold=0.0 ):
+      U = stencil( step( x ), len( hyb.stencil ) )
+      for method in methods:
+        self.assertTrue( np.allclose( getattr( hyb , method )( U ),
+                                      getattr( weno, method )( U ),
+                                      rtol=0.0, atol=1e-13 ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_stacked_shapes (self):
+    # Single field (nsh,N), fields (nsh,meq,N), ensemble (nsh,meq,K,N)
+    x = np.linspace( 0.0, 1.0, 41 )[:-1]
+    u = step( x )
+    for hyb, weno, linear in hybrid_classes():
+      nsh = len( hyb.stencil )
+      for data in [ u[0], u, np.array( [u,2.0*u,3.0*u] ).swapaxes(0,1) ]:
+        U = stencil( data, nsh )
+        for method in methods:
+          shape = getattr( hyb, method )( U ).shape
+          self.assertEqual( shape, data.shape )
+          self.assertEqual( shape, getattr( weno  , method )( U ).shape )
+          self.assertEqual( shape, getattr( linear, method )( U ).shape )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
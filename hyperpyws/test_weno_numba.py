@@ -0,0 +1,86 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+""" Tests of the compiled WENO kernels (plain Python loops without Numba).
+"""
+
+import unittest
+import numpy as np
+
+from hyperpyws                  import time_integrators as integrators
+from hyperpyws.weno_versions    import Weno, weno_numba
+
+#===============================================================================
+
+def compiled_classes ():
+  """ Pairs (compiled class, NumPy class), for all orders and versions with
+      hand-written kernels (the other orders use the NumPy backend only).
+  """
+  pairs = []
+  for order in [5,7]:
+    for version in ['JS','Z','CFD']:
+      ref = Weno( order, version, backend='numpy' )
+      pairs.append( (getattr( weno_numba, ref.__name__ ), ref) )
+  return pairs
+
+def stencil (u, width):
+  """ Stencil values of cells i-r+1...i+r-1, stacked (periodic data).
+  """
+  r = (width+1) // 2
+  return np.array( [np.roll( u, r-1-j, axis=-1 ) for j in range( width )] )
+
+#===============================================================================
+
+class TestCompiledKernels (unittest.TestCase):
+  
+  def test_same_as_numpy (self):
+    # Smooth data with a jump, two components
+    x = np.linspace( 0.0, 1.0, 41 )[:-1]
+    u = np.array( [np.sin( 2.0*np.pi*x ) + np.where( x < 0.5, 0.0, 1.0 ),
+                   np.cos( 2.0*np.pi*x )] )
+    
+    for comp, ref in compiled_classes():
+      self.assertEqual( comp.backend, 'numba' )
+      self.assertEqual( comp.stencil, ref.stencil )
+      U = stencil( u, len( ref.stencil ) )
+      for method in ['reconstruct_left_stacked', 'reconstruct_right_stacked']:
+        q_comp = getattr( comp, method )( U )
+        q_ref  = getattr( ref , method )( U )
+        self.assertEqual( q_comp.shape, q_ref.shape )
+        self.assertTrue( np.allclose( q_comp, q_ref, rtol=0.0, atol=1e-13 ),
+                         msg='{}, {}'.format( ref.__name__, method ) )
+      self.assertTrue( np.allclose( comp.reconstruct_right( *U ),
+                                    ref .reconstruct_right( *U ),
+                                    rtol=0.0, atol=1e-13 ) )
+  
+  #-----------------------------------------------------------------------------
+  def test_complex_values (self):
+    # Complex values are not converted to float, but go to the NumPy class
+    theta = np.linspace( 0.0, 2.0*np.pi, 16, endpoint=False )
+    for comp, ref in compiled_classes():
+      modes = [np.exp( 1j*s*theta ) for s in ref.stencil]
+      self.assertTrue( np.allclose( comp.reconstruct_left( *modes ),
+                                    ref .reconstruct_left( *modes ) ) )
+    
+    # Stability limits do not depend on the backend
+    rk4 = integrators.rk4
+    cfd = weno_numba.CentralFiniteDifference5
+    self.assertAlmostEqual( integrators.max_stable_CFL( rk4, cfd ),
+                            rk4.info.cfl[5], delta=2.0e-3 )
+
+#===============================================================================
+if __name__ == '__main__':
+  unittest.main()
@@ -14,24 +14,241 @@
 #
 #===============================================================================
 
+import numpy as np
+
 #def f(q,t):
 #  qs = ApplyBCs(q,t)
 #  qt, qtt = MOL.TimeDerivatives ( qs )
 #  return qt, qtt
 
 __all__ = ['fE', 'rk2_midpoint', 'rk2_Heun', 'rk3', 'rk3_ssp', 'rk4',
-           'Fehlberg5', 'Taylor2', 'TD_RK3', 'TD_RK4', 'TD_RK5']
+           'Fehlberg5', 'Taylor2', 'TD_RK3', 'TD_RK4', 'TD_RK5',
+           'rk3_ssp_inplace', 'rk4_inplace', 'ssp10_4', 'Fehlberg45']
+
+#===============================================================================
+# Attributes of the integrators (derivatives required, embedded pairs)
+#===============================================================================
+
+def derivatives (n):
+  """
+  Decorator that declares the number of time derivatives of the solution that 
+  the integrator needs from its right-hand side function: for n=1, f(Y,t) must
+  return Y_t; for n=2, f(Y,t) must return [Y_t,Y_tt].  The value is stored in
+  the attribute 'nderiv' of the integrator function.
+  
+  """
+  def decorate (stepper):
+    stepper.nderiv = n
+    return stepper
+  return decorate
+
+#-------------------------------------------------------------------------------
+def embedded (p):
+  """
+  Decorator that marks an embedded Runge-Kutta pair, which returns the solution
+  at the next time-level together with an estimate of the local error.  The
+  order p of the error estimator (i.e. of the lower-order method) is stored in
+  the attribute 'embedded' of the integrator function.
+  
+  """
+  def decorate (stepper):
+    stepper.embedded = p
+    return stepper
+  return decorate
+
+#===============================================================================
+# Registry of time integrators
+#===============================================================================
+
+class StepperInfo (object):
+  """
+  Properties of a time integrator, as declared in the registry.
+  
+  Parameters
+  ----------
+  name : str
+    Name of the integrator in the registry.
+  order : int
+    Order of accuracy.
+  stages : int
+    Number of evaluations of the right-hand side per time-step.
+  nderiv : int
+    Number of time derivatives computed by each evaluation (1 or 2).
+  ssp : float
+    SSP coefficient (0 if the method is not strong-stability-preserving).
+  cfl : dict
+    Maximum stable CFL number, for each order of the linear upwind scheme
+    underlying WENO (keys 3, 5, 7, 9 and 11); see max_stable_CFL.
+  safety : float
+    Fraction of the linear stability limit that is safe with non-linear WENO
+    weights and shocks; see safe_CFL.
+  
+  """
+  __slots__ = ['name','order','stages','nderiv','ssp','cfl','safety']
+  
+  def __init__(self, name, order, stages, nderiv, ssp, cfl, safety):
+    self.name   = name
+    self.order  = order
+    self.stages = stages
+    self.nderiv = nderiv
+    self.ssp    = ssp
+    self.cfl    = cfl
+    self.safety = safety
+  
+  #-----------------------------------------------------------------------------
+  def cost (self, weno_order, CFL=None):
+    """
+    Evaluations of the right-hand side per unit simulated time, in units of
+    v_max/dx, i.e. (stages x steps) for dt = dx/v_max; if CFL is not given,
+    the safe CFL number is used.
+    
+    """
+    if CFL is None:
+      CFL = self.safety * self.cfl[weno_order]
+    return self.stages / CFL
+  
+  #-----------------------------------------------------------------------------
+  def __repr__(self):
+    return '{:16s} order={:d} stages={:2d} nderiv={:d} ssp={:.3g} cfl={} '\
+           'safety={:.2g}'.format( self.name, self.order, self.stages,
+                                   self.nderiv, self.ssp, self.cfl, self.safety )
+
+# Dictionary of registered integrators
+registry = {}
+
+#-------------------------------------------------------------------------------
+def scheme (order, stages, ssp=0.0, cfl=None, safety=0.6):
+  """
+  Decorator that registers an integrator with its properties (see StepperInfo),
+  which are stored in the attribute 'info'.  It must be applied after the
+  decorators 'derivatives' and 'embedded'.
+  
+  """
+  cfl = dict( cfl ) if cfl is not None else {}
+  
+  def decorate (stepper):
+    name = stepper.__name__
+    stepper.info = StepperInfo( name, order, stages,
+                                getattr( stepper, 'nderiv', 1 ), ssp, cfl,
+                                safety )
+    registry[name] = stepper
+    return stepper
+  return decorate
+
+#-------------------------------------------------------------------------------
+def get_stepper (name):
+  """
+  Return the registered integrator with the given name.  For compatibility
+  with older scripts, an integer index (or a string of digits) selects the
+  integrator at that position in __all__, e.g. 5 for rk4.
+  
+  """
+  if isinstance( name, int ) or (isinstance( name, str ) and name.isdigit()):
+    index = int( name )
+    if not 0 <= index < len( __all__ ):
+      raise ValueError( 'Time integrator index {} not in range 0-{}'\
+                        .format( index, len( __all__ )-1 ) )
+    name = __all__[index]
+  
+  try:
+    return registry[name]
+  except KeyError:
+    raise ValueError( "Unknown time integrator '{}'; available: {}"\
+                      .format( name, ', '.join( sorted( registry ) ) ) )
+
+#-------------------------------------------------------------------------------
+def max_stable_CFL (stepper, weno, ntheta=720, tol=1.0e-6):
+  """
+  Linear stability limit of the integrator, applied to the semi-discretization
+  of u_t + u_x = 0 with the upwind linear scheme given by weno.reconstruct_left
+  (e.g. Weno(5,'CFD',backend='numpy') for the linear weights of WENO5: the
+  Fourier modes are complex, which the compiled kernels do not support).  The
+  eigenvalues of the semi-discrete operator are computed on ntheta Fourier
+  modes, and the largest CFL number for which the amplification factor of the
+  integrator (obtained by applying it to y' = z*y) is at most 1 is found by
+  bisection.
+  
+  Methods whose stability region does not contain a segment of the imaginary
+  axis (e.g. forward Euler and 2nd-order Runge-Kutta) are unstable for any
+  CFL number: their limit decreases to 0 as ntheta grows, and 0 is declared
+  in the registry.
+  
+  """
+  theta = np.linspace( 0.0, 2.0*np.pi, ntheta, endpoint=False )
+  modes = [np.exp( 1j*s*theta ) for s in weno.stencil]
+  fhat  = weno.reconstruct_left( *modes )
+  lam   = -fhat * (1.0 - np.exp( -1j*theta ))    # eigenvalues, times dx
+  
+  nderiv   = getattr( stepper, 'nderiv', 1 )
+  embedded = hasattr( stepper, 'embedded' )
+  
+  def stable (c):
+    z = c*lam
+    if nderiv == 1:  f = lambda y,t: z*y
+    else          :  f = lambda y,t: [z*y, z*z*y]
+    R = stepper( f, np.ones_like( z ), 0.0, 1.0 )
+    if embedded:  R = R[0]
+    return np.amax( abs( R ) ) <= 1.0 + 1.0e-12
+  
+  # Bracket stability limit, then bisect
+  lo, hi = 0.0, 0.25
+  while stable( hi ):
+    lo, hi = hi, 2.0*hi
+  while hi-lo > tol:
+    mid = 0.5*(lo+hi)
+    if stable( mid ):  lo = mid
+    else            :  hi = mid
+  
+  return lo
+
+#-------------------------------------------------------------------------------
+def safe_CFL (stepper, weno_order, safety=None):
+  """
+  Largest CFL number to be used with a registered integrator and WENO of given
+  order: maximum stable CFL number of the linear scheme, times a safety factor
+  that accounts for the non-linear weights and for shocks (by default, the one
+  declared in the registry).  The declared factors were chosen so that all
+  integrators run the shock-tube, shock-entropy, dam-break and Buckley-Leverett
+  tests with WENO3-11 (JS and Z, 200 cells); problems that can lose positivity
+  (e.g. the blast wave) may require a smaller CFL number with non-SSP
+  integrators.
+  
+  """
+  info = getattr( stepper, 'info', None )
+  if info is None or info.cfl.get( weno_order, 0.0 ) <= 0.0:
+    raise ValueError( 'Integrator has no known stability limit: '\
+                      'CFL must be specified' )
+  if safety is None:
+    safety = info.safety
+  return safety * info.cfl[weno_order]
+
+#===============================================================================
+# Linear stability limits for WENO orders 3-11, computed with max_stable_CFL
+# (ntheta=2880) and rounded down; they only depend on the stability polynomial
+#===============================================================================
+
+_cfl_rk1  = { 3:0.0  , 5:0.0  , 7:0.0  , 9:0.0  , 11:0.0   }
+_cfl_rk2  = { 3:0.873, 5:0.0  , 7:0.0  , 9:0.0  , 11:0.0   }
+_cfl_rk3  = { 3:1.625, 5:1.435, 7:1.243, 9:1.127, 11:1.049 }
+_cfl_rk4  = { 3:1.745, 5:1.732, 7:1.689, 9:1.598, 11:1.525 }
+_cfl_rkf5 = { 3:2.139, 5:1.790, 7:0.506, 9:0.241, 11:0.149 }
+_cfl_td5  = { 3:2.246, 5:1.791, 7:1.500, 9:1.270, 11:1.095 }
+_cfl_ssp4 = { 3:3.611, 5:3.086, 7:2.841, 9:2.687, 11:2.576 }
 
 #===============================================================================
 # Single-derivative Runge-Kutta methods
 #===============================================================================
 
+@scheme( order=1, stages=1, ssp=1.0, cfl=_cfl_rk1 )
+@derivatives(1)
 def fE(f,Y,t,dt):
   """ Classical Forward Euler.
   """
   return Y + dt*f(Y,t)
 
 #-------------------------------------------------------------------------------
+@scheme( order=2, stages=2,          cfl=_cfl_rk2 )
+@derivatives(1)
 def rk2_midpoint (f,Y,t,dt):
   """ Classical 2nd-order Runge-Kutta (midpoint rule). 
   """
@@ -40,6 +257,8 @@ def rk2_midpoint (f,Y,t,dt):
   return Y + dt*k2
 
 #-------------------------------------------------------------------------------
+@scheme( order=2, stages=2, ssp=1.0, cfl=_cfl_rk2 )
+@derivatives(1)
 def rk2_Heun (f,Y,t,dt):
   """ Strong-stability-preserving (SSP) 2nd-order Runge-Kutta (Heun's method).
   """
@@ -48,6 +267,8 @@ def rk2_Heun (f,Y,t,dt):
   return Y + 0.5*dt*( k1 + k2 )
 
 #-------------------------------------------------------------------------------
+@scheme( order=3, stages=3,          cfl=_cfl_rk3, safety=0.55 )
+@derivatives(1)
 def rk3 (f,Y,t,dt):
   """ Classical 3rd-order Runge-Kutta.
   """
@@ -57,6 +278,8 @@ def rk3 (f,Y,t,dt):
   return Y + (dt/6.)*( k1 + 4.0*k2 + k3 )
 
 #-------------------------------------------------------------------------------
+@scheme( order=3, stages=3, ssp=1.0, cfl=_cfl_rk3 )
+@derivatives(1)
 def rk3_ssp (f,Y,t,dt):
   """ Strong-stability-preserving (SSP) 3rd-order Runge-Kutta.
   """
@@ -65,6 +288,8 @@ def rk3_ssp (f,Y,t,dt):
   return (   Y + 2.*Y2 + 2.*dt*f(Y2,t+dt))/3.
   
 #-------------------------------------------------------------------------------
+@scheme( order=4, stages=4,          cfl=_cfl_rk4 )
+@derivatives(1)
 def rk4 (f,Y,t,dt):
   """ Classical 4th-order Runge-Kutta.
   """
@@ -74,43 +299,71 @@ def rk4 (f,Y,t,dt):
   k4 = f(Y+    dt*k3, t+    dt)
   return Y + (dt/6.)*( k1 + 2.0*k2 + 2.0*k3 + k4 )
 
-def Fehlberg5(f, Y, t, dt ):
-    """RK-Fehlberg 5 method. """
-
-    # butcher tableau:
-    A = [ 
-[                                                               ], 
-[      0.25                                                     ], 
-[     3./32.,       9./32.                                      ], 
+#-------------------------------------------------------------------------------
+# RK-Fehlberg 4(5) pair: Butcher tableau
+_A_rkf = [
+[                                                               ],
+[      0.25                                                     ],
+[     3./32.,       9./32.                                      ],
 [1932./2197., -7200./2197.,  7296./2197.                        ],
 [  439./216.,          -8.,   3680./513.,   -845./4104.         ],
 [    -8./27.,           2., -3544./2565.,  1859./4104., -11./40.] ]
-  
-    # time values:
-    c = [0., 0.25, 0.375, 12./13., 1., 0.5]
 
-    k  = [ f( Y, t ) ]
+# time values:
+_c_rkf = [0., 0.25, 0.375, 12./13., 1., 0.5]
 
-    for i in range(1,6):
-        ys = Y + dt* ( sum( [a*ki for (a,ki) in zip( A[i], k)] )  )
-        ts = t + dt*c[i]
-        k.append( f( ys, ts ) )
+# coefficients for the fifth-order scheme:
+_b_rkf = [16./135., 0., 6656./12825., 28561./56430., -9./50., 2./55.]
 
-    # coefficients for the fifth-order scheme:
-    b = [16./135., 0., 6656./12825., 28561./56430., -9./50., 2./55.]
+# coefficients for the fourth-order scheme:
+_bs_rkf = [25./216., 0., 1408./2565., 2197./4104., -0.2, 0.]
 
-    # coefficients for the fourth-order scheme:
-    # ( These haven't been tested ... )
-    # bs = [25./216., 0., 1408./2565., 2197./4104., -0.2, 0.]
-
-    return Y + dt * sum( [bi*ki for (bi,ki) in zip(b,k)] )
+def _fehlberg_stages (f, Y, t, dt):
+  """ Compute the six stage derivatives of the RK-Fehlberg 4(5) pair. """
+  
+  k  = [ f( Y, t ) ]
+  
+  for i in range(1,6):
+    ys = Y + dt* ( sum( [a*ki for (a,ki) in zip( _A_rkf[i], k)] )  )
+    ts = t + dt*_c_rkf[i]
+    k.append( f( ys, ts ) )
+  
+  return k
 
+#-------------------------------------------------------------------------------
+@scheme( order=5, stages=6,          cfl=_cfl_rkf5, safety=0.3 )
+@derivatives(1)
+def Fehlberg5(f, Y, t, dt ):
+  """RK-Fehlberg 5 method. """
+  
+  k = _fehlberg_stages( f, Y, t, dt )
+  
+  return Y + dt * sum( [bi*ki for (bi,ki) in zip(_b_rkf,k)] )
 
+#-------------------------------------------------------------------------------
+@scheme( order=5, stages=6,          cfl=_cfl_rkf5, safety=0.3 )
+@embedded(4)
+@derivatives(1)
+def Fehlberg45(f, Y, t, dt ):
+  """
+  RK-Fehlberg 4(5) embedded pair, with local extrapolation: return the solution
+  of the fifth-order method, and the difference between the fifth- and the
+  fourth-order solutions as an estimate of the local error.
+  
+  """
+  k = _fehlberg_stages( f, Y, t, dt )
+  
+  Y5  = Y + dt * sum( [bi*ki for (bi,ki) in zip(_b_rkf,k)] )
+  err =     dt * sum( [(bi-bsi)*ki for (bi,bsi,ki) in zip(_b_rkf,_bs_rkf,k)] )
+  
+  return Y5, err
 
 #===============================================================================
 # Two-derivative methods
 #===============================================================================
 
+@scheme( order=2, stages=1,          cfl=_cfl_rk2 )
+@derivatives(2)
 def Taylor2 (Fc, Y, t, dt):
   """ Two-derivative, 2nd-order explicit Taylor method.
   """
@@ -119,10 +372,12 @@ def Taylor2 (Fc, Y, t, dt):
   return Y + dt * ( k1 + (0.5*dt)* dk1 )
 
 #-------------------------------------------------------------------------------
+@scheme( order=3, stages=2,          cfl=_cfl_rk3, safety=0.55 )
+@derivatives(2)
 def TD_RK3 (Fc, Y, t, dt):
   """ Two-Derivative, 3rd-order Runge-Kutta method.
   """
-
+  
   k1,dk1 = Fc(Y, t)
   Ys     = Y + (dt) * ( k1 + (0.5*dt)* dk1 )
   k2,dk2 = Fc(Ys,t+1.0*dt)
@@ -130,6 +385,8 @@ def TD_RK3 (Fc, Y, t, dt):
   return Y + dt * ( (2.*k1+k2)/3. + dt/6. * (dk1) )
 
 #-------------------------------------------------------------------------------
+@scheme( order=4, stages=2,          cfl=_cfl_rk4 )
+@derivatives(2)
 def TD_RK4 (Fc, Y, t, dt):
   """ Two-Derivative, 4th-order Runge-Kutta method.
   """
@@ -140,97 +397,214 @@ def TD_RK4 (Fc, Y, t, dt):
   return Y + dt * ( k1 + dt/6. * (dk1 + 2.*dk2) )
 
 #-------------------------------------------------------------------------------
+@scheme( order=5, stages=3,          cfl=_cfl_td5, safety=0.45 )
+@derivatives(2)
 def TD_RK5 (Fc, Y, t, dt):
   """ Two-Derivative, 5th-order Runge-Kutta method.
   """
-
+  
   # Single parameter family defined by c3:
   c3 = 1.0
   #c3 = .8    # << this value should be unstable <<
-
+  
   # Remaining coefficients are defined by c3
   bs1 = (10.*c3**2-8.*c3+1.)/(12.*c3*(5.*c3-3.))
   bs2 = (25.*(2.*c3-1.)**3)  /(12.*(5.*c3-3.)*(10.*c3**2-10.*c3+3.))
   bs3 = 1./(12.*c3*(10.*c3**2-10.*c3+3.))
   c2  = (5.*c3-3.)/(5.*(2.*c3-1.))
-
+  
   a32 = (c3*(2.*c3-1.)*(10.*c3**2-10.*c3+3.))/(2.*(5.*c3-3.))
   a31 = 0.5*c3**2 - a32
   a21 = 0.5*c2**2
-
+  
   # First stage:
   k1,dk1 = Fc(Y, t)
-
+  
   # Second stage:
   Y2     = Y + c2*dt*k1 + (a21*dt**2)*dk1
   k2,dk2 = Fc(Y2,t+c2*dt)
-
+  
   # Third stage:
   Y3     = Y + dt*c3*k1 + dt**2*( a31*dk1+a32*dk2 )
   k3,dk3 = Fc(Y3, t + c3*dt)
-
+  
   # Final update:
   return Y + dt * ( k1 + dt * (bs1*dk1 + bs2*dk2 + bs3*dk3) )
 
 #===============================================================================
-# Low-storage SSP methods
+# In-place integrators with persistent stage registers
 #===============================================================================
 
-#-------------------------------------------------------------------------------
-#def ssp10_4(F, Y, t, dt):
-# """ Fourth-order, ten stage method.
-
-# This is a low-storage, optimal SSP(10,4) method.  
-
-# See: "Highly efficient strong stability-preserving Runge-Kutta methods with 
-#        low-storage implementations", Ketcheson, (2008).
-
-# for further details.
-
-
-# In particular, we follow the low-storage implementation
-# suggested in Pseudocode 3.  There's a single "stage" that
-# reassigns each register with a linear combination of the
-# two registers being used.
-# """
-
-# def AdvanceTimeStage( alpha1, q, alpha2, qnew, beta_dt, L ):
-#   
-#   qnew = alpha1*q    + alpha2*qnew + beta_dt*L
-#   t    = alpha1*told + alpha2*tnew + beta_dt
-
-#   return qnew
-
-# def AdvanceTimeStage4( told, qold, q1, q2 ):
-#   """See 'Pseudocode 3.' in "Highly efficient strong stability-preserving
-#      Runge-Kutta methods with low-storage implementations", (2008)."""
-
-#   # time advance:
-#   #   t2 = (told + 9.0*t1)*(1./25.);
-#   #   t1 = 15.0*t2 - 5.0*t1;          # i.e., t1 = .6*told+.4*t1
-
-#   q2 = (qold + 9.0*q1)/(25.0)
-#   q1 = 15.0*q2 - 5.0*q1
-
-#   return (q1,q2)
-
-# # coefficients defining the method:
-# alpha1 = np.ones(10)
-# alpha2 = np.zeros(10);          alpha2[9] = 3.0/5.0
-# beta   = 1.0/6.0*np.ones(10);   beta  [9] = 0.1
+class InPlaceStepper (object):
+  """
+  Base class for time integrators that overwrite the solution Y with its value
+  at the next time-level, using a fixed number of persistent 'registers' (i.e.
+  arrays with the same shape as Y).  The registers are allocated at the first
+  time-step, and reallocated only if the shape or type of Y changes; hence no
+  state-sized arrays are created by the integrator in steady state.
+  
+  An instance is called exactly like the functional integrators, i.e.
+  stepper(f,Y,t,dt), but it returns the same array Y.  In order to avoid any
+  temporary arrays, each array k=f(Y,t) is scaled in place once it has been
+  used: f must therefore return a new array, or a scratch array that it will
+  overwrite at its next call (e.g. MOL with reuse=True).
+  
+  """
+  nderiv     = 1      # number of time derivatives required from f
+  nregisters = 0      # number of state-sized registers
+  inplace    = True   # Y is overwritten by the integrator
+  
+  def __init__(self, name=None):
+    self.__name__    = name if name else type( self ).__name__
+    self._registers  = []
+    self._count      = 0
+  
+  #-----------------------------------------------------------------------------
+  def registers (self, Y):
+    """ Return the list of registers, allocating them if needed.
+    """
+    R = self._registers
+    if len(R) != self.nregisters or \
+        any( r.shape != Y.shape or r.dtype != Y.dtype for r in R ):
+      R = [np.empty_like( Y ) for i in range( self.nregisters )]
+      self._registers  = R
+      self._count     += self.nregisters
+    return R
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def allocations (self):
+    """ Total number of registers allocated so far. """
+    return self._count
+  
+  #-----------------------------------------------------------------------------
+  def __call__(self, f, Y, t, dt):
+    raise NotImplementedError('InPlaceStepper is an abstract class')
 
-# def AdvanceTimeStage( alpha1, q, alpha2, qnew, beta_dt, L ):
+#-------------------------------------------------------------------------------
+def axpy (a, x, y):
+  """ y <- y + a*x, without temporary arrays.  Array x is overwritten by a*x.
+  """
+  x *= a
+  y += x
 
-# <<< TODO : finish writing the small section <<<
+#-------------------------------------------------------------------------------
+class SSPRK3_InPlace (InPlaceStepper):
+  """ Third-order, three stage SSP method of Shu and Osher (see rk3_ssp).
+  Shu-Osher form, with one register.
+  """
+  nregisters = 1
+  
+  def __call__(self, f, Y, t, dt):
+    
+    Y1, = self.registers( Y )
+    
+    # First stage: Y1 = Y + dt*f(Y)
+    k = f( Y, t )
+    np.multiply( k, dt, out=Y1 );  Y1 += Y
+    
+    # Second stage: Y1 = 3/4*Y + 1/4*(Y1 + dt*f(Y1))
+    k = f( Y1, t+dt )
+    axpy( dt, k, Y1 )
+    Y1 *= 0.25
+    np.multiply( Y, 0.75, out=k );  Y1 += k
+    
+    # Final update: Y = 1/3*Y + 2/3*(Y1 + dt*f(Y1))
+    k = f( Y1, t+0.5*dt )
+    axpy( dt, k, Y1 )
+    Y  *= 1./3.
+    Y1 *= 2./3.
+    Y  += Y1
+    
+    return Y
 
-# for n in range(5):
-#   (q1,q2) = AdvanceTimeStage( alpha1[n], q1, alpha2[n], q1, dt*beta[n], f(q1,t) )
+#-------------------------------------------------------------------------------
+class RK4_InPlace (InPlaceStepper):
+  """ Classical fourth-order, four stage method (see rk4), with two registers:
+  the stage value and the accumulated update.
+  """
+  nregisters = 2
+  
+  def __call__(self, f, Y, t, dt):
+    
+    Ys, Yn = self.registers( Y )
+    
+    # First stage
+    k = f( Y, t )
+    np.multiply( k, 0.5*dt, out=Ys );  Ys += Y
+    k *= dt/6.
+    np.add( Y, k, out=Yn )
+    
+    # Second stage
+    k = f( Ys, t+0.5*dt )
+    np.multiply( k, 0.5*dt, out=Ys );  Ys += Y
+    axpy( dt/3., k, Yn )
+    
+    # Third stage
+    k = f( Ys, t+0.5*dt )
+    np.multiply( k, dt, out=Ys );  Ys += Y
+    axpy( dt/3., k, Yn )
+    
+    # Final update
+    k = f( Ys, t+dt )
+    axpy( dt/6., k, Yn )
+    np.copyto( Y, Yn )
+    
+    return Y
 
-# (q1,q2) = AdvanceTimeStage4( dt, Y, q1, q2 )
+#-------------------------------------------------------------------------------
+class SSPRK10_4 (InPlaceStepper):
+  """ Fourth-order, ten stage method.
+  
+  This is a low-storage, optimal SSP(10,4) method, with SSP coefficient 6.
+  We follow the two-register implementation suggested in Pseudocode 3 of
+  
+  "Highly efficient strong stability-preserving Runge-Kutta methods with 
+   low-storage implementations", Ketcheson, (2008).
+  
+  The solution Y itself is used as the first register.
+  """
+  nregisters = 1
+  
+  def __call__(self, f, Y, t, dt):
+    
+    q2, = self.registers( Y )
+    q1  = Y
+    t1  = t
+    
+    np.copyto( q2, q1 )
+    
+    # Stages 1-5
+    for n in range(5):
+      axpy( dt/6., f( q1, t1 ), q1 )
+      t1 = t1 + dt/6.   # (t may be an array: do not modify it in place)
+    
+    # q2 = (q2 + 9*q1)/25,  q1 = 15*q2 - 5*q1
+    q2 *= 1./9.;   q2 += q1;  q2 *= 9./25.
+    q1 *= -1./3.;  q1 += q2;  q1 *= 15.
+    t1  = 0.6*t + 0.4*t1
+    
+    # Stages 6-9
+    for n in range(5,9):
+      axpy( dt/6., f( q1, t1 ), q1 )
+      t1 = t1 + dt/6.
+    
+    # Final update: Y = q2 + 3/5*q1 + 1/10*dt*f(q1)
+    k = f( q1, t1 )
+    q1 *= 0.6
+    axpy( 0.1*dt, k, q1 )
+    q1 += q2
+    
+    return Y
 
-# for n in range(5,9):
-#   (q1,q2) = AdvanceTimeStage( alpha1[n], q1, alpha2[n], q2, dt*beta[n], f(q1,t) )
+#-------------------------------------------------------------------------------
+# Default instances, to be used as the functional integrators above
+rk3_ssp_inplace = SSPRK3_InPlace( 'rk3_ssp_inplace' )
+rk4_inplace     = RK4_InPlace   ( 'rk4_inplace'     )
+ssp10_4         = SSPRK10_4     ( 'ssp10_4'         )
 
-# (q1,q2) = AdvanceTimeStage( alpha1[n], q1, alpha2[n], q2, dt*beta[n], f(q1,t) )
+scheme( order=3, stages= 3, ssp=1.0, cfl=_cfl_rk3 )(rk3_ssp_inplace)
+scheme( order=4, stages= 4,          cfl=_cfl_rk4 )(rk4_inplace)
+scheme( order=4, stages=10, ssp=6.0, cfl=_cfl_ssp4 )(ssp10_4)
 
-# return Y + dt*k2
+#===============================================================================
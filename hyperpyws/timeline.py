@@ -22,6 +22,9 @@ This module contains the class 'TimeManager', which manages the simulation time.
 TimeManager is like a 'single clock' which every other object synchronizes with.
 Of course, time should be advanced in one specific place only.
 
+It also contains the class 'PIController', which chooses the time-step size of
+an embedded Runge-Kutta pair from its local error estimate.
+
 """
 #
 # Author: Yaman Güçlü, January 2013 - Michigan State University
@@ -29,9 +32,11 @@ Of course, time should be advanced in one specific place only.
 # Last revision: 27 Jan 2013
 #
 
-__all__ = ['TimeManager']
+__all__ = ['TimeManager','PIController']
 __docformat__ = 'reStructuredText'
 
+import numpy as np
+
 #===============================================================================
 # CLASS: Time Manager
 #===============================================================================
@@ -79,3 +84,119 @@ class TimeManager (object):
     """ Property: get time-step number.
     """
     return self._ts
+
+#===============================================================================
+# CLASS: PI step-size controller
+#===============================================================================
+
+class PIController (object):
+  """
+  Proportional-integral (PI) controller of the time-step size, for embedded
+  Runge-Kutta pairs.  After each step the local error estimate 'err' is
+  measured in the scaled max-norm
+  
+    E = max |err| / (tol * (1 + |Y|)),
+  
+  the step is accepted if E <= 1, and the next step size is
+  
+    dt_new = dt * safety * E^(-alpha) * E_old^(beta),
+  
+  with alpha = 0.7/k, beta = 0.4/k and k = p+1, p being the order of the lower
+  order method of the pair.  After a rejection, the integral part is dropped
+  and the step size is not allowed to increase, neither in the new attempt nor
+  in the step that follows the next accepted one.
+  
+  Parameters
+  ----------
+  tol : float
+    Tolerance on the local error (both absolute and relative).
+  order : int
+    Order of the error estimator (e.g. 4 for Fehlberg's 4(5) pair).
+  safety : float
+    Safety factor.
+  facmin, facmax : float
+    Bounds on the ratio between two consecutive step sizes.
+  
+  """
+  def __init__(self, tol, order, safety=0.9, facmin=0.2, facmax=5.0):
+    
+    k = order + 1.0
+    
+    self.tol    = tol
+    self.alpha  = 0.7/k
+    self.beta   = 0.4/k
+    self.k      = k
+    self.safety = safety
+    self.facmin = facmin
+    self.facmax = facmax
+    
+    self._Eold     = 1.0
+    self._reject   = False    # True if the last step was rejected
+    self._accepted = 0
+    self._rejected = 0
+  
+  #-----------------------------------------------------------------------------
+  def error (self, err, Y):
+    """
+    Scaled max-norm of the local error estimate.
+    
+    Parameters
+    ----------
+    err : numpy.ndarray
+      Local error estimate, with the same layout as Y.
+    Y : numpy.ndarray
+      Solution at the end of the step.
+    
+    """
+    return max( np.amax( abs(e) / (self.tol*(1.0+abs(y))) ) \
+                for (e,y) in zip(err,Y) )
+  
+  #-----------------------------------------------------------------------------
+  def update (self, dt, E):
+    """
+    Decide whether the step of size dt, with scaled error E, is accepted, and
+    propose the size of the next step (or of the new attempt).
+    
+    Returns
+    -------
+    accept : bool
+      True if the step is accepted.
+    dt_new : float
+      Proposed time-step size.
+    
+    """
+    accept = (E <= 1.0)
+    
+    if accept:
+      if E == 0.0:
+        fac = self.facmax
+      else:
+        fac = self.safety * E**(-self.alpha) * self._Eold**self.beta
+      # No growth right after a rejection
+      facmax = 1.0 if self._reject else self.facmax
+      fac = min( facmax, max( self.facmin, fac ) )
+      self._Eold      = max( E, 1.0e-4 )
+      self._accepted += 1
+    else:
+      fac = self.safety * E**(-1.0/self.k)
+      fac = min( 1.0, max( self.facmin, fac ) )
+      self._rejected += 1
+    
+    self._reject = not accept
+    
+    return accept, dt*fac
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def accepted (self):
+    """ Property: number of accepted steps.
+    """
+    return self._accepted
+  
+  @property
+  def rejected (self):
+    """ Property: number of rejected steps.
+    """
+    return self._rejected
+
+#===============================================================================
@@ -0,0 +1,108 @@
+#coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+import numpy as np
+
+#===============================================================================
+
+class WaveSpeed (object):
+  """
+  Maximum wave speed of the model equations, shared by the time-step selection
+  (CFL condition) and by the Lax-Friedrichs flux splitting of MOL.
+  
+  At the beginning of a time-step the speed is evaluated on the current state,
+  and the value is cached with an invalidation token: the state buffer and the
+  time instant.  The first stage of the time integrator is evaluated on the
+  same state, hence MOL retrieves the cached value instead of computing it
+  again.  The cached value is dropped as soon as it has been retrieved, since
+  in-place integrators overwrite the state buffer at later stages.
+  
+  Parameters
+  ----------
+  flux : Flux1D
+    Model equations
+  
+  analytic : bool
+    If True, use the bound of the wave speed over all admissible states given
+    by flux.MaxWaveSpeedBound(): this is computed only once, and no work is
+    done at each stage (the time-step may be smaller, since the bound does
+    not depend on the actual range of the solution)
+  
+  """
+  def __init__(self, flux, analytic=False):
+    
+    self._flux  = flux
+    self._bound = None
+    self._count = 0
+    
+    if analytic:
+      self._bound = flux.MaxWaveSpeedBound()
+      if self._bound is None:
+        raise ValueError('Model equations have no analytic bound of the '\
+                         'maximum wave speed')
+    
+    # Cached value and its token
+    self._state = None
+    self._time  = None
+    self._value = None
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def analytic (self):
+    """ True if the analytic bound of the wave speed is used. """
+    return self._bound is not None
+  
+  @property
+  def evaluations (self):
+    """ Number of evaluations of flux.MaxWaveSpeed so far. """
+    return self._count
+  
+  #-----------------------------------------------------------------------------
+  def evaluate (self, q):
+    """
+    Maximum wave speed of state q (component index along the first axis), or
+    analytic bound if available: one value per ensemble member, if any.
+    
+    """
+    if self._bound is not None:
+      return self._bound
+    self._count += 1
+    return self._flux.MaxWaveSpeed( q )
+  
+  #-----------------------------------------------------------------------------
+  def share (self, value, state, t):
+    """ Cache value of wave speed for the given state buffer at time t. """
+    self._state = state
+    self._time  = np.copy( t )
+    self._value = value
+  
+  def shared (self, state, t):
+    """
+    Return the cached wave speed if its token matches the state buffer and
+    the time instant t, or None otherwise.  The cache is cleared in any case.
+    
+    """
+    value = None
+    if t is not None and state is self._state and \
+        np.array_equal( t, self._time ):
+      value = self._value
+    self._state = self._time = self._value = None
+    return value
+
+#===============================================================================
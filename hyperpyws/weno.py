@@ -37,12 +37,15 @@ class WenoMetaClass (ABCMeta):
     """
     return cls._mbc
   
+# Base class created by calling the metaclass (same in Python 2 and 3)
+_WenoBase = WenoMetaClass( '_WenoBase', (object,), {} )
+
 #===============================================================================
 
-class WenoReconstruction (object):
+class WenoReconstruction (_WenoBase):
   """ Abstract base class for any WENO reconstruction algorithm.
   """
-  __metaclass__ = WenoMetaClass
+  backend = 'numpy'   # implementation (see weno_versions.Weno)
   
   def __init__(self):
     raise Exception('Abstract class cannot be instantiated.')
@@ -54,5 +57,22 @@ class WenoReconstruction (object):
   @abstractmethod
   def reconstruct_right (cls, *u_stencil):
     """ Reconstruct quantity u[i-1/2] using stencil shifted to the right. """
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left_stacked (cls, U):
+    """
+    Same as reconstruct_left(*U), with the stencil values stacked along the
+    first axis of array U.  Linear schemes override this method in order to
+    apply their coefficients in a single pass over U.
+    
+    """
+    return cls.reconstruct_left( *U )
+  
+  @classmethod
+  def reconstruct_right_stacked (cls, U):
+    """ Same as reconstruct_right(*U), see reconstruct_left_stacked.
+    """
+    return cls.reconstruct_right( *U )
 
 #===============================================================================
@@ -14,7 +14,7 @@
 #
 #===============================================================================
 
-def Weno( order, version ):
+def Weno( order, version, backend='auto', hybrid=None ):
   """
   Selector function for the 'weno_versions' module: selects and returns 
   the appropriate class from the correct sub-module.
@@ -22,12 +22,25 @@ def Weno( order, version ):
   Parameters
   ----------
   order : int
-    Nominal order of reconstruction procedure (only valid for smooth profiles)
+    Nominal order of reconstruction procedure (only valid for smooth profiles):
+    3, 5, 7, 9 or 11.  Orders 5 and 7 use hand-written classes, the others the
+    generic implementation of module weno_generic (NumPy backend only).
   
   version : str
     WENO reconstruction family 
     (different families differ for non-linear weights and smoothness parameters)
   
+  backend : str
+    Implementation: 'numpy' (array expressions), 'numba' (compiled single-pass
+    kernels, see weno_numba), or 'auto' (numba if available, else numpy).  If 
+    Numba is not installed, the NumPy classes are returned (with a warning if
+    'numba' was requested explicitly).
+  
+  hybrid : float
+    If given, return a hybrid reconstruction (see module hybrid) that uses the
+    requested WENO version only where the discontinuity sensor exceeds this
+    threshold, and the linear reconstruction (CFD) of same order elsewhere.
+  
   Returns
   -------
   cls : type
@@ -36,7 +49,7 @@ def Weno( order, version ):
   
   """
   # Available WENO order and version
-  avail_order   = (5,7) 
+  avail_order   = (3,5,7,9,11)
   avail_version = ('JS','Z','CFD')
   
   # Check input: order
@@ -51,10 +64,31 @@ def Weno( order, version ):
   if version not in avail_version:
     raise ValueError( 'Requested family {:s} not available'.format( version ) )
   
+  # Check input: backend
+  if backend not in ('auto','numpy','numba'):
+    raise ValueError( 'Requested backend {} not available'.format( backend ) )
+  
+  if backend != 'numpy':
+    from . import weno_numba
+    if not weno_numba.available and backend == 'numba':
+      import warnings
+      warnings.warn( 'Numba not available: using NumPy backend for WENO' )
+    if not weno_numba.available:
+      backend = 'numpy'
+  
+  # Generic implementation for orders without hand-written classes
+  if order not in (5,7):
+    from .weno_generic import WenoClass
+    cls = WenoClass( order, version )
+    if hybrid is not None:
+      return _MakeHybrid( cls, order, version, backend, hybrid )
+    return cls
+  
   # Import correct module
-  if   version == 'JS' :  from . import weno_js as mod
-  elif version == 'Z'  :  from . import weno_z  as mod
-  elif version == 'CFD':  from . import cfd     as mod
+  if   backend != 'numpy':  from . import weno_numba as mod
+  elif version == 'JS'   :  from . import weno_js    as mod
+  elif version == 'Z'    :  from . import weno_z     as mod
+  elif version == 'CFD'  :  from . import cfd        as mod
   
   # Determine class name
   if   version == 'JS' :  cls_name = 'Weno{:d}_JS'.format( order )
@@ -65,7 +99,21 @@ def Weno( order, version ):
   try:
     cls = getattr( mod, cls_name )
   except AttributeError:
-    raise NotImplementedError, "Class '{}' not available".format( cls_name )
+    raise NotImplementedError( "Class '{}' not available".format( cls_name ) )
+  
+  # Hybrid WENO/linear reconstruction
+  if hybrid is not None:
+    return _MakeHybrid( cls, order, version, backend, hybrid )
   
   # Return class handler
   return cls
+
+#===============================================================================
+
+def _MakeHybrid( cls, order, version, backend, threshold ):
+  """ Combine WENO class 'cls' with the linear scheme of the same order.
+  """
+  if version == 'CFD':
+    raise ValueError( 'Hybrid reconstruction requires a WENO version' )
+  from .hybrid import Hybrid
+  return Hybrid( cls, Weno( order, 'CFD', backend ), threshold )
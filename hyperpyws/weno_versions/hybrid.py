@@ -0,0 +1,182 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+"""
+Hybrid WENO/linear reconstruction.  In smooth regions the non-linear WENO
+weights are almost equal to the linear weights, hence the linear (upwind)
+reconstruction of the same order gives the same result at a fraction of the
+cost.  A cheap discontinuity sensor is evaluated on each stencil: the full
+WENO reconstruction is computed only at the flagged points, and the linear
+one everywhere else.
+
+The sensor is a normalized jump detector: given the differences d[k] =
+u[k+1]-u[k] over the stencil, it takes the ratio
+
+  s = max_k |d[k+1]-d[k]| / ( sum_k |d[k]| + eps*sum_k |u[k]| + tiny ),
+
+which is O(dx) for smooth data and O(1) across a discontinuity.  The relative
+noise floor eps*sum|u| prevents flagging round-off oscillations in constant
+states, and smooth extrema (where d[k] vanishes and the ratio is O(1) without
+the floor, in particular in characteristic variables).  A point is flagged if
+s > threshold.
+
+"""
+
+__all__ = ['HybridReconstruction', 'Hybrid']
+__docformat__ = 'reStructuredText'
+
+import numpy as np
+
+from ..weno import WenoReconstruction
+
+#===============================================================================
+# CLASS: hybrid reconstruction
+#===============================================================================
+
+class HybridReconstruction (WenoReconstruction):
+  """
+  Abstract base class for hybrid reconstructions (use the function Hybrid to
+  create a concrete class).  The class counts the flagged points and the total
+  number of reconstructed points, see flagged_fraction().
+  
+  """
+  _weno      = None     # WENO reconstruction, used on flagged points
+  _linear    = None     # linear reconstruction, used elsewhere
+  _threshold = 0.1      # sensor threshold
+  _sens_eps  = 1.e-3    # relative noise floor of sensor
+  _sens_tiny = 1.e-300  # regularization of sensor (avoids division by 0)
+  _counts    = None     # [flagged points, total points]
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def sensor (cls, *u_stencil):
+    """ Normalized jump detector on the stencil (see module docstring).
+    """
+    d   = [ b-a for a,b in zip( u_stencil[:-1], u_stencil[1:] ) ]
+    num = abs( d[1]-d[0] )
+    for k in range( 2, len(d) ):
+      np.maximum( num, abs( d[k]-d[k-1] ), out=num )
+    den = sum( abs( dk ) for dk in d ) + cls._sens_tiny \
+        + cls._sens_eps * sum( abs( uk ) for uk in u_stencil )
+    return num / den
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def _hybrid (cls, method, u_stencil, stacked=False):
+    
+    def apply (rec, u):
+      return getattr( rec, method )( *([u] if stacked else u) )
+    
+    # Linear reconstruction everywhere
+    u = apply( cls._linear, u_stencil )
+    
+    # WENO reconstruction at flagged points only (on compacted copies)
+    flag = cls.sensor( *u_stencil ) > cls._threshold
+    nf   = np.count_nonzero( flag )
+    if nf > 0:
+      if stacked:
+        u[flag] = apply( cls._weno, u_stencil[:,flag] )
+      else:
+        u[flag] = apply( cls._weno, [ui[flag] for ui in u_stencil] )
+    
+    cls._counts[0] += nf
+    cls._counts[1] += flag.size
+    return u
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left (cls, *u_stencil):
+    """ Reconstruct u_{i+1/2}.
+    """
+    return cls._hybrid( 'reconstruct_left', u_stencil )
+  
+  @classmethod
+  def reconstruct_right (cls, *u_stencil):
+    """ Reconstruct u_{i-1/2}.
+    """
+    # The sensor is symmetric: the same points are flagged
+    return cls._hybrid( 'reconstruct_right', u_stencil )
+  
+  @classmethod
+  def reconstruct_left_stacked (cls, U):
+    """ Reconstruct u_{i+1/2} from stacked stencil values (stacked methods of
+        the linear and WENO classes).
+    """
+    return cls._hybrid( 'reconstruct_left_stacked', np.asarray( U ), True )
+  
+  @classmethod
+  def reconstruct_right_stacked (cls, U):
+    """ Reconstruct u_{i-1/2} from stacked stencil values (stacked methods of
+        the linear and WENO classes).
+    """
+    return cls._hybrid( 'reconstruct_right_stacked', np.asarray( U ), True )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def flagged_fraction (cls, reset=True):
+    """
+    Return the fraction of reconstructed points that were flagged by the
+    sensor since the last reset (None if nothing was reconstructed), and
+    optionally reset the counters.
+    
+    """
+    flagged, total = cls._counts
+    if reset:
+      cls._counts[:] = [0, 0]
+    return float( flagged ) / total if total > 0 else None
+
+#===============================================================================
+# FUNCTION: create hybrid reconstruction class
+#===============================================================================
+
+def Hybrid( weno, linear, threshold=0.1 ):
+  """
+  Create a hybrid reconstruction class, which uses 'weno' on the points
+  flagged by the discontinuity sensor and 'linear' on all other points.
+  
+  Parameters
+  ----------
+  weno : type
+    Non-linear WENO reconstruction class (e.g. Weno5_Z)
+  linear : type
+    Linear reconstruction class with the same stencil
+    (e.g. CentralFiniteDifference5)
+  threshold : float
+    Sensor threshold: lower values flag more points
+  
+  Returns
+  -------
+  cls : type
+    Subclass of HybridReconstruction, with its own counters
+  
+  """
+  if weno.stencil != linear.stencil:
+    raise ValueError('WENO and linear reconstructions must share the stencil')
+  if threshold < 0.0:
+    raise ValueError('threshold must be a non-negative number')
+  
+  attrs = { '_stencil'  : weno.stencil,
+            '_mbc'      : weno.mbc,
+            '_weno'     : weno,
+            '_linear'   : linear,
+            '_threshold': threshold,
+            '_counts'   : [0, 0],
+            '__module__': __name__ }
+  
+  name = 'Hybrid{}'.format( weno.__name__ )
+  return type( HybridReconstruction )( name, (HybridReconstruction,), attrs )
+
+#===============================================================================
@@ -0,0 +1,357 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+"""
+WENO reconstructions of arbitrary order 2r-1 (r = 2,...,6) on a uniform mesh.
+
+Instead of spelling out the formulas of each order, the coefficients are
+generated in exact rational arithmetic, once for each r, and cached:
+
+* candidate reconstructions of u_{i+1/2} on the r small r-point stencils;
+* linear weights, which combine them into the (2r-1)-point reconstruction;
+* Jiang-Shu smoothness indicators, as sums of squares of linear forms
+  (LDL^T factorization of the quadratic forms);
+* combination of the smoothness indicators used by WENO-Z (tau).
+
+All stencil values are stacked into a (2r-1,M) block, so that the candidate
+values and the linear forms of the smoothness indicators are evaluated by two
+small matrix products, for all points at once.  The classes have the same
+interface as the hand-written ones (weno_js, weno_z, cfd), which are still
+used by the selector Weno() for orders 5 and 7.
+
+  See: C.-W. Shu, "High order weighted essentially nonoscillatory schemes for
+       convection dominated problems", SIAM Review 51 (2009), pp. 82-126.
+       
+       M. Castro, B. Costa, W.S. Don, "High order weighted essentially
+       non-oscillatory WENO-Z schemes for hyperbolic conservation laws",
+       J. Comput. Phys. 230 (2011), pp. 1766-1792.
+
+"""
+
+__all__ = ['avail_r', 'Coefficients', 'WenoClass']
+__docformat__ = 'reStructuredText'
+
+import numpy as np
+from fractions import Fraction
+
+from ..weno import WenoReconstruction
+from .cfd   import LinearReconstruction
+
+# Available values of r (order of accuracy is 2r-1)
+avail_r = (2,3,4,5,6)
+
+# Coefficients of tau = |sum_k c_k beta_k| in WENO-Z (Castro et al., Table 2)
+_tau_coeffs = { 2: [1,-1],
+                3: [1, 0,-1],
+                4: [1, 3,-3,-1],
+                5: [1, 2,-6, 2, 1],
+                6: [1,36,135,-135,-36,-1] }
+
+#===============================================================================
+# FUNCTIONS: exact generation of the coefficients
+#===============================================================================
+
+def _poly_mul( a, b ):
+  c = [Fraction(0)]*(len(a)+len(b)-1)
+  for i,ai in enumerate( a ):
+    for j,bj in enumerate( b ):
+      c[i+j] += ai*bj
+  return c
+
+def _poly_diff( a ):
+  return [ k*ak for k,ak in enumerate( a ) ][1:] or [Fraction(0)]
+
+def _poly_int01( a ):
+  return sum( ak / (k+1) for k,ak in enumerate( a ) )
+
+#-------------------------------------------------------------------------------
+def _cell_basis( first, ncells ):
+  """
+  Polynomials phi[j] (coefficients in powers of x) such that
+  p(x) = sum_j ubar[j]*phi[j](x) is the unique polynomial of degree ncells-1
+  with cell averages ubar[j] on the cells [first+j, first+j+1].
+  
+  """
+  # Lagrange basis on the cell edges, for the primitive function of p
+  edges = [ Fraction( first+m ) for m in range( ncells+1 ) ]
+  dL    = []
+  for m,xm in enumerate( edges ):
+    L = [Fraction(1)]
+    for l,xl in enumerate( edges ):
+      if l != m:
+        L = _poly_mul( L, [-xl/(xm-xl), 1/(xm-xl)] )
+    dL.append( _poly_diff( L ) )
+  
+  # p = d/dx sum_m P(x_m) L_m, with P(x_m) = sum_{j<m} ubar[j]
+  phi = []
+  for j in range( ncells ):
+    c = [Fraction(0)]*ncells
+    for m in range( j+1, ncells+1 ):
+      c = [ ck + dk for ck,dk in zip( c, dL[m] ) ]
+    phi.append( c )
+  return phi
+
+def _evaluate( poly, x ):
+  return sum( ak * x**k for k,ak in enumerate( poly ) )
+
+#-------------------------------------------------------------------------------
+def _smoothness_form( phi ):
+  """
+  Rows of the linear forms g_m such that beta = sum_m (g_m . ubar)**2 is the
+  Jiang-Shu smoothness indicator sum_l int_0^1 (p^(l)(x))**2 dx on cell [0,1]
+  (LDL^T factorization; the null eigenvalue of the constants is dropped).
+  
+  """
+  r = len( phi )
+  
+  # Symmetric matrix of the quadratic form
+  B = [[Fraction(0)]*r for j in range( r )]
+  for l in range( 1, r ):
+    dphi = list( phi )
+    for n in range( l ):
+      dphi = [ _poly_diff( p ) for p in dphi ]
+    for i in range( r ):
+      for j in range( r ):
+        B[i][j] += _poly_int01( _poly_mul( dphi[i], dphi[j] ) )
+  
+  # LDL^T factorization without pivoting: the leading minors of order < r are
+  # positive definite, and the last pivot is zero
+  L = [[Fraction( int(i==j) ) for j in range( r )] for i in range( r )]
+  D = [Fraction(0)]*r
+  for j in range( r ):
+    D[j] = B[j][j] - sum( L[j][k]**2 * D[k] for k in range( j ) )
+    for i in range( j+1, r ):
+      if D[j] != 0:
+        L[i][j] = ( B[i][j] - sum( L[i][k]*L[j][k]*D[k] for k in range(j) ) ) \
+                  / D[j]
+  
+  return [ [ float(L[i][m]) * np.sqrt( float(D[m]) ) for i in range( r ) ]
+           for m in range( r ) if D[m] != 0 ]
+
+#-------------------------------------------------------------------------------
+_cache = {}
+
+def Coefficients( r ):
+  """
+  Coefficients of the WENO reconstruction of order 2r-1 (generated once, then
+  cached).  The stencil is [-r+1,...,r-1], and the small stencil k covers the
+  points [k-r+1,...,k] (k = 0,...,r-1).
+  
+  Parameters
+  ----------
+  r : int
+    Number of points of the small stencils
+  
+  Returns
+  -------
+  C : numpy.ndarray
+    (r,2r-1) matrix: row k gives the reconstruction of u_{i+1/2} from stencil k
+  gamma : numpy.ndarray
+    (r,) linear weights
+  full : numpy.ndarray
+    (2r-1,) linear reconstruction of u_{i+1/2} (= gamma.dot(C))
+  G : numpy.ndarray
+    (r*(r-1),2r-1) linear forms: the smoothness indicator of stencil k is the
+    sum of the squares of the rows k*(r-1),...,(k+1)*(r-1)-1 applied to u
+  tau : numpy.ndarray
+    (r,) coefficients of tau in WENO-Z
+  
+  """
+  if r in _cache:
+    return _cache[r]
+  
+  if r not in avail_r:
+    raise ValueError( 'Requested r = {} not available'.format( r ) )
+  
+  w   = 2*r-1
+  one = Fraction(1)
+  
+  # Candidate reconstructions, and reconstruction on the full stencil
+  C = [[Fraction(0)]*w for k in range( r )]
+  G = []
+  for k in range( r ):
+    phi = _cell_basis( k-r+1, r )
+    for j in range( r ):
+      C[k][k+j] = _evaluate( phi[j], one )
+    for g in _smoothness_form( phi ):
+      G.append( [0.]*k + g + [0.]*(r-1-k) )
+  full = [ _evaluate( p, one ) for p in _cell_basis( -r+1, w ) ]
+  
+  # Linear weights: match the coefficients of the full stencil from the left
+  gamma = []
+  for k in range( r ):
+    rest = full[k] - sum( gamma[n]*C[n][k] for n in range( k ) )
+    gamma.append( rest / C[k][k] )
+  assert all( sum( gamma[k]*C[k][j] for k in range( r ) ) == full[j]
+              for j in range( w ) )
+  
+  coeffs = ( np.array( C, dtype=float ),
+             np.array( gamma, dtype=float ),
+             np.array( full, dtype=float ),
+             np.array( G, dtype=float ),
+             np.array( _tau_coeffs[r], dtype=float ) )
+  for c in coeffs:
+    c.setflags( write=False )
+  
+  _cache[r] = coeffs
+  return coeffs
+
+#===============================================================================
+# CLASSES: generic WENO-JS, WENO-Z and linear reconstructions
+#===============================================================================
+
+class GenericReconstruction( WenoReconstruction ):
+  """
+  Abstract base class for the reconstructions of order 2r-1 (use the function
+  WenoClass to create a concrete class).  Methods act on the stacked block of
+  stencil values.
+  
+  """
+  _r       = None       # number of points of the small stencils
+  _version = None       # 'JS', 'Z' or 'CFD'
+  _eps     = 1.e-12     # regularization parameter (avoids division by 0)
+  _p       = 2          # power parameter in WENO-Z weights
+  
+  #-----------------------------------------------------------------------------
+  @staticmethod
+  def _stack( u_stencil ):
+    U = np.asarray( u_stencil )
+    U = U.astype( np.result_type( U.dtype, float ) )  # complex values allowed
+    return U.reshape( len( u_stencil ), -1 ), U.shape[1:]
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def _weights( cls, beta ):
+    """ Non-normalized weights of the candidates, from smoothness indicators.
+    """
+    C, gamma, full, G, tau = Coefficients( cls._r )
+    
+    if cls._version == 'JS':
+      return gamma[:,None] / ( cls._eps + beta )**2
+    else:
+      t = abs( tau.dot( beta ) )
+      return gamma[:,None] * ( 1. + ( t / ( beta + cls._eps ) )**cls._p )
+  
+  @classmethod
+  def smoothness_indicators( cls, U ):
+    """ Smoothness indicators (r,M) of the small stencils of the block U.
+    """
+    r = cls._r
+    G = Coefficients( r )[3]
+    return ( G.dot( U )**2 ).reshape( r, r-1, -1 ).sum( axis=1 )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left( cls, *u_stencil ):
+    """ Reconstruct u_{i+1/2}.
+    """
+    return cls.reconstruct_left_stacked( u_stencil )
+  
+  @classmethod
+  def reconstruct_right( cls, *u_stencil ):
+    """ Reconstruct u_{i-1/2}.
+    """
+    return cls.reconstruct_left_stacked( u_stencil[::-1] )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left_stacked( cls, U ):
+    """ Reconstruct u_{i+1/2} from stacked stencil values (no copy of U if
+        it is an array with contiguous points).
+    """
+    U, shape = cls._stack( U )
+    C, gamma, full, G, tau = Coefficients( cls._r )
+    
+    if cls._version == 'CFD':
+      return LinearReconstruction._apply( full, U ).reshape( shape )
+    
+    om = cls._weights( cls.smoothness_indicators( U ) )
+    u  = LinearReconstruction._apply( C, U )
+    return ( ( om * u ).sum( axis=0 ) / om.sum( axis=0 ) ).reshape( shape )
+  
+  @classmethod
+  def reconstruct_right_stacked( cls, U ):
+    """ Reconstruct u_{i-1/2} from stacked stencil values.
+    """
+    return cls.reconstruct_left_stacked( U[::-1] )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def get_eps( cls ):
+    return cls._eps
+  
+  @classmethod
+  def set_eps( cls, eps ):
+    cls._eps = eps
+  
+  @classmethod
+  def get_p( cls ):
+    return cls._p
+  
+  @classmethod
+  def set_p( cls, p ):
+    cls._p = p
+
+#===============================================================================
+# FUNCTION: create (and cache) concrete classes
+#===============================================================================
+
+_classes = {}
+
+def WenoClass( order, version ):
+  """
+  Return the generic reconstruction class of given order and version, with
+  the same name as the hand-written classes (e.g. Weno9_Z).
+  
+  Parameters
+  ----------
+  order : int
+    Order of accuracy 2r-1 (3, 5, 7, 9 or 11)
+  version : str
+    'JS', 'Z' or 'CFD'
+  
+  Returns
+  -------
+  cls : type
+    Subclass of GenericReconstruction
+  
+  """
+  key = (order, version)
+  if key in _classes:
+    return _classes[key]
+  
+  r = (order+1) // 2
+  if order % 2 == 0 or r not in avail_r:
+    raise ValueError( 'Requested order {} not available'.format( order ) )
+  if version not in ('JS','Z','CFD'):
+    raise ValueError( 'Requested version {} not available'.format( version ) )
+  
+  if version == 'CFD':  name = 'CentralFiniteDifference{:d}'.format( order )
+  else               :  name = 'Weno{:d}_{}'.format( order, version )
+  
+  attrs = { '_r'        : r,
+            '_version'  : version,
+            '_stencil'  : list( range( -r+1, r ) ),
+            '_mbc'      : r,
+            '__module__': __name__,
+            '__doc__'   : 'Generic reconstruction of order {} ({}).'\
+                          .format( order, version ) }
+  
+  cls = type( GenericReconstruction )( name, (GenericReconstruction,), attrs )
+  _classes[key] = cls
+  return cls
+
+#===============================================================================
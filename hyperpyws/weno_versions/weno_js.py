@@ -17,7 +17,10 @@
 #===============================================================================
 
 
+import numpy as np
+
 from ..weno import WenoReconstruction
+from .cfd   import LinearReconstruction
 
 #===============================================================================
 # CLASS: Weno5_JS
@@ -43,6 +46,10 @@ class Weno5_JS( WenoReconstruction ):
   _stencil = [-2,-1,0,+1,+2]  # 5-point stencil
   _eps     = 1.e-12           # regularization parameter (avoids division by 0)
   _mbc     = 3                # required number of ghost-cells
+  # 3rd-order reconstructions using small 3-point stencils
+  _candidates = np.array( [[2., -7., 11., 0.,  0.],
+                           [0., -1.,  5., 2.,  0.],
+                           [0.,  0.,  2., 5., -1.]] ) / 6.
   
   #-----------------------------------------------------------------------------
   @classmethod
@@ -52,24 +59,29 @@ class Weno5_JS( WenoReconstruction ):
     # Use reconstruct_left method, after inverting the order of the stencil:
     return cls.reconstruct_left( *u_stencil[::-1] )
   
+  @classmethod
+  def reconstruct_right_stacked( cls, U ):
+    """ Reconstruct u_{i-1/2} from stacked stencil values.
+    """
+    return cls.reconstruct_left_stacked( U[::-1] )
+  
   #-----------------------------------------------------------------------------
   @classmethod
   def reconstruct_left( cls, *u_stencil ):
     """ Reconstruct u_{i+1/2}.
     """
-    # lazy, but readable indexing into list that's being passed in:
-    uim2, uim1, ui, uip1, uip2 = u_stencil
-    
+    return cls.reconstruct_left_stacked( u_stencil )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left_stacked( cls, U ):
+    """ Reconstruct u_{i+1/2} from stacked stencil values.
+    """
     # Compute smoothness indicators (identical for left/right values):
-    beta = [None]*3
-    beta[0]=(13./12.)*(uim2-2*uim1+ui)**2+0.25*(uim2-4*uim1+3*ui)**2
-    beta[1]=(13./12.)*(uim1-2*ui+uip1)**2+0.25*(uim1-uip1)**2
-    beta[2]=(13./12.)*(ui-2*uip1+uip2)**2+0.25*(3*ui-4*uip1+uip2)**2
+    beta = cls.smoothness_indicators( *U )
     
-    # 3rd-order reconstructions using small 3-point stencils
-    u1 = ( 1./3.)*uim2 - (7./6.)*uim1 + (11./6.)*ui
-    u2 = (-1./6.)*uim1 + (5./6.)*ui   + ( 1./3.)*uip1
-    u3 = ( 1./3.)*ui   + (5./6.)*uip1 - ( 1./6.)*uip2
+    # Candidate reconstructions on the small stencils (one dot product)
+    u = LinearReconstruction._apply( cls._candidates, U )
     
     # Get linear weights and regularization parameter
     gamma = [0.1, 0.6, 0.3]
@@ -81,7 +93,18 @@ class Weno5_JS( WenoReconstruction ):
     om   = [ o / omts for o in omt ]
     
     # Return 5th-order conservative reconstruction
-    return om[0]*u1 + om[1]*u2 + om[2]*u3
+    return om[0]*u[0] + om[1]*u[1] + om[2]*u[2]
+  
+  #-----------------------------------------------------------------------------
+  @staticmethod
+  def smoothness_indicators( uim2, uim1, ui, uip1, uip2 ):
+    """ Jiang-Shu smoothness indicators of the three 3-point stencils.
+    """
+    beta = [None]*3
+    beta[0]=(13./12.)*(uim2-2*uim1+ui)**2+0.25*(uim2-4*uim1+3*ui)**2
+    beta[1]=(13./12.)*(uim1-2*ui+uip1)**2+0.25*(uim1-uip1)**2
+    beta[2]=(13./12.)*(ui-2*uip1+uip2)**2+0.25*(3*ui-4*uip1+uip2)**2
+    return beta
   
   #-----------------------------------------------------------------------------
   @classmethod
@@ -111,6 +134,11 @@ class Weno7_JS( WenoReconstruction ):
   _stencil = [-3,-2,-1,0,+1,+2,+3]  # 7-point stencil
   _eps     = 1.e-12                 # regularization param. (avoids divide by 0)
   _mbc     = 4                      # required number of ghost-cells
+  # 4th-order reconstructions using small 4-point stencils
+  _candidates = np.array( [[-3., 13., -23., 25.,  0.,  0., 0.],
+                           [ 0.,  1.,  -5., 13.,  3.,  0., 0.],
+                           [ 0.,  0.,  -1.,  7.,  7., -1., 0.],
+                           [ 0.,  0.,   0.,  3., 13., -5., 1.]] ) / 12.
   
   #-----------------------------------------------------------------------------
   @classmethod
@@ -119,55 +147,70 @@ class Weno7_JS( WenoReconstruction ):
     """
     # Use reconstruct_left method, after inverting the order of the stencil:
     return cls.reconstruct_left( *u_stencil[::-1] )
-
+  
+  @classmethod
+  def reconstruct_right_stacked( cls, U ):
+    """ Reconstruct u_{i-1/2} from stacked stencil values.
+    """
+    return cls.reconstruct_left_stacked( U[::-1] )
+  
   #-----------------------------------------------------------------------------
   @classmethod
   def reconstruct_left( cls, *u_stencil ):
     """ Reconstruct u_{i+1/2}.
     """
-    # lazy, but readable indexing into list that's being passed in:
-    uim3, uim2, uim1, ui, uip1, uip2, uip3 = u_stencil
-    
+    return cls.reconstruct_left_stacked( u_stencil )
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left_stacked( cls, U ):
+    """ Reconstruct u_{i+1/2} from stacked stencil values.
+    """
     # Compute smoothness indicators (identical for left/right values):
+    beta = cls.smoothness_indicators( *U )
+    
+    # Candidate reconstructions on the small stencils (one dot product)
+    u = LinearReconstruction._apply( cls._candidates, U )
+    
+    # Get linear weights and regularization parameter
+    C     = [1./35., 12./35., 18./35., 4./35.]
+    eps   = cls._eps
+    
+    # Compute nonlinear weights and normalize their sum to 1
+    omt  = [ g/(eps+b)**2 for g,b in zip(C,beta) ]
+    omts = sum(omt)
+    om   = [ o / omts for o in omt ]
+    
+    # Return 7th-order conservative reconstruction
+    return om[0]*u[0] + om[1]*u[1] + om[2]*u[2] + om[3]*u[3]
+  
+  #-----------------------------------------------------------------------------
+  @staticmethod
+  def smoothness_indicators( uim3, uim2, uim1, ui, uip1, uip2, uip3 ):
+    """ Smoothness indicators of the four 4-point stencils (Balsara-Shu).
+    """
     beta = [None]*4
     beta[0] = \
      uim3*(  547.*uim3 -  3882.*uim2  + 4642.*uim1 - 1854.*ui) + \
      uim2*( 7043.*uim2 - 17246.*uim1  + 7042.*ui) +              \
      uim1*(11003.*uim1 -  9402.*ui  ) + 2107.*ui**2
-
+    
     beta[1] = \
      uim2*(  267.*uim2 - 1642.*uim1   + 1602.*ui - 494.*uip1) + \
      uim1*( 2843.*uim1 - 5966.*ui     + 1922.*uip1) +        \
      ui*(   3443.*ui   - 2522.*uip1 ) +  547.*uip1**2
-
+    
     beta[2] = \
      uim1*( 547.*uim1 - 2522.*ui     + 1922.*uip1 - 494.*uip2) + \
      ui  *(3443.*ui   - 5966.*uip1   + 1602.*uip2 )     + \
      uip1*(2843.*uip1 - 1642.*uip2 ) + 267.*uip2**2
-
+    
     beta[3] = \
       ui*  ( 2107.*ui   -  9402.*uip1   + 7042.*uip2 - 1854.*uip3 ) + \
       uip1*(11003.*uip1 - 17246.*uip2   + 4642.*uip3 )              + \
       uip2*( 7043.*uip2 -  3882.*uip3 ) + 547.*uip3**2 
-
-    # 3rd-order reconstructions using small 3-point stencils
-    u1 = (-1./4. )*uim3 + (13./12.)*uim2 - (23./12.)*uim1 + (25./12.)*ui
-    u2 = ( 1./12.)*uim2 - ( 5./12.)*uim1 + (13./12.)*ui   + ( 1./4. )*uip1
-    u3 = (-1./12.)*uim1 + ( 7./12.)*ui   + ( 7./12.)*uip1 - ( 1./12.)*uip2
-    u4 = ( 1./4. )*ui   + (13./12.)*uip1 - ( 5./12.)*uip2 + ( 1./12.)*uip3
-    
-    # Get linear weights and regularization parameter
-    C     = [1./35., 12./35., 18./35., 4./35.]
-    eps   = cls._eps
-    
-    # Compute nonlinear weights and normalize their sum to 1
-    omt  = [ g/(eps+b)**2 for g,b in zip(C,beta) ]
-    omts = sum(omt)
-    om   = [ o / omts for o in omt ]
-    
-    # Return 7th-order conservative reconstruction
-    return om[0]*u1 + om[1]*u2 + om[2]*u3 + om[3]*u4
- 
+    return beta
+  
   #-----------------------------------------------------------------------------
   @classmethod
   def get_eps( cls ):
@@ -0,0 +1,227 @@
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+"""
+Optional compiled backend for the WENO reconstructions, based on Numba.
+
+The NumPy classes evaluate each formula on whole arrays, hence every operator
+creates a temporary array.  Here each reconstruction is a single loop over the
+points, which computes candidate polynomials, smoothness indicators and
+non-linear weights of one point in local (scalar) variables, and writes only
+the result.  One kernel per stencil width handles the linear (CFD), Jiang-Shu
+and WENO-Z weights.  The formulas and the order of the operations are the same
+as in the NumPy classes, so the results agree to round-off.
+
+If Numba cannot be imported, the kernels are plain Python loops (very slow,
+only useful for testing) and 'available' is False; the selector Weno() then
+returns the NumPy classes.
+
+"""
+
+__all__ = ['available', 'Weno5_JS', 'Weno7_JS', 'Weno5_Z', 'Weno7_Z',
+           'CentralFiniteDifference5', 'CentralFiniteDifference7']
+__docformat__ = 'reStructuredText'
+
+import numpy as np
+
+from . import weno_js, weno_z, cfd
+
+try:
+  import numba
+  available = True
+  jit = numba.njit( cache=True )
+except ImportError:
+  available = False
+  jit = lambda func: func
+
+# Kinds of non-linear weights
+LINEAR, JS, Z = 0, 1, 2
+
+#===============================================================================
+# KERNELS: single-pass reconstruction of u[i+1/2] from the left
+#===============================================================================
+
+@jit
+def _reconstruct5 (uim2, uim1, ui, uip1, uip2, out, kind, eps, p):
+  
+  for n in range( out.shape[0] ):
+    a = uim2[n];  b = uim1[n];  c = ui[n];  d = uip1[n];  e = uip2[n]
+    
+    # 3rd-order reconstructions using small 3-point stencils
+    u1 = ( 1./3.)*a - (7./6.)*b + (11./6.)*c
+    u2 = (-1./6.)*b + (5./6.)*c + ( 1./3.)*d
+    u3 = ( 1./3.)*c + (5./6.)*d - ( 1./6.)*e
+    
+    if kind == LINEAR:
+      out[n] = 0.1*u1 + 0.6*u2 + 0.3*u3
+      continue
+    
+    # Jiang-Shu smoothness indicators
+    b0 = (13./12.)*(a-2*b+c)**2 + 0.25*(a-4*b+3*c)**2
+    b1 = (13./12.)*(b-2*c+d)**2 + 0.25*(b-d)**2
+    b2 = (13./12.)*(c-2*d+e)**2 + 0.25*(3*c-4*d+e)**2
+    
+    # Non-linear weights
+    if kind == JS:
+      w0 = 0.1/(eps+b0)**2
+      w1 = 0.6/(eps+b1)**2
+      w2 = 0.3/(eps+b2)**2
+    else:
+      tau = abs( b0 - b2 )
+      w0 = 0.1*(1. + (tau/(b0+eps))**p)
+      w1 = 0.6*(1. + (tau/(b1+eps))**p)
+      w2 = 0.3*(1. + (tau/(b2+eps))**p)
+    
+    s = w0 + w1 + w2
+    out[n] = (w0/s)*u1 + (w1/s)*u2 + (w2/s)*u3
+
+#-------------------------------------------------------------------------------
+@jit
+def _reconstruct7 (uim3, uim2, uim1, ui, uip1, uip2, uip3, out, kind, eps, p):
+  
+  for n in range( out.shape[0] ):
+    a = uim3[n];  b = uim2[n];  c = uim1[n];  d = ui[n]
+    e = uip1[n];  f = uip2[n];  g = uip3[n]
+    
+    # 4th-order reconstructions using small 4-point stencils
+    u1 = (-1./4. )*a + (13./12.)*b - (23./12.)*c + (25./12.)*d
+    u2 = ( 1./12.)*b - ( 5./12.)*c + (13./12.)*d + ( 1./4. )*e
+    u3 = (-1./12.)*c + ( 7./12.)*d + ( 7./12.)*e - ( 1./12.)*f
+    u4 = ( 1./4. )*d + (13./12.)*e - ( 5./12.)*f + ( 1./12.)*g
+    
+    if kind == LINEAR:
+      out[n] = (1./35.)*u1 + (12./35.)*u2 + (18./35.)*u3 + (4./35.)*u4
+      continue
+    
+    # Balsara-Shu smoothness indicators
+    b0 = a*(  547.*a -  3882.*b + 4642.*c - 1854.*d) + \
+         b*( 7043.*b - 17246.*c + 7042.*d) +           \
+         c*(11003.*c -  9402.*d) + 2107.*d**2
+    b1 = b*(  267.*b -  1642.*c + 1602.*d -  494.*e) + \
+         c*( 2843.*c -  5966.*d + 1922.*e) +           \
+         d*( 3443.*d -  2522.*e) +  547.*e**2
+    b2 = c*(  547.*c -  2522.*d + 1922.*e -  494.*f) + \
+         d*( 3443.*d -  5966.*e + 1602.*f) +           \
+         e*( 2843.*e -  1642.*f) +  267.*f**2
+    b3 = d*( 2107.*d -  9402.*e + 7042.*f - 1854.*g) + \
+         e*(11003.*e - 17246.*f + 4642.*g) +           \
+         f*( 7043.*f -  3882.*g) +  547.*g**2
+    
+    # Non-linear weights
+    if kind == JS:
+      w0 = ( 1./35.)/(eps+b0)**2
+      w1 = (12./35.)/(eps+b1)**2
+      w2 = (18./35.)/(eps+b2)**2
+      w3 = ( 4./35.)/(eps+b3)**2
+    else:
+      tau = abs( b0 + 3.*(b1-b2) - b3 )
+      w0 = ( 1./35.)*(1. + (tau/(b0+eps))**p)
+      w1 = (12./35.)*(1. + (tau/(b1+eps))**p)
+      w2 = (18./35.)*(1. + (tau/(b2+eps))**p)
+      w3 = ( 4./35.)*(1. + (tau/(b3+eps))**p)
+    
+    s = w0 + w1 + w2 + w3
+    out[n] = (w0/s)*u1 + (w1/s)*u2 + (w2/s)*u3 + (w3/s)*u4
+
+#===============================================================================
+# CLASSES: same interface as the NumPy classes
+#===============================================================================
+
+class _CompiledReconstruction (object):
+  """
+  Mixin that replaces the reconstruction methods of a NumPy class with calls
+  to a compiled kernel.  The stencil values can have any shape: they are
+  flattened (copied only if not contiguous), and the result has their shape.
+  The kernels work in double precision: values that cannot be converted to
+  float64 without loss (e.g. the complex Fourier modes of max_stable_CFL) are
+  passed to the NumPy class.
+  
+  """
+  backend = 'numba'
+  
+  @classmethod
+  def _apply (cls, u_stencil):
+    u = [ np.asarray( ui ) for ui in u_stencil ]
+    if not all( np.can_cast( ui.dtype, float ) for ui in u ):
+      return super( _CompiledReconstruction, cls )\
+             .reconstruct_left_stacked( u_stencil )
+    
+    u   = [ np.ascontiguousarray( ui, dtype=float ) for ui in u ]
+    out = np.empty( u[0].shape )
+    args = [ ui.reshape(-1) for ui in u ] + [ out.reshape(-1) ]
+    cls._kernel( *(args + [ cls._kind, getattr( cls, '_eps', 0.0 ),
+                                       getattr( cls, '_p'  , 2   ) ]) )
+    return out
+  
+  #-----------------------------------------------------------------------------
+  @classmethod
+  def reconstruct_left (cls, *u_stencil):
+    """ Reconstruct u_{i+1/2}.
+    """
+    return cls._apply( u_stencil )
+  
+  @classmethod
+  def reconstruct_right (cls, *u_stencil):
+    """ Reconstruct u_{i-1/2}.
+    """
+    return cls._apply( u_stencil[::-1] )
+  
+  @classmethod
+  def reconstruct_left_stacked (cls, U):
+    """ Reconstruct u_{i+1/2} from stacked stencil values.
+    """
+    return cls._apply( U )
+  
+  @classmethod
+  def reconstruct_right_stacked (cls, U):
+    """ Reconstruct u_{i-1/2} from stacked stencil values.
+    """
+    return cls._apply( U[::-1] )
+  
+#-------------------------------------------------------------------------------
+class Weno5_JS (_CompiledReconstruction, weno_js.Weno5_JS):
+  """ Compiled version of weno_js.Weno5_JS. """
+  _kernel = staticmethod( _reconstruct5 )
+  _kind   = JS
+
+class Weno7_JS (_CompiledReconstruction, weno_js.Weno7_JS):
+  """ Compiled version of weno_js.Weno7_JS. """
+  _kernel = staticmethod( _reconstruct7 )
+  _kind   = JS
+
+class Weno5_Z (_CompiledReconstruction, weno_z.Weno5_Z):
+  """ Compiled version of weno_z.Weno5_Z. """
+  _kernel = staticmethod( _reconstruct5 )
+  _kind   = Z
+
+class Weno7_Z (_CompiledReconstruction, weno_z.Weno7_Z):
+  """ Compiled version of weno_z.Weno7_Z. """
+  _kernel = staticmethod( _reconstruct7 )
+  _kind   = Z
+
+class CentralFiniteDifference5 (_CompiledReconstruction,
+                                cfd.CentralFiniteDifference5):
+  """ Compiled version of cfd.CentralFiniteDifference5. """
+  _kernel = staticmethod( _reconstruct5 )
+  _kind   = LINEAR
+
+class CentralFiniteDifference7 (_CompiledReconstruction,
+                                cfd.CentralFiniteDifference7):
+  """ Compiled version of cfd.CentralFiniteDifference7. """
+  _kernel = staticmethod( _reconstruct7 )
+  _kind   = LINEAR
+
+#===============================================================================
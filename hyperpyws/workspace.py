@@ -0,0 +1,94 @@
+#coding: utf8
+
+#==============================================================================#
+# This file is part of HYPERPYWS: Hyperbolic Python WENO Solver
+#
+#   *** This software is made available "as is" without any assurance that it
+#   *** will work for your purposes.  The software may in fact have defects, so
+#   *** use the software at your own risk.
+#
+# License: GPL, see COPYING for details
+#
+# Copyright (C) 2013 
+#
+#    David Seal,  seal@math.msu.edu,  Michigan State University
+#    Yaman Guclu, guclu@math.msu.edu, Michigan State University
+#
+#===============================================================================
+
+
+import numpy as np
+
+#===============================================================================
+
+class Workspace (object):
+  """
+  Collection of named scratch arrays, which are allocated once and then reused
+  by every call to the same algorithm.  The workspace counts all the arrays it
+  allocates, so that one can check that no new scratch arrays are created in
+  steady state (e.g. after the first time-step).  Temporary arrays created by
+  numpy expressions outside of the workspace are not counted.
+  
+  Parameters
+  ----------
+  dtype : numpy.dtype
+    Data type of all arrays in the workspace
+  
+  """
+  def __init__(self, dtype=float):
+    self._dtype   = dtype
+    self._buffers = {}
+    self._count   = 0
+  
+  #-----------------------------------------------------------------------------
+  def get (self, name, shape):
+    """
+    Return the scratch array with the given name, allocating it if this does
+    not exist yet or if its shape has changed.
+    
+    Parameters
+    ----------
+    name : str
+      Unique name of the array
+    shape : tuple of int
+      Required shape of the array
+    
+    Returns
+    -------
+    buf : numpy.ndarray
+      Scratch array (filled with zeros, if newly allocated)
+    
+    """
+    buf = self._buffers.get( name )
+    if buf is None or buf.shape != tuple(shape):
+      buf = np.zeros( shape, dtype=self._dtype )
+      self._buffers[name] = buf
+      self._count += 1
+    return buf
+  
+  #-----------------------------------------------------------------------------
+  def copy (self, arr):
+    """ Return a new copy of the given array, and count the allocation.
+    """
+    self._count += 1
+    return arr.copy()
+  
+  #-----------------------------------------------------------------------------
+  def __getitem__ (self, name):
+    return self._buffers[name]
+  
+  def __contains__ (self, name):
+    return name in self._buffers
+  
+  #-----------------------------------------------------------------------------
+  @property
+  def allocations (self):
+    """ Total number of arrays allocated so far. """
+    return self._count
+  
+  @property
+  def nbytes (self):
+    """ Total memory occupied by the scratch arrays [bytes]. """
+    return sum( buf.nbytes for buf in self._buffers.values() )
+
+#===============================================================================